@@ -1,16 +1,15 @@
 from dataclasses import dataclass
 from enum import StrEnum, auto
-from typing import Any, cast
+from functools import cache, lru_cache
+from typing import Any
 
-from eth_typing import ABIFunction
-from eth_utils.abi import abi_to_signature, function_signature_to_4byte_selector
+from eth_utils.abi import function_signature_to_4byte_selector
 from lark import Lark, UnexpectedInput
 from lark.visitors import Transformer_InPlaceRecursive
 
 from erc7730.model.abi import ABI, Component, Function, InputOutput
 
-_SIGNATURE_PARSER = parser = Lark(
-    grammar=r"""
+_SIGNATURE_GRAMMAR = r"""
             function: identifier "(" params ")"
             
             params: (param ("," param)*)?
@@ -26,9 +25,11 @@ _SIGNATURE_PARSER = parser = Lark(
             type: identifier array?
 
             %ignore " "
-            """,
-    start="function",
-)
+            """
+
+
+SIGNATURE_CACHE_SIZE = 65536
+"""Maximum number of signatures and selectors kept in memory."""
 
 
 class FunctionTransformer(Transformer_InPlaceRecursive):
@@ -71,12 +72,25 @@ class FunctionTransformer(Transformer_InPlaceRecursive):
         return value + array
 
 
+@cache
+def _signature_parser() -> Lark:
+    # LALR parser applies the transformer while parsing, without building an intermediate parse tree
+    return Lark(grammar=_SIGNATURE_GRAMMAR, start="function", parser="lalr", transformer=FunctionTransformer())
+
+
 def compute_signature(abi: Function) -> str:
-    """Compute the signature of a Function."""
-    abi_function = cast(ABIFunction, abi.model_dump())
-    return abi_to_signature(abi_function)
+    """Compute the signature of a Function (equivalent to `eth_utils.abi.abi_to_signature`)."""
+    return f"{abi.name}({','.join(_canonical_type(param) for param in abi.inputs or ())})"
+
+
+def _canonical_type(param: InputOutput | Component) -> str:
+    if param.type.startswith("tuple"):
+        components = ",".join(_canonical_type(component) for component in param.components or ())
+        return f"({components}){param.type[len('tuple') :]}"
+    return param.type
 
 
+@lru_cache(maxsize=SIGNATURE_CACHE_SIZE)
 def reduce_signature(signature: str) -> str:
     """Remove parameter names and spaces from a function signature."""
     return compute_signature(parse_signature(signature))
@@ -85,11 +99,12 @@ def reduce_signature(signature: str) -> str:
 def parse_signature(signature: str) -> Function:
     """Parse a function signature."""
     try:
-        return FunctionTransformer().transform(_SIGNATURE_PARSER.parse(signature))
+        return _signature_parser().parse(signature)  # type: ignore[return-value]
     except UnexpectedInput as e:
         raise ValueError(f"Invalid signature: {signature}") from e
 
 
+@lru_cache(maxsize=SIGNATURE_CACHE_SIZE)
 def signature_to_selector(signature: str) -> str:
     """Compute the keccak of a signature."""
     return "0x" + function_signature_to_4byte_selector(signature).hex()
@@ -53,3 +53,85 @@ def length_value(value: bytes | str | None) -> bytes:
         return (0).to_bytes(1, "big")
     value_encoded = value.encode("ascii", errors="strict") if isinstance(value, str) else value
     return len(value_encoded).to_bytes(1, "big") + value_encoded
+
+
+class TLVWriter:
+    """
+    Writer of TLV encoded structs (Tag-Length-Value) to a single growable buffer.
+
+    Nested structs are written in place: the length byte of a struct opened with `struct` is reserved, then patched
+    when the struct is closed, so no intermediate buffer is allocated for nested values.
+
+    Strings are encoded as ASCII. If input string is not ASCII, and UnicodeEncodeError is raised.
+
+    If an encoded value is longer than 255 bytes, an OverflowError is raised.
+    """
+
+    __slots__ = ("_structs", "buffer")
+
+    def __init__(self, buffer: bytearray | None = None) -> None:
+        self.buffer = bytearray() if buffer is None else buffer
+        self._structs: list[int] = []
+
+    def tlv(self, tag: int | IntEnum, *value: bytes | str | None) -> None:
+        """
+        Write a value in TLV format.
+
+        @param tag: the tag (can be an enum)
+        @param value: the value (can be already encoded, or a string)
+        """
+        with self.struct(tag):
+            for v in value:
+                if v is not None:
+                    self.buffer += v.encode("ascii", errors="strict") if isinstance(v, str) else v
+
+    def integer(self, tag: int | IntEnum, value: int, length: int, signed: bool = False) -> None:
+        """
+        Write an integer in TLV format, encoded as big endian.
+
+        @param tag: the tag (can be an enum)
+        @param value: the integer value
+        @param length: length of the encoded value, in bytes
+        @param signed: whether the value is encoded as a signed integer
+        """
+        buffer = self.buffer
+        buffer.append(tag)
+        buffer.append(length)
+        buffer += value.to_bytes(length, signed=signed)
+
+    def hex(self, tag: int | IntEnum, value: str) -> None:
+        """
+        Write an hex string in TLV format, decoded to bytes.
+
+        @param tag: the tag (can be an enum)
+        @param value: hex string (can be prefixed with 0x or not)
+        """
+        self.tlv(tag, from_hex(value))
+
+    def struct(self, tag: int | IntEnum) -> "TLVWriter":
+        """
+        Open a nested struct, to be used as a context manager: values written in the context are the struct value.
+
+        @param tag: the tag (can be an enum)
+        @return: this writer
+        """
+        self.buffer.append(tag)
+        self.buffer.append(0)
+        self._structs.append(len(self.buffer))
+        return self
+
+    def __enter__(self) -> "TLVWriter":
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *_: object) -> None:
+        start = self._structs.pop()
+        if exc_type is None:
+            if (length := len(self.buffer) - start) > 255:
+                raise OverflowError(f"TLV value of {length} bytes is too big to convert")
+            self.buffer[start - 1] = length
+
+    def getvalue(self) -> bytes:
+        """
+        @return: the encoded bytes
+        """
+        return bytes(self.buffer)
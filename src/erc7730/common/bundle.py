@@ -0,0 +1,113 @@
+"""
+Offline bundle of remote resources (ABIs, EIP-712 schemas, enums, reference ABIs, …), used to lint and resolve
+descriptors without network access.
+
+A bundle is a directory containing:
+ - `index.json`: mapping of fetched URLs to the SHA-256 digest of their response body (or null if fetching the URL
+   failed, so that failures are reproduced offline)
+ - `objects/<digest[:2]>/<digest>`: content-addressed response bodies
+"""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+
+from pydantic import Field
+from xdg_base_dirs import xdg_cache_home
+
+from erc7730.model.base import Model
+
+DEFAULT_BUNDLE_PATH = xdg_cache_home() / "erc7730" / "bundle"
+"""Default location of the offline bundle."""
+
+BUNDLE_INDEX = "index.json"
+BUNDLE_OBJECTS = "objects"
+
+
+class BundleIndex(Model):
+    """Index of an offline bundle."""
+
+    urls: dict[str, str | None] = Field(
+        default_factory=dict,
+        title="Fetched URLs",
+        description="Mapping of fetched URLs to the SHA-256 digest of their response body, or null if fetching failed.",
+    )
+
+
+class Bundle:
+    """
+    Offline bundle of remote resources, stored in a directory.
+
+    The index is loaded on first use. Objects are written immediately, the index is only written by `save`.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._urls: dict[str, str | None] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def urls(self) -> dict[str, str | None]:
+        """
+        :return: mapping of fetched URLs to the digest of their response body, or None if fetching failed
+        """
+        with self._lock:
+            return dict(self._load())
+
+    def lookup(self, url: str) -> tuple[bool, Path | None]:
+        """
+        Look up a URL in the bundle.
+
+        :param url: fetched URL
+        :return: whether the URL is in the bundle, and the path of the response body (None if fetching failed)
+        """
+        with self._lock:
+            urls = self._load()
+            if url not in urls:
+                return False, None
+            if (digest := urls[url]) is None:
+                return True, None
+            return True, self._object_path(digest)
+
+    def add(self, url: str, content: bytes | None) -> None:
+        """
+        Add a fetched URL to the bundle.
+
+        :param url: fetched URL
+        :param content: response body, or None if fetching failed
+        """
+        digest = None
+        if content is not None:
+            digest = hashlib.sha256(content).hexdigest()
+            if not (path := self._object_path(digest)).exists():
+                _write_atomically(path, content)
+        with self._lock:
+            self._load()[url] = digest
+
+    def save(self) -> None:
+        """
+        Write the bundle index.
+        """
+        with self._lock:
+            index = BundleIndex(urls=dict(sorted(self._load().items())))
+        _write_atomically(self.path / BUNDLE_INDEX, index.model_dump_json(indent=2).encode())
+
+    def _load(self) -> dict[str, str | None]:
+        if self._urls is None:
+            if (index_path := self.path / BUNDLE_INDEX).exists():
+                self._urls = dict(BundleIndex.model_validate_json(index_path.read_bytes()).urls)
+            else:
+                self._urls = {}
+        return self._urls
+
+    def _object_path(self, digest: str) -> Path:
+        return self.path / BUNDLE_OBJECTS / digest[:2] / digest
+
+
+def _write_atomically(path: Path, content: bytes) -> None:
+    os.makedirs(path.parent, exist_ok=True)
+    with NamedTemporaryFile("wb", dir=path.parent, suffix=".tmp", delete=False) as f:
+        f.write(content)
+    os.replace(f.name, path)
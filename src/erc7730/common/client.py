@@ -1,27 +1,132 @@
-import json
+import asyncio
+import atexit
+import hashlib
 import os
+import threading
 from abc import ABC
-from functools import cache
+from asyncio import AbstractEventLoop
+from collections.abc import Generator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from importlib.util import find_spec
+from pathlib import Path
 from typing import Any, TypeVar, final, override
+from weakref import WeakKeyDictionary
 
-from hishel import CacheTransport, FileStorage
-from httpx import URL, BaseTransport, Client, HTTPTransport, Request, Response
-from httpx._content import IteratorByteStream
+from hishel import AsyncCacheTransport, AsyncFileStorage, CacheTransport, FileStorage
+from httpx import (
+    URL,
+    AsyncBaseTransport,
+    AsyncClient,
+    AsyncHTTPTransport,
+    BaseTransport,
+    Client,
+    HTTPTransport,
+    Limits,
+    Request,
+    Response,
+)
+from httpx._content import ByteStream
 from httpx_file import FileTransport
 from limiter import Limiter
-from pydantic import ConfigDict, TypeAdapter, ValidationError
+from pydantic import ConfigDict, Field, TypeAdapter, ValidationError
 from pydantic_string_url import FileUrl, HttpUrl
 from xdg_base_dirs import xdg_cache_home
 
+from erc7730.common.bundle import Bundle
+from erc7730.common.json import json_dumps, json_loads
 from erc7730.model.abi import ABI
 from erc7730.model.base import Model
 from erc7730.model.types import Address
 
 ETHERSCAN = "api.etherscan.io"
 SOURCIFY = "sourcify.dev"
+SOURCIFY_PROXY_FIELDS = "abi,metadata,userdoc,devdoc,proxyResolution,compilation,sources"
+SOURCIFY_IMPLEMENTATION_FIELDS = "abi,metadata,userdoc,devdoc,compilation,sources"
+OFFLINE_BUNDLE_ENV = "ERC7730_OFFLINE_BUNDLE"
 
 _T = TypeVar("_T")
 
+_FETCHES: ContextVar[dict[str, str | None] | None] = ContextVar("_FETCHES", default=None)
+_BODIES: dict[str, bytes] | None = None
+
+
+class ClientSettings(Model):
+    """Settings of the shared HTTP client."""
+
+    http2: bool = Field(
+        default=False,
+        title="HTTP/2",
+        description="Enable HTTP/2 (requires the h2 package, see `pip install httpx[http2]`).",
+    )
+
+    max_connections: int = Field(
+        default=32,
+        title="Max connections",
+        description="Maximum number of concurrent connections.",
+        gt=0,
+    )
+
+    max_keepalive_connections: int = Field(
+        default=16,
+        title="Max keep-alive connections",
+        description="Maximum number of idle connections kept alive in the pool.",
+        ge=0,
+    )
+
+    keepalive_expiry: float = Field(
+        default=30.0,
+        title="Keep-alive expiry",
+        description="Time in seconds after which idle connections are closed.",
+        ge=0,
+    )
+
+    timeout: float = Field(
+        default=10.0,
+        title="Timeout",
+        description="Timeout in seconds for connecting, reading and writing.",
+        gt=0,
+    )
+
+    offline_bundle: Path | None = Field(
+        default=None,
+        title="Offline bundle",
+        description="If set, all HTTP requests are served from this offline bundle (see `erc7730 prefetch`), and the "
+        "network is never used.",
+    )
+
+    @classmethod
+    def from_env(cls) -> "ClientSettings":
+        """
+        Get default settings, with the offline bundle set from the ERC7730_OFFLINE_BUNDLE environment variable.
+
+        The environment variable allows offline mode to be inherited by worker processes.
+
+        :return: client settings
+        """
+        if (offline_bundle := os.environ.get(OFFLINE_BUNDLE_ENV)) is None:
+            return cls()
+        return cls(offline_bundle=Path(offline_bundle))
+
+
+@dataclass(frozen=True)
+class _MemoEntry:
+    value: Any
+    error: Exception | None
+    fetches: dict[str, str | None]
+
+
+_settings = ClientSettings.from_env()
+_shared_client: Client | None = None
+_shared_client_pid: int | None = None
+_shared_client_lock = threading.Lock()
+_shared_async_clients: WeakKeyDictionary[AbstractEventLoop, AsyncClient] = WeakKeyDictionary()
+_memo: dict[tuple[str, Any], Future[_MemoEntry]] = {}
+_memo_lock = threading.Lock()
+_type_adapters: dict[Any, TypeAdapter[Any]] = {}
+
 
 class EtherscanChain(Model):
     """Etherscan supported chain info."""
@@ -185,14 +290,26 @@ def extract_function_and_constants(source_code: str, function_name: str) -> tupl
     return function_code, constants_code
 
 
-@cache
 def get_supported_chains() -> list[EtherscanChain]:
     """
     Get supported chains from Etherscan.
 
+    The result is memoized for the lifetime of the process (see `get_memoized`).
+
     :return: Etherscan supported chains, with name/chain id/block explorer URL
     """
-    return get(url=HttpUrl(f"https://{ETHERSCAN}/v2/chainlist"), model=list[EtherscanChain])
+    return get_memoized(url=HttpUrl(f"https://{ETHERSCAN}/v2/chainlist"), model=list[EtherscanChain])
+
+
+async def aget_supported_chains() -> list[EtherscanChain]:
+    """
+    Get supported chains from Etherscan (asynchronous version of `get_supported_chains`).
+
+    The result is memoized for the lifetime of the process, and shared with `get_supported_chains`.
+
+    :return: Etherscan supported chains, with name/chain id/block explorer URL
+    """
+    return await aget_memoized(url=HttpUrl(f"https://{ETHERSCAN}/v2/chainlist"), model=list[EtherscanChain])
 
 
 def get_contract_abis(chain_id: int, contract_address: Address) -> list[ABI]:
@@ -206,50 +323,61 @@ def get_contract_abis(chain_id: int, contract_address: Address) -> list[ABI]:
     """
     try:
         contract_data = get(
-            url=HttpUrl(f"https://{SOURCIFY}/server/v2/contract/{chain_id}/{contract_address}"),
-            fields="abi,metadata,userdoc,devdoc,proxyResolution,compilation,sources",
+            url=_sourcify_contract_url(chain_id, contract_address),
+            fields=SOURCIFY_PROXY_FIELDS,
             model=SourcifyContractData,
         )
-        
-        proxy_abi = contract_data.abi or []
-        
-        # If this is a proxy and we have implementation info, merge ABIs
-        if (contract_data.proxyResolution and 
-            contract_data.proxyResolution.isProxy and 
-            contract_data.proxyResolution.implementations):
-            
-            # Try to get ABI from the first implementation
-            impl_address = contract_data.proxyResolution.implementations[0].address
+
+        if (impl_address := _get_implementation_address(contract_data)) is not None:
             try:
                 impl_contract_data = get(
-                    url=HttpUrl(f"https://{SOURCIFY}/server/v2/contract/{chain_id}/{impl_address}"),
-                    fields="abi,metadata,userdoc,devdoc,compilation,sources",
+                    url=_sourcify_contract_url(chain_id, impl_address),
+                    fields=SOURCIFY_IMPLEMENTATION_FIELDS,
                     model=SourcifyContractData,
                 )
-                if impl_contract_data.abi is not None:
-                    # Merge proxy ABI and implementation ABI
-                    # Implementation ABI first, then proxy-specific functions
-                    merged_abi = list(impl_contract_data.abi)
-                    
-                    # Add proxy-specific functions that aren't in implementation
-                    impl_function_names = {abi.name for abi in impl_contract_data.abi if hasattr(abi, 'name') and abi.name}
-                    for proxy_function in proxy_abi:
-                        if (hasattr(proxy_function, 'name') and 
-                            proxy_function.name and 
-                            proxy_function.name not in impl_function_names):
-                            merged_abi.append(proxy_function)
-                    
-                    print(f"Merged proxy and implementation ABIs: {len(proxy_abi)} proxy + {len(impl_contract_data.abi)} implementation = {len(merged_abi)} total functions")
+                if (merged_abi := _merge_abis(contract_data, impl_contract_data)) is not None:
                     return merged_abi
             except Exception as impl_e:
                 print(f"Warning: Could not fetch implementation ABI from {impl_address}: {impl_e}")
-        
-        # Fallback to proxy ABI if available
-        if not proxy_abi:
-            raise Exception("ABI not available for this contract on Sourcify")
-        return proxy_abi
+
+        return _get_abi(contract_data)
     except Exception as e:
-        if "404" in str(e) or "not found" in str(e).lower():
+        if _is_not_found(e):
+            raise Exception(f"contract not found on Sourcify for chain {chain_id}") from e
+        raise e
+
+
+async def aget_contract_abis(chain_id: int, contract_address: Address) -> list[ABI]:
+    """
+    Get contract ABIs from Sourcify (asynchronous version of `get_contract_abis`).
+
+    :param chain_id: EIP-155 chain ID
+    :param contract_address: EVM contract address
+    :return: deserialized list of ABIs (merged if proxy)
+    :raises Exception: if contract not found or not verified on Sourcify
+    """
+    try:
+        contract_data = await aget(
+            url=_sourcify_contract_url(chain_id, contract_address),
+            fields=SOURCIFY_PROXY_FIELDS,
+            model=SourcifyContractData,
+        )
+
+        if (impl_address := _get_implementation_address(contract_data)) is not None:
+            try:
+                impl_contract_data = await aget(
+                    url=_sourcify_contract_url(chain_id, impl_address),
+                    fields=SOURCIFY_IMPLEMENTATION_FIELDS,
+                    model=SourcifyContractData,
+                )
+                if (merged_abi := _merge_abis(contract_data, impl_contract_data)) is not None:
+                    return merged_abi
+            except Exception as impl_e:
+                print(f"Warning: Could not fetch implementation ABI from {impl_address}: {impl_e}")
+
+        return _get_abi(contract_data)
+    except Exception as e:
+        if _is_not_found(e):
             raise Exception(f"contract not found on Sourcify for chain {chain_id}") from e
         raise e
 
@@ -265,47 +393,128 @@ def get_contract_data(chain_id: int, contract_address: Address) -> SourcifyContr
     """
     try:
         contract_data = get(
-            url=HttpUrl(f"https://{SOURCIFY}/server/v2/contract/{chain_id}/{contract_address}"),
-            fields="abi,metadata,userdoc,devdoc,proxyResolution,compilation,sources",
+            url=_sourcify_contract_url(chain_id, contract_address),
+            fields=SOURCIFY_PROXY_FIELDS,
             model=SourcifyContractData,
         )
-        
-        # If this is a proxy and we have implementation info, merge implementation data
-        if (contract_data.proxyResolution and 
-            contract_data.proxyResolution.isProxy and 
-            contract_data.proxyResolution.implementations):
-            
-            # Try to get data from the first implementation
-            impl_address = contract_data.proxyResolution.implementations[0].address
+
+        if (impl_address := _get_implementation_address(contract_data)) is not None:
             try:
                 impl_contract_data = get(
-                    url=HttpUrl(f"https://{SOURCIFY}/server/v2/contract/{chain_id}/{impl_address}"),
-                    fields="abi,metadata,userdoc,devdoc,compilation,sources",
+                    url=_sourcify_contract_url(chain_id, impl_address),
+                    fields=SOURCIFY_IMPLEMENTATION_FIELDS,
                     model=SourcifyContractData,
                 )
-                
-                # Merge implementation data with proxy data, preferring implementation data
-                merged_data = {
-                    "abi": impl_contract_data.abi or contract_data.abi,
-                    "metadata": impl_contract_data.metadata or contract_data.metadata,
-                    "userdoc": impl_contract_data.userdoc or contract_data.userdoc,
-                    "devdoc": impl_contract_data.devdoc or contract_data.devdoc,
-                    "proxyResolution": contract_data.proxyResolution,
-                }
-                
                 print(f"Merged implementation data from {impl_address} for proxy at {contract_address}")
-                return SourcifyContractData(**merged_data)
-                
+                return _merge_contract_data(contract_data, impl_contract_data)
             except Exception as impl_e:
                 print(f"Warning: Could not fetch implementation data from {impl_address}: {impl_e}")
-        
+
         return contract_data
     except Exception as e:
-        if "404" in str(e) or "not found" in str(e).lower():
+        if _is_not_found(e):
             raise Exception(f"contract not found on Sourcify for chain {chain_id}") from e
         raise e
 
 
+async def aget_contract_data(chain_id: int, contract_address: Address) -> SourcifyContractData:
+    """
+    Get full contract data from Sourcify (asynchronous version of `get_contract_data`).
+
+    :param chain_id: EIP-155 chain ID
+    :param contract_address: EVM contract address
+    :return: SourcifyContractData containing all available contract information
+    :raises Exception: if contract not found or not verified on Sourcify
+    """
+    try:
+        contract_data = await aget(
+            url=_sourcify_contract_url(chain_id, contract_address),
+            fields=SOURCIFY_PROXY_FIELDS,
+            model=SourcifyContractData,
+        )
+
+        if (impl_address := _get_implementation_address(contract_data)) is not None:
+            try:
+                impl_contract_data = await aget(
+                    url=_sourcify_contract_url(chain_id, impl_address),
+                    fields=SOURCIFY_IMPLEMENTATION_FIELDS,
+                    model=SourcifyContractData,
+                )
+                print(f"Merged implementation data from {impl_address} for proxy at {contract_address}")
+                return _merge_contract_data(contract_data, impl_contract_data)
+            except Exception as impl_e:
+                print(f"Warning: Could not fetch implementation data from {impl_address}: {impl_e}")
+
+        return contract_data
+    except Exception as e:
+        if _is_not_found(e):
+            raise Exception(f"contract not found on Sourcify for chain {chain_id}") from e
+        raise e
+
+
+def _sourcify_contract_url(chain_id: int, contract_address: Address) -> HttpUrl:
+    return HttpUrl(f"https://{SOURCIFY}/server/v2/contract/{chain_id}/{contract_address}")
+
+
+def _get_implementation_address(contract_data: SourcifyContractData) -> Address | None:
+    """Get the address of the first implementation of a proxy contract, or None if contract is not a proxy."""
+    if (
+        contract_data.proxyResolution is None
+        or not contract_data.proxyResolution.isProxy
+        or not contract_data.proxyResolution.implementations
+    ):
+        return None
+    return contract_data.proxyResolution.implementations[0].address
+
+
+def _get_abi(contract_data: SourcifyContractData) -> list[ABI]:
+    if not contract_data.abi:
+        raise Exception("ABI not available for this contract on Sourcify")
+    return contract_data.abi
+
+
+def _merge_abis(contract_data: SourcifyContractData, impl_contract_data: SourcifyContractData) -> list[ABI] | None:
+    """
+    Merge proxy and implementation ABIs: implementation ABI first, then proxy-specific functions.
+
+    :return: merged ABIs, or None if implementation ABI is not available
+    """
+    if impl_contract_data.abi is None:
+        return None
+
+    proxy_abi = contract_data.abi or []
+    merged_abi = list(impl_contract_data.abi)
+
+    # Add proxy-specific functions that aren't in implementation
+    impl_function_names = {abi.name for abi in impl_contract_data.abi if hasattr(abi, "name") and abi.name}
+    for proxy_function in proxy_abi:
+        if hasattr(proxy_function, "name") and proxy_function.name and proxy_function.name not in impl_function_names:
+            merged_abi.append(proxy_function)
+
+    print(
+        f"Merged proxy and implementation ABIs: {len(proxy_abi)} proxy + {len(impl_contract_data.abi)} "
+        f"implementation = {len(merged_abi)} total functions"
+    )
+    return merged_abi
+
+
+def _merge_contract_data(
+    contract_data: SourcifyContractData, impl_contract_data: SourcifyContractData
+) -> SourcifyContractData:
+    """Merge implementation data with proxy data, preferring implementation data."""
+    return SourcifyContractData(
+        abi=impl_contract_data.abi or contract_data.abi,
+        metadata=impl_contract_data.metadata or contract_data.metadata,
+        userdoc=impl_contract_data.userdoc or contract_data.userdoc,
+        devdoc=impl_contract_data.devdoc or contract_data.devdoc,
+        proxyResolution=contract_data.proxyResolution,
+    )
+
+
+def _is_not_found(e: Exception) -> bool:
+    return "404" in str(e) or "not found" in str(e).lower()
+
+
 def get_contract_explorer_url(chain_id: int, contract_address: Address) -> HttpUrl:
     """
     Get contract explorer site URL (for opening in a browser).
@@ -336,28 +545,376 @@ def get(model: type[_T], url: HttpUrl | FileUrl, **params: Any) -> _T:
     :return: deserialized response
     :raises Exception: if URL type is not supported, API key not setup, or unexpected response
     """
-    with _client() as client:
-        response = client.get(url, params=params).raise_for_status().content
+    return _deserialize(model, url, get_bytes(url, **params))
+
+
+async def aget(model: type[_T], url: HttpUrl | FileUrl, **params: Any) -> _T:
+    """
+    Fetch data from a file or an HTTP URL and deserialize it (asynchronous version of `get`).
+
+    :param url: URL to get data from
+    :param model: Pydantic model to deserialize the data
+    :return: deserialized response
+    :raises Exception: if URL type is not supported, API key not setup, or unexpected response
+    """
+    return _deserialize(model, url, await aget_bytes(url, **params))
+
+
+def get_bytes(url: HttpUrl | FileUrl | str, **params: Any) -> bytes:
+    """
+    Fetch raw data from a file or an HTTP URL.
+
+    If fetches are being recorded (see `record_fetches`), the digest of the response body is recorded.
+
+    :param url: URL to get data from
+    :return: raw response body
+    :raises Exception: if URL type is not supported, API key not setup, or unexpected response
+    """
     try:
-        return TypeAdapter(model).validate_json(response)
+        response = _client().get(url, params=params).raise_for_status().content
+    except Exception:
+        _record_fetch(url, params, None)
+        raise
+    _record_fetch(url, params, response)
+    return response
+
+
+async def aget_bytes(url: HttpUrl | FileUrl | str, **params: Any) -> bytes:
+    """
+    Fetch raw data from a file or an HTTP URL (asynchronous version of `get_bytes`).
+
+    :param url: URL to get data from
+    :return: raw response body
+    :raises Exception: if URL type is not supported, API key not setup, or unexpected response
+    """
+    try:
+        response = (await _async_client().get(url, params=params)).raise_for_status().content
+    except Exception:
+        _record_fetch(url, params, None)
+        raise
+    _record_fetch(url, params, response)
+    return response
+
+
+def get_memoized(model: type[_T], url: HttpUrl | FileUrl) -> _T:
+    """
+    Fetch data from a file or an HTTP URL and deserialize it, memoizing the deserialized object for the lifetime of the
+    process (see `get`).
+
+    Concurrent calls for the same URL and model wait for a single in-flight fetch instead of starting their own.
+    Failures are not memoized, but are reported to all concurrent callers. URL fetches are replayed in the context of
+    every caller (see `record_fetches`).
+
+    Returned objects are shared between callers, and must not be modified.
+
+    :param url: URL to get data from
+    :param model: Pydantic model to deserialize the data
+    :return: deserialized response
+    :raises Exception: if URL type is not supported, API key not setup, or unexpected response
+    """
+    key = (str(url), model)
+    future, owner = _memo_future(key)
+
+    if owner:
+        with record_fetches() as fetches:
+            try:
+                future.set_result(_MemoEntry(value=get(model, url), error=None, fetches=fetches))
+            except Exception as e:
+                with _memo_lock:
+                    del _memo[key]
+                future.set_result(_MemoEntry(value=None, error=e, fetches=fetches))
+            except BaseException as e:
+                # interruption: waiters must not block forever, and next callers must fetch again
+                with _memo_lock:
+                    del _memo[key]
+                future.set_exception(e)
+                raise
+
+    return _memo_result(future.result())
+
+
+async def aget_memoized(model: type[_T], url: HttpUrl | FileUrl) -> _T:
+    """
+    Fetch data from a file or an HTTP URL and deserialize it, memoizing the deserialized object for the lifetime of the
+    process (asynchronous version of `get_memoized`).
+
+    Memoized objects are shared with `get_memoized`.
+
+    :param url: URL to get data from
+    :param model: Pydantic model to deserialize the data
+    :return: deserialized response
+    :raises Exception: if URL type is not supported, API key not setup, or unexpected response
+    """
+    key = (str(url), model)
+    future, owner = _memo_future(key)
+
+    if owner:
+        with record_fetches() as fetches:
+            try:
+                future.set_result(_MemoEntry(value=await aget(model, url), error=None, fetches=fetches))
+            except Exception as e:
+                with _memo_lock:
+                    del _memo[key]
+                future.set_result(_MemoEntry(value=None, error=e, fetches=fetches))
+            except BaseException as e:
+                # cancellation: waiters must not block forever, and next callers must fetch again
+                with _memo_lock:
+                    del _memo[key]
+                future.set_exception(e)
+                raise
+
+    return _memo_result(await asyncio.wrap_future(future))
+
+
+def _memo_future(key: tuple[str, Any]) -> tuple[Future[_MemoEntry], bool]:
+    # returns the future of the memoized entry, and whether caller owns it (ie must fetch and complete it)
+    with _memo_lock:
+        if (future := _memo.get(key)) is not None:
+            return future, False
+        future = _memo[key] = Future()
+        return future, True
+
+
+def _memo_result(entry: _MemoEntry) -> Any:
+    replay_fetches(entry.fetches)
+    if entry.error is not None:
+        raise entry.error
+    return entry.value
+
+
+def clear_memoized() -> None:
+    """
+    Clear objects memoized by `get_memoized`.
+    """
+    with _memo_lock:
+        _memo.clear()
+
+
+def _type_adapter(model: type[_T]) -> TypeAdapter[_T]:
+    # building type adapters is expensive, they are shared by all requests (benign race on first use)
+    if (adapter := _type_adapters.get(model)) is None:
+        adapter = _type_adapters[model] = TypeAdapter(model)
+    return adapter
+
+
+def _deserialize(model: type[_T], url: HttpUrl | FileUrl, response: bytes) -> _T:
+    try:
+        return _type_adapter(model).validate_json(response)
     except ValidationError as e:
         raise Exception(f"Received unexpected response from {url}: {response.decode(errors='replace')}") from e
 
 
+def _record_fetch(url: HttpUrl | FileUrl | str, params: dict[str, Any], response: bytes | None) -> None:
+    if (fetches := _FETCHES.get()) is None and _BODIES is None:
+        return
+    digest = None if response is None else hashlib.sha256(response).hexdigest()
+    if fetches is not None:
+        fetches[str(URL(str(url), params=params))] = digest
+    if (bodies := _BODIES) is not None and digest is not None and response is not None:
+        bodies[digest] = response
+
+
+def get_digest(url: str) -> str | None:
+    """
+    Fetch raw data from a file or an HTTP URL, and compute the digest of the response body.
+
+    :param url: URL to get data from
+    :return: SHA-256 hex digest of the response body, or None if the URL could not be fetched
+    """
+    try:
+        return hashlib.sha256(get_bytes(url)).hexdigest()
+    except Exception:
+        return None
+
+
+@contextmanager
+def record_fetches() -> Generator[dict[str, str | None], None, None]:
+    """
+    Record all URLs fetched in current context, with the SHA-256 digest of their response bodies.
+
+    Failed fetches are recorded with a None digest.
+
+    :return: context manager yielding the mapping of fetched URLs to body digests, filled as URLs are fetched
+    """
+    fetches: dict[str, str | None] = {}
+    token = _FETCHES.set(fetches)
+    try:
+        yield fetches
+    finally:
+        _FETCHES.reset(token)
+
+
+@contextmanager
+def capture_bodies() -> Generator[dict[str, bytes], None, None]:
+    """
+    Capture the response bodies of all URLs fetched in the process, by SHA-256 digest.
+
+    Bodies are captured in all threads and contexts, so that the body of any fetch recorded with `record_fetches` can be
+    retrieved from its digest. Objects memoized before capture started (see `get_memoized`) are not fetched again, so
+    their bodies are not captured.
+
+    :return: context manager yielding the mapping of body digests to bodies, filled as URLs are fetched
+    """
+    global _BODIES
+    if _BODIES is not None:
+        raise Exception("Response bodies are already being captured")
+    bodies: dict[str, bytes] = {}
+    _BODIES = bodies
+    try:
+        yield bodies
+    finally:
+        _BODIES = None
+
+
+def replay_fetches(fetches: dict[str, str | None]) -> None:
+    """
+    Record fetches done in another context (another thread, or a memoized computation) in current context, if fetches
+    are being recorded (see `record_fetches`).
+
+    :param fetches: mapping of fetched URLs to body digests
+    """
+    if (current_fetches := _FETCHES.get()) is not None:
+        current_fetches.update(fetches)
+
+
+def configure(settings: ClientSettings) -> None:
+    """
+    Configure the shared HTTP client.
+
+    The current client is closed, a new one is created with the new settings on next request. Asynchronous clients are
+    dropped, they should be closed first with `aclose` in their event loop.
+
+    :param settings: client settings
+    :raises Exception: if HTTP/2 is requested but not available
+    """
+    global _settings
+    if settings.http2 and find_spec("h2") is None:
+        raise Exception("HTTP/2 support requires the h2 package, install it with `pip install httpx[http2]`")
+    with _shared_client_lock:
+        _settings = settings
+        _close_shared_client()
+        _shared_async_clients.clear()
+
+
+def close() -> None:
+    """
+    Close the shared HTTP client, releasing pooled connections.
+
+    It is safe to call this function at any time, a new client is created on next request. It is automatically called on
+    interpreter exit.
+    """
+    with _shared_client_lock:
+        _close_shared_client()
+
+
+async def aclose() -> None:
+    """
+    Close the shared asynchronous HTTP client of the running event loop, releasing pooled connections.
+
+    It is safe to call this function at any time, a new client is created on next request. It should be called before
+    closing the event loop.
+    """
+    with _shared_client_lock:
+        async_client = _shared_async_clients.pop(asyncio.get_running_loop(), None)
+    if async_client is not None:
+        await async_client.aclose()
+
+
 def _client() -> Client:
+    """
+    Get the shared HTTP client, creating it on first use.
+
+    The client is thread-safe and keeps connections alive between requests. A new client is created in forked processes,
+    as connections cannot be shared with the parent process.
+
+    :return: shared HTTP client
+    """
+    global _shared_client, _shared_client_pid
+    with _shared_client_lock:
+        if _shared_client is None or _shared_client_pid != os.getpid():
+            _shared_client = _new_client(_settings)
+            _shared_client_pid = os.getpid()
+        return _shared_client
+
+
+def _async_client() -> AsyncClient:
+    """
+    Get the shared asynchronous HTTP client of the running event loop, creating it on first use.
+
+    Asynchronous clients are bound to an event loop, so there is one shared client per event loop.
+
+    :return: shared asynchronous HTTP client
+    """
+    loop = asyncio.get_running_loop()
+    with _shared_client_lock:
+        if (async_client := _shared_async_clients.get(loop)) is None:
+            async_client = _shared_async_clients[loop] = _new_async_client(_settings)
+        return async_client
+
+
+def _close_shared_client() -> None:
+    global _shared_client, _shared_client_pid
+    if _shared_client is not None and _shared_client_pid == os.getpid():
+        _shared_client.close()
+    _shared_client, _shared_client_pid = None, None
+
+
+def _new_client(settings: ClientSettings) -> Client:
     """
     Create a new HTTP client with GitHub and Etherscan specific transports.
-    :return:
+
+    :param settings: client settings
+    :return: new HTTP client
     """
+    if settings.offline_bundle is not None:
+        bundle_transport = BundleTransport(Bundle(settings.offline_bundle))
+        return Client(mounts={"https://": bundle_transport, "file://": FileTransport()}, timeout=settings.timeout)
+
     cache_storage = FileStorage(base_path=xdg_cache_home() / "erc7730", ttl=7 * 24 * 3600, check_ttl_every=24 * 3600)
-    http_transport = HTTPTransport()
+    limits = Limits(
+        max_connections=settings.max_connections,
+        max_keepalive_connections=settings.max_keepalive_connections,
+        keepalive_expiry=settings.keepalive_expiry,
+    )
+    http_transport: BaseTransport = HTTPTransport(http2=settings.http2, limits=limits)
     http_transport = GithubTransport(http_transport)
     http_transport = EtherscanTransport(http_transport)
     http_transport = CacheTransport(transport=http_transport, storage=cache_storage)
     file_transport = FileTransport()
     # TODO file storage: authorize relative paths only
     transports = {"https://": http_transport, "file://": file_transport}
-    return Client(mounts=transports, timeout=10)
+    return Client(mounts=transports, timeout=settings.timeout)
+
+
+def _new_async_client(settings: ClientSettings) -> AsyncClient:
+    """
+    Create a new asynchronous HTTP client with GitHub and Etherscan specific transports.
+
+    :param settings: client settings
+    :return: new asynchronous HTTP client
+    """
+    if settings.offline_bundle is not None:
+        bundle_transport = BundleTransport(Bundle(settings.offline_bundle))
+        return AsyncClient(mounts={"https://": bundle_transport, "file://": FileTransport()}, timeout=settings.timeout)
+
+    cache_storage = AsyncFileStorage(
+        base_path=xdg_cache_home() / "erc7730", ttl=7 * 24 * 3600, check_ttl_every=24 * 3600
+    )
+    limits = Limits(
+        max_connections=settings.max_connections,
+        max_keepalive_connections=settings.max_keepalive_connections,
+        keepalive_expiry=settings.keepalive_expiry,
+    )
+    http_transport: AsyncBaseTransport = AsyncHTTPTransport(http2=settings.http2, limits=limits)
+    http_transport = AsyncGithubTransport(http_transport)
+    http_transport = AsyncEtherscanTransport(http_transport)
+    http_transport = AsyncCacheTransport(transport=http_transport, storage=cache_storage)
+    file_transport = FileTransport()
+    transports = {"https://": http_transport, "file://": file_transport}
+    return AsyncClient(mounts=transports, timeout=settings.timeout)
+
+
+atexit.register(close)
 
 
 class DelegateTransport(ABC, BaseTransport):
@@ -373,61 +930,160 @@ class DelegateTransport(ABC, BaseTransport):
         self._delegate.close()
 
 
+class AsyncDelegateTransport(ABC, AsyncBaseTransport):
+    """Base class for wrapping httpx asynchronous transport."""
+
+    def __init__(self, delegate: AsyncBaseTransport) -> None:
+        self._delegate = delegate
+
+    async def handle_async_request(self, request: Request) -> Response:
+        return await self._delegate.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._delegate.aclose()
+
+
+GITHUB, GITHUB_RAW = "github.com", "raw.githubusercontent.com"
+
+
+def _adapt_github_request(request: Request) -> None:
+    """Adapt GitHub URLs to raw content URLs."""
+    if request.url.host != GITHUB:
+        return
+    request.url = URL(str(request.url).replace(GITHUB, GITHUB_RAW).replace("/blob/", "/"))
+    request.headers.update({"Host": GITHUB_RAW})
+
+
 @final
 class GithubTransport(DelegateTransport):
     """GitHub specific transport for handling raw content requests."""
 
-    GITHUB, GITHUB_RAW = "github.com", "raw.githubusercontent.com"
+    GITHUB, GITHUB_RAW = GITHUB, GITHUB_RAW
 
     def __init__(self, delegate: BaseTransport) -> None:
         super().__init__(delegate)
 
     @override
     def handle_request(self, request: Request) -> Response:
-        if request.url.host != self.GITHUB:
-            return super().handle_request(request)
-
-        # adapt URL
-        request.url = URL(str(request.url).replace(self.GITHUB, self.GITHUB_RAW).replace("/blob/", "/"))
-        request.headers.update({"Host": self.GITHUB_RAW})
+        _adapt_github_request(request)
         return super().handle_request(request)
 
 
+@final
+class AsyncGithubTransport(AsyncDelegateTransport):
+    """GitHub specific asynchronous transport for handling raw content requests."""
+
+    @override
+    async def handle_async_request(self, request: Request) -> Response:
+        _adapt_github_request(request)
+        return await super().handle_async_request(request)
+
+
+ETHERSCAN_API_HOST = "ETHERSCAN_API_HOST"
+ETHERSCAN_API_KEY = "ETHERSCAN_API_KEY"
+
+_ETHERSCAN_LIMITER = Limiter(rate=5, capacity=5, consume=1)
+"""Etherscan rate limiter, shared by synchronous and asynchronous transports."""
+
+
+def _adapt_etherscan_request(request: Request) -> None:
+    """Substitute Etherscan base URL and add API key, if provided."""
+
+    # substitute base URL if provided
+    if (api_host := os.environ.get(ETHERSCAN_API_HOST)) is not None:
+        request.url = request.url.copy_with(host=api_host)
+        request.headers.update({"Host": api_host})
+
+    # add API key if provided
+    if (api_key := os.environ.get(ETHERSCAN_API_KEY)) is not None or (
+        api_key := os.environ.get(f"SCAN_{ETHERSCAN_API_KEY}")
+    ) is not None:
+        request.url = request.url.copy_add_param("apikey", api_key)
+
+
+def _unwrap_etherscan_response(response: Response) -> Response:
+    """Unwrap Etherscan "result" field, sometimes containing JSON directly, sometimes JSON in a string."""
+    try:
+        if (result := json_loads(response.content).get("result")) is not None:
+            data = result.encode() if isinstance(result, str) else json_dumps(result)
+            return Response(status_code=response.status_code, stream=ByteStream(data))
+    except Exception:
+        pass  # nosec B110 - intentional try/except/pass
+
+    raise Exception(f"Unexpected response from Etherscan: {response.content.decode(errors='replace')}")
+
+
 @final
 class EtherscanTransport(DelegateTransport):
     """Etherscan specific transport for handling rate limiting, API key parameter injection, response unwrapping."""
 
-    ETHERSCAN_API_HOST = "ETHERSCAN_API_HOST"
-    ETHERSCAN_API_KEY = "ETHERSCAN_API_KEY"
+    ETHERSCAN_API_HOST = ETHERSCAN_API_HOST
+    ETHERSCAN_API_KEY = ETHERSCAN_API_KEY
 
-    @Limiter(rate=5, capacity=5, consume=1)
+    @_ETHERSCAN_LIMITER
     @override
     def handle_request(self, request: Request) -> Response:
         if request.url.host != ETHERSCAN:
             return super().handle_request(request)
 
-        # substitute base URL if provided
-        if (api_host := os.environ.get(self.ETHERSCAN_API_HOST)) is not None:
-            request.url = request.url.copy_with(host=api_host)
-            request.headers.update({"Host": api_host})
-
-        # add API key if provided
-        if (api_key := os.environ.get(self.ETHERSCAN_API_KEY)) is not None or (
-            api_key := os.environ.get(f"SCAN_{self.ETHERSCAN_API_KEY}")
-        ) is not None:
-            request.url = request.url.copy_add_param("apikey", api_key)
+        _adapt_etherscan_request(request)
 
         # read response
         response = super().handle_request(request)
         response.read()
         response.close()
 
-        # unwrap result, sometimes containing JSON directly, sometimes JSON in a string
-        try:
-            if (result := response.json().get("result")) is not None:
-                data = result if isinstance(result, str) else json.dumps(result)
-                return Response(status_code=response.status_code, stream=IteratorByteStream([data.encode()]))
-        except Exception:
-            pass  # nosec B110 - intentional try/except/pass
+        return _unwrap_etherscan_response(response)
+
+
+@final
+class AsyncEtherscanTransport(AsyncDelegateTransport):
+    """Etherscan specific asynchronous transport for handling rate limiting, API key parameter injection, response
+    unwrapping."""
+
+    @_ETHERSCAN_LIMITER
+    @override
+    async def handle_async_request(self, request: Request) -> Response:
+        if request.url.host != ETHERSCAN:
+            return await super().handle_async_request(request)
+
+        _adapt_etherscan_request(request)
+
+        # read response
+        response = await super().handle_async_request(request)
+        await response.aread()
+        await response.aclose()
+
+        return _unwrap_etherscan_response(response)
+
+
+@final
+class BundleTransport(BaseTransport, AsyncBaseTransport):
+    """Transport serving all requests from an offline bundle, using the file transport."""
+
+    def __init__(self, bundle: Bundle) -> None:
+        self._bundle = bundle
+        self._file_transport = FileTransport()
+
+    @override
+    def handle_request(self, request: Request) -> Response:
+        if (file_request := self._file_request(request)) is None:
+            return Response(status_code=404, request=request)
+        return self._file_transport.handle_request(file_request)
+
+    @override
+    async def handle_async_request(self, request: Request) -> Response:
+        if (file_request := self._file_request(request)) is None:
+            return Response(status_code=404, request=request)
+        return await self._file_transport.handle_async_request(file_request)
 
-        raise Exception(f"Unexpected response from Etherscan: {response.content.decode(errors='replace')}")
+    def _file_request(self, request: Request) -> Request | None:
+        found, path = self._bundle.lookup(str(request.url))
+        if not found:
+            raise Exception(
+                f"{request.url} is not available in offline bundle {self._bundle.path}, it must be fetched first "
+                "with `erc7730 prefetch`"
+            )
+        if path is None:
+            return None  # fetching URL failed when bundle was built, reproduce failure
+        return Request(method="GET", url=path.as_uri())
@@ -1,9 +1,159 @@
 import json
 import os
-from collections.abc import Iterator
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from enum import StrEnum
+from importlib.util import find_spec
 from json import JSONEncoder
+from json.encoder import encode_basestring, encode_basestring_ascii
 from pathlib import Path
-from typing import Any, override
+from typing import Any, assert_never, override
+
+JSON_BACKEND_ENV = "ERC7730_JSON_BACKEND"
+"""Environment variable to force the JSON backend (see `JSONBackend`), by default the fastest installed one is used."""
+
+
+class JSONBackend(StrEnum):
+    """
+    Library used to parse and serialize JSON documents.
+
+    The standard library is always available, msgspec or else orjson are used if installed. All backends parse documents
+    to the same values: documents that a backend cannot parse exactly (such as integers that do not fit in 64 bits for
+    orjson, or NaN values) are handled by the standard library.
+    """
+
+    STDLIB = "json"
+    ORJSON = "orjson"
+    MSGSPEC = "msgspec"
+
+
+# translation of documents to search integer values of 19 digits or more in C: digits are mapped to "d", bytes that can
+# precede an integer value to "p" (a match may also be inside a string, in which case the standard library is used)
+_BIG_INTEGER_TABLE = bytes(
+    ord("d") if chr(c) in "0123456789" else ord("p") if chr(c) in ":,[ \t\r\n-" else ord("x") for c in range(256)
+)
+_BIG_INTEGER = b"p" + b"d" * 19
+_backend: tuple[JSONBackend, Callable[[bytes | str], Any], Callable[[Any], bytes]] | None = None
+
+
+def json_loads(data: bytes | str) -> Any:
+    """
+    Deserialize a JSON document, using the current JSON backend.
+
+    :param data: JSON document, as UTF-8 bytes or string
+    :return: deserialized value
+    :raises json.JSONDecodeError: if the document is not valid JSON
+    """
+    return (_backend or _set_default_json_backend())[1](data)
+
+
+def json_dumps(value: Any) -> bytes:
+    """
+    Serialize a value to a compact JSON document (without whitespace), using the current JSON backend.
+
+    :param value: value to serialize
+    :return: JSON document, as UTF-8 bytes
+    """
+    return (_backend or _set_default_json_backend())[2](value)
+
+
+def get_json_backend() -> JSONBackend:
+    """
+    :return: the current JSON backend
+    """
+    return (_backend or _set_default_json_backend())[0]
+
+
+def set_json_backend(backend: JSONBackend | None = None) -> JSONBackend:
+    """
+    Set the JSON backend used by the library.
+
+    :param backend: JSON backend, or None to use the one set in ERC7730_JSON_BACKEND environment variable or else the
+        fastest installed one
+    :return: the selected JSON backend
+    :raises ValueError: if the backend is not installed
+    """
+    global _backend
+
+    if backend is None:
+        if (name := os.environ.get(JSON_BACKEND_ENV)) is not None:
+            backend = JSONBackend(name)
+        else:
+            backend = next(b for b in (JSONBackend.MSGSPEC, JSONBackend.ORJSON, JSONBackend.STDLIB) if _installed(b))
+
+    if not _installed(backend):
+        raise ValueError(f"JSON backend {backend} is not installed, install it with `pip install {backend}`")
+
+    match backend:
+        case JSONBackend.STDLIB:
+            _backend = (backend, json.loads, _stdlib_dumps)
+        case JSONBackend.ORJSON:
+            _backend = (backend, _orjson_loads, _orjson_dumps)
+        case JSONBackend.MSGSPEC:
+            _backend = (backend, _msgspec_loads, _msgspec_dumps)
+        case _:
+            assert_never(backend)
+    return backend
+
+
+def _set_default_json_backend() -> tuple[JSONBackend, Callable[[bytes | str], Any], Callable[[Any], bytes]]:
+    set_json_backend()
+    assert _backend is not None  # nosec B101 - type narrowing
+    return _backend
+
+
+def _installed(backend: JSONBackend) -> bool:
+    return find_spec(backend.value) is not None
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _has_big_integer(data: bytes) -> bool:
+    return _BIG_INTEGER in b"p" + data.translate(_BIG_INTEGER_TABLE)
+
+
+def _orjson_loads(data: bytes | str) -> Any:
+    import orjson
+
+    if isinstance(data, str):
+        data = data.encode()
+    # orjson silently decodes integers that do not fit in 64 bits as floats
+    if _has_big_integer(data):
+        return json.loads(data)
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(data)
+
+
+def _orjson_dumps(value: Any) -> bytes:
+    import orjson
+
+    try:
+        return orjson.dumps(value)
+    except TypeError:
+        return _stdlib_dumps(value)
+
+
+def _msgspec_loads(data: bytes | str) -> Any:
+    import msgspec
+
+    try:
+        return msgspec.json.decode(data)
+    except msgspec.DecodeError:
+        return json.loads(data)
+
+
+def _msgspec_dumps(value: Any) -> bytes:
+    import msgspec
+
+    try:
+        return msgspec.json.encode(value)
+    except (TypeError, msgspec.EncodeError):
+        return _stdlib_dumps(value)
 
 
 def read_jsons_with_includes(paths: list[Path]) -> Any:
@@ -14,14 +164,13 @@ def read_jsons_with_includes(paths: list[Path]) -> Any:
     Keys from the later files in the list override those of the first files.
 
     Note:
-      - circular includes are not detected and will result in a stack overflow.
+      - circular includes are detected and raise a ValueError.
       - "includes" key can only be used at root level of an object.
     """
     result: dict[str, Any] = {}
     for path in paths:
-        # noinspection PyTypeChecker
-        result = _merge_dicts(result, read_json_with_includes(path))
-    return result
+        result = _merge_dicts(result, load_json_with_includes(path).value)
+    return _copy_json(result)
 
 
 def read_json_with_includes(path: Path) -> Any:
@@ -33,18 +182,92 @@ def read_json_with_includes(path: Path) -> Any:
     If include is a list, files are included in other they are defined, with later files overriding previous files.
 
     Note:
-      - circular includes are not detected and will result in a stack overflow.
+      - circular includes are detected and raise a ValueError.
       - "includes" key can only be used at root level of an object.
     """
+    return _copy_json(load_json_with_includes(path).value)
+
+
+@dataclass(frozen=True, slots=True)
+class JSONWithIncludes:
+    """Content of a JSON file, with all included files inlined."""
+
+    value: Any
+    """Content of the file, with included files inlined (shared between callers, must not be modified)."""
+
+    dependencies: frozenset[Path]
+    """Absolute paths of the file and of all the files it recursively includes."""
+
+    stamps: tuple[tuple[Path, int, int], ...]
+    """Path, modification time and size of each dependency, when the file was read."""
+
+
+_INCLUDES_CACHE: dict[Path, JSONWithIncludes] = {}
+
+_RACY_NS = 2_000_000_000
+"""Files modified less than this delay before being read are not cached, as later changes might keep the same mtime."""
+
+
+def load_json_with_includes(path: Path) -> JSONWithIncludes:
+    """
+    Read a JSON file, recursively inlining any included files, with the same rules as `read_json_with_includes`.
+
+    Results are cached per process, for each file and each included file: a cached result is reused as long as the
+    modification time and size of the file and of all its includes are unchanged, so files included by many descriptors
+    are only read and parsed once. Files modified in the last 2 seconds are not cached, as timestamps granularity could
+    hide a subsequent change. The returned value is shared between callers and must not be modified.
+
+    Circular includes raise a ValueError, reporting the chain of includes.
+
+    :param path: JSON file path
+    :return: file content with included files inlined, and the set of files it depends on
+    """
+    return _load_json_with_includes(Path(os.path.abspath(path)), ())
+
+
+def _load_json_with_includes(path: Path, chain: tuple[Path, ...]) -> JSONWithIncludes:
+    if path in chain:
+        raise ValueError(f"Circular include: {' -> '.join(str(p) for p in (*chain, path))}")
+
+    if (cached := _INCLUDES_CACHE.get(path)) is not None and all(
+        _stamp(file) == (mtime, size) for file, mtime, size in cached.stamps
+    ):
+        return cached
+
+    now = time.time_ns()
+    mtime, size = _stamp(path)
     result: dict[str, Any] = dict_from_json_file(path)
+    dependencies = {path}
+    stamps = {(path, mtime, size)}
     if isinstance(result, dict) and (includes := result.pop("includes", None)) is not None:
-        if isinstance(includes, list):
-            parent = read_jsons_with_includes(paths=[path.parent / p for p in includes])
-        else:
-            # noinspection PyTypeChecker
-            parent = read_json_with_includes(path.parent / includes)
+        parent: dict[str, Any] = {}
+        for include in includes if isinstance(includes, list) else [includes]:
+            included = _load_json_with_includes(Path(os.path.normpath(path.parent / include)), (*chain, path))
+            parent = _merge_dicts(parent, included.value)
+            dependencies |= included.dependencies
+            stamps.update(included.stamps)
         result = _merge_dicts(parent, result)
-    return result
+
+    loaded = JSONWithIncludes(value=result, dependencies=frozenset(dependencies), stamps=tuple(stamps))
+    if all(0 <= file_mtime < now - _RACY_NS for _, file_mtime, _ in stamps):
+        _INCLUDES_CACHE[path] = loaded
+    return loaded
+
+
+def _stamp(path: Path) -> tuple[int, int]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return -1, -1
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _copy_json(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
 
 
 def _merge_dicts(d1: dict[str, Any], d2: dict[str, Any]) -> dict[str, Any]:
@@ -69,13 +292,13 @@ def _merge_dicts(d1: dict[str, Any], d2: dict[str, Any]) -> dict[str, Any]:
 
 def dict_from_json_str(value: str) -> dict[str, Any]:
     """Deserialize a dict from a JSON string."""
-    return json.loads(value)
+    return json_loads(value)
 
 
 def dict_from_json_file(path: Path) -> dict[str, Any]:
     """Deserialize a dict from a JSON file."""
     with open(path, "rb") as f:
-        return json.load(f)
+        return json_loads(f.read())
 
 
 def dict_to_json_str(values: dict[str, Any]) -> str:
@@ -92,7 +315,12 @@ def dict_to_json_file(path: Path, values: dict[str, Any]) -> None:
 
 
 class CompactJSONEncoder(JSONEncoder):
-    """A JSON Encoder that puts small containers on single lines."""
+    """
+    A JSON Encoder that puts small containers on single lines.
+
+    Containers are put on a single line if their Python representation (`str`) fits in `MAX_WIDTH`. Widths are computed
+    from the cached widths of nested containers, so encoding is linear in the size of the input.
+    """
 
     CONTAINER_TYPES = (list, tuple, dict)
     """Container datatypes include primitives or other containers."""
@@ -111,15 +339,33 @@ class CompactJSONEncoder(JSONEncoder):
             kwargs["indent"] = 2
         super().__init__(*args, **kwargs)
         self.indentation_level = 0
+        self._widths: dict[int, int] = {}
+        self._encode_str = encode_basestring_ascii if self.ensure_ascii else encode_basestring
 
     @override
     def encode(self, o: Any) -> str:
+        try:
+            return self._encode(o)
+        finally:
+            self._widths.clear()
+
+    def _encode(self, o: Any) -> str:
         if isinstance(o, list | tuple):
             return self._encode_list(o)
         if isinstance(o, dict):
             return self._encode_object(o)
         if isinstance(o, float):  # Use scientific notation for floats
             return format(o, "g")
+        if o is None:
+            return "null"
+        if o is True:
+            return "true"
+        if o is False:
+            return "false"
+        if type(o) is str:
+            return self._encode_str(o)
+        if type(o) is int:
+            return int.__repr__(o)
         return json.dumps(
             obj=o,
             skipkeys=self.skipkeys,
@@ -134,9 +380,10 @@ class CompactJSONEncoder(JSONEncoder):
 
     def _encode_list(self, o: list[Any] | tuple[Any]) -> str:
         if self._put_on_single_line(o):
-            return "[" + ", ".join(self.encode(el) for el in o) + "]"
+            return "[" + ", ".join(self._encode(el) for el in o) + "]"
         self.indentation_level += 1
-        output = [self.indent_str + self.encode(el) for el in o]
+        indent_str = self.indent_str
+        output = [indent_str + self._encode(el) for el in o]
         self.indentation_level -= 1
         return "[\n" + ",\n".join(output) + "\n" + self.indent_str + "]"
 
@@ -150,10 +397,11 @@ class CompactJSONEncoder(JSONEncoder):
             o = dict(sorted(o.items(), key=lambda x: x[0]))
 
         if self._put_on_single_line(o):
-            return "{ " + ", ".join(f"{json.dumps(k)}: {self.encode(el)}" for k, el in o.items()) + " }"
+            return "{ " + ", ".join(f"{encode_basestring_ascii(k)}: {self._encode(el)}" for k, el in o.items()) + " }"
 
         self.indentation_level += 1
-        output = [f"{self.indent_str}{json.dumps(k)}: {self.encode(v)}" for k, v in o.items()]
+        indent_str = self.indent_str
+        output = [f"{indent_str}{encode_basestring_ascii(k)}: {self._encode(v)}" for k, v in o.items()]
         self.indentation_level -= 1
 
         return "{\n" + ",\n".join(output) + "\n" + self.indent_str + "}"
@@ -163,7 +411,7 @@ class CompactJSONEncoder(JSONEncoder):
         return self.encode(o)  # type: ignore
 
     def _put_on_single_line(self, o: Any) -> bool:
-        return self._primitives_only(o) and len(o) <= self.MAX_ITEMS and len(str(o)) - 2 <= self.MAX_WIDTH
+        return self._primitives_only(o) and len(o) <= self.MAX_ITEMS and self._measure(o) - 2 <= self.MAX_WIDTH
 
     def _primitives_only(self, o: list[Any] | tuple[Any] | dict[Any, Any]) -> bool:
         if not self.PRIMITIVES_ONLY:
@@ -173,6 +421,38 @@ class CompactJSONEncoder(JSONEncoder):
         elif isinstance(o, dict):
             return not any(isinstance(el, self.CONTAINER_TYPES) for el in o.values())
 
+    def _width(self, o: Any) -> int:
+        """Length of `str(o)` (capped as in `_measure`), cached for containers of the encoded object."""
+        if type(o) in (list, tuple, dict):
+            if (width := self._widths.get(id(o))) is None:
+                width = self._widths[id(o)] = self._measure(o)
+            return width
+        return len(repr(o))
+
+    def _measure(self, o: Any) -> int:
+        """
+        Length of `str(o)`, computed from the cached widths of its items.
+
+        Measuring stops as soon as the container is too wide to be put on a single line, in which case the returned
+        width is `MAX_WIDTH + 3`: containers including it are then too wide as well.
+        """
+        container_type = type(o)
+        if not o or container_type not in (list, tuple, dict):
+            return len(str(o))
+        too_wide = self.MAX_WIDTH + 3
+        width = 0
+        if container_type is dict:
+            for k, v in o.items():
+                width += len(repr(k)) + self._width(v) + 4
+                if width >= too_wide:
+                    return too_wide
+            return width
+        for item in o:
+            width += self._width(item) + 2
+            if width >= too_wide:
+                return too_wide
+        return width + 1 if container_type is tuple and len(o) == 1 else width
+
     @property
     def indent_str(self) -> str:
         if isinstance(self.indent, int):
@@ -5,7 +5,7 @@ from contextlib import AbstractContextManager
 from enum import IntEnum, auto
 from itertools import groupby
 from types import TracebackType
-from typing import assert_never, final, override
+from typing import IO, assert_never, final, override
 
 from pydantic import BaseModel, ConfigDict, FilePath, ValidationError
 from pydantic_core import ErrorDetails
@@ -116,7 +116,11 @@ class SetOutputAdder(OutputAdder):
 
 
 class ConsoleOutputAdder(OutputAdder):
-    """An output adder that prints to the console."""
+    """An output adder that prints to the console (or to given text stream, for instance stderr)."""
+
+    def __init__(self, file: IO[str] | None = None) -> None:
+        super().__init__()
+        self._file = file
 
     @override
     def add(self, output: Output) -> None:
@@ -152,7 +156,7 @@ class ConsoleOutputAdder(OutputAdder):
             log += "\n"
         log += output.message
 
-        print(log)
+        print(log, file=self._file)
 
 
 class RaisingOutputAdder(ConsoleOutputAdder):
@@ -0,0 +1,148 @@
+"""
+Process pool execution engine for commands operating on many descriptor files (lint, format, …).
+
+Most of the per-file work (loading, validation, resolution, linting, formatting) is pure Python and CPU bound, so
+threads do not scale because of the GIL. This module fans files out to worker processes in chunks, collects
+diagnostics from workers in a compact picklable form, and replays them in the parent process in the original file
+order, so that console output is deterministic.
+"""
+
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future
+from concurrent.futures.process import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from multiprocessing import get_context
+from pathlib import Path
+from typing import TypeVar
+
+from erc7730.common.output import (
+    AddFileOutputAdder,
+    BufferAdder,
+    ExceptionsToOutput,
+    ListOutputAdder,
+    Output,
+    OutputAdder,
+)
+
+CompactOutput = tuple[int, int | None, str | None, str]
+"""Compact form of an output sent back by workers: (level, line, title, message)."""
+
+FileWorker = Callable[[Path, OutputAdder], None]
+"""Function processing a single file, reporting diagnostics to the given output adder (must be picklable)."""
+
+CHUNKS_PER_WORKER = 4
+"""Target number of chunks sent to each worker, to balance load while limiting inter-process communication."""
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def resolve_jobs(jobs: int) -> int:
+    """
+    Resolve the number of worker processes to use.
+
+    :param jobs: requested number of jobs, 0 or less means one per CPU core
+    :return: actual number of worker processes
+    """
+    if jobs > 0:
+        return jobs
+    return os.cpu_count() or 1
+
+
+def output_to_compact(output: Output) -> CompactOutput:
+    """
+    Convert an output to its compact form (file is dropped, it is added back by the parent process).
+
+    :param output: output to convert
+    :return: compact output
+    """
+    return output.level.value, output.line, output.title, output.message
+
+
+def output_from_compact(output: CompactOutput) -> Output:
+    """
+    Convert a compact output back to an output.
+
+    :param output: compact output
+    :return: output
+    """
+    level, line, title, message = output
+    return Output(file=None, line=line, title=title, message=message, level=Output.Level(level))
+
+
+def map_files(worker: FileWorker, files: list[Path], jobs: int) -> Iterator[list[CompactOutput]]:
+    """
+    Apply a worker function to all files using a process pool.
+
+    Files are sent to workers in chunks, results are yielded in the same order as input files.
+
+    :param worker: function processing a single file
+    :param files: files to process
+    :param jobs: number of worker processes (0 or less means one per CPU core)
+    :return: iterator over compact outputs of each file, in input order
+    """
+    if not files:
+        return
+    workers = min(resolve_jobs(jobs), len(files))
+    chunksize = max(1, len(files) // (workers * CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as executor:
+        yield from executor.map(partial(_run_worker, worker), files, chunksize=chunksize)
+
+
+def imap_ordered(func: Callable[[_T], _R], items: Iterable[_T], jobs: int) -> Iterator[_R]:
+    """
+    Apply a function to all items using a process pool, streaming results.
+
+    Unlike `map_files`, items are consumed lazily and only a bounded number of items are in flight at any time, so
+    memory usage does not grow with the number of items, even if results are consumed slowly. Results are yielded in
+    the same order as input items, as soon as they are available.
+
+    :param func: function to apply (must be picklable)
+    :param items: items to process (must be picklable)
+    :param jobs: number of worker processes (0 or less means one per CPU core)
+    :return: iterator over results, in input order
+    """
+    workers = resolve_jobs(jobs)
+    items_iterator = iter(items)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn")) as executor:
+        pending: deque[Future[_R]] = deque(
+            executor.submit(func, item) for item in islice(items_iterator, workers * CHUNKS_PER_WORKER)
+        )
+        while pending:
+            result = pending.popleft().result()
+            pending.extend(executor.submit(func, item) for item in islice(items_iterator, 1))
+            yield result
+
+
+def process_files(
+    worker: FileWorker,
+    files: list[Path],
+    out: OutputAdder,
+    prolog: Callable[[Path], str],
+    jobs: int,
+) -> None:
+    """
+    Process all files using a process pool, and replay outputs of each file in order.
+
+    Output of each file is buffered and printed at once, exactly as when processing files in the current process.
+
+    :param worker: function processing a single file
+    :param files: files to process
+    :param out: output adder
+    :param prolog: function returning the header printed before the outputs of a file
+    :param jobs: number of worker processes (0 or less means one per CPU core)
+    """
+    for file, outputs in zip(files, map_files(worker, files, jobs), strict=True):
+        with BufferAdder(AddFileOutputAdder(delegate=out, file=file), prolog=prolog(file), epilog="") as file_out:
+            for output in outputs:
+                file_out.add(output_from_compact(output))
+
+
+def _run_worker(worker: FileWorker, path: Path) -> list[CompactOutput]:
+    out = ListOutputAdder()
+    with ExceptionsToOutput(out):
+        worker(path, out)
+    return [output_to_compact(output) for output in out.outputs]
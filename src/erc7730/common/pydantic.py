@@ -9,7 +9,7 @@ from pydantic import BaseModel, GetCoreSchemaHandler, ValidationInfo, WrapValida
 from pydantic_core import PydanticCustomError, core_schema
 from pydantic_core.core_schema import WrapValidatorFunctionSchema
 
-from erc7730.common.json import dict_to_json_file, dict_to_json_str, read_json_with_includes
+from erc7730.common.json import dict_to_json_file, dict_to_json_str, load_json_with_includes
 
 _BaseModel = TypeVar("_BaseModel", bound=BaseModel)
 
@@ -25,8 +25,16 @@ def model_from_json_str(data: str, model: type[_BaseModel]) -> _BaseModel:
 
 
 def model_from_json_file_with_includes(path: Path, model: type[_BaseModel]) -> _BaseModel:
-    """Load a Pydantic model from a JSON file, including references."""
-    return model.model_validate(read_json_with_includes(path), strict=False)
+    """
+    Load a Pydantic model from a JSON file, including references (included files are cached per process).
+
+    Files without includes are validated directly from their raw content, without building an intermediate dict.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if b'"includes"' not in data:
+        return model.model_validate_json(data, strict=False)
+    return model.model_validate(load_json_with_includes(path).value, strict=False)
 
 
 def model_from_json_file_with_includes_or_none(path: Path, model: type[_BaseModel]) -> _BaseModel | None:
@@ -1,6 +1,6 @@
 from pydantic_string_url import HttpUrl
 
-from erc7730.common.output import ConsoleOutputAdder
+from erc7730.common.output import ConsoleOutputAdder, OutputAdder
 from erc7730.convert.calldata.v1.descriptor import (
     convert_descriptor,
 )
@@ -11,7 +11,10 @@ from erc7730.model.input.lenses import get_chain_ids
 
 
 def erc7730_descriptor_to_calldata_descriptors(
-    input_descriptor: InputERC7730Descriptor, source: HttpUrl | None = None, chain_id: int | None = None
+    input_descriptor: InputERC7730Descriptor,
+    source: HttpUrl | None = None,
+    chain_id: int | None = None,
+    out: OutputAdder | None = None,
 ) -> list[CalldataDescriptor]:
     """
     Generate output calldata descriptors from input ERC-7730 descriptor with contract context.
@@ -22,10 +25,12 @@ def erc7730_descriptor_to_calldata_descriptors(
     :param input_descriptor: input descriptor
     :param source: source of the descriptor file
     :param chain_id: if set, only emit calldata descriptors for given chain IDs
+    :param out: output adder, defaults to printing to the console
     :return: output calldata descriptors (1 per chain + selector)
     """
+    if out is None:
+        out = ConsoleOutputAdder()
 
-    out = ConsoleOutputAdder()
     try:
         if not isinstance(input_descriptor.context, InputContractContext):
             return []
@@ -0,0 +1,160 @@
+"""
+Streaming conversion of many ERC-7730 descriptor files to calldata descriptors, as newline delimited JSON (NDJSON) or
+as binary TLV frames.
+
+Descriptor files are converted one at a time (or in a bounded window of files in flight when using worker processes),
+and calldata descriptors are written as soon as each file is converted, so memory usage does not grow with the number
+of descriptor files.
+"""
+
+import sys
+from collections.abc import Callable, Iterator
+from functools import partial
+from pathlib import Path
+from typing import IO, Any
+
+from pydantic_string_url import HttpUrl
+from rich import print
+
+from erc7730.common.output import (
+    AddFileOutputAdder,
+    ConsoleOutputAdder,
+    DropFileOutputAdder,
+    ExceptionsToOutput,
+    ListOutputAdder,
+    OutputAdder,
+)
+from erc7730.common.parallel import CompactOutput, imap_ordered, output_from_compact, output_to_compact
+from erc7730.convert.calldata.convert_erc7730_input_to_calldata import erc7730_descriptor_to_calldata_descriptors
+from erc7730.convert.calldata.v1.tlv import tlv_descriptor
+from erc7730.list.list import get_erc7730_files
+from erc7730.model.input.descriptor import InputERC7730Descriptor
+
+CalldataFileResult = tuple[Path, list[str] | list[bytes], list[CompactOutput]]
+"""Result of converting a single file: (descriptor file path, NDJSON lines or TLV frames, compact outputs)."""
+
+
+def calldata_all_and_print_errors(
+    paths: list[Path],
+    output: IO[str] | IO[bytes],
+    source: str | None = None,
+    chain_id: int | None = None,
+    jobs: int | None = None,
+    binary: bool = False,
+) -> bool:
+    """
+    Convert all ERC-7730 descriptor files at given paths to calldata descriptors, streamed as NDJSON (or binary TLV
+    frames), and print errors to stderr.
+
+    :param paths: paths to search for descriptor files
+    :param output: stream to write calldata descriptors to, one per line (binary stream if binary is set)
+    :param source: source URL of the descriptor file, or base URL of the directory if a directory is given
+    :param chain_id: if set, only emit calldata descriptors for given chain ID
+    :param jobs: if set, number of worker processes to use (0 for one per CPU core)
+    :param binary: if set, write calldata descriptors as binary TLV frames instead of NDJSON
+    :return: true if no error occurred
+    """
+    out = DropFileOutputAdder(delegate=ConsoleOutputAdder(file=sys.stderr))
+
+    files, count = calldata_all(paths, output.write, out, source, chain_id, jobs, binary)
+
+    summary = f"converted {files} descriptor files to {count} calldata descriptors"
+
+    if out.has_errors:
+        print(f"[bold][red]{summary}, some errors occurred ❌[/red][/bold]", file=sys.stderr)
+        return False
+
+    if out.has_warnings:
+        print(f"[bold][yellow]{summary}, some warnings occurred ⚠️[/yellow][/bold]", file=sys.stderr)
+        return True
+
+    print(f"[bold][green]{summary}, no errors occurred ✅[/green][/bold]", file=sys.stderr)
+    return True
+
+
+def calldata_all(
+    paths: list[Path],
+    write: Callable[[Any], object],
+    out: OutputAdder,
+    source: str | None = None,
+    chain_id: int | None = None,
+    jobs: int | None = None,
+    binary: bool = False,
+) -> tuple[int, int]:
+    """
+    Convert all ERC-7730 descriptor files at given paths to calldata descriptors, streamed as NDJSON (or binary TLV
+    frames).
+
+    Paths can be files or directories, in which case all descriptor files in the directory are recursively converted.
+    Calldata descriptors are written in files order, as soon as each file is converted.
+
+    If jobs is set, files are converted in a pool of worker processes.
+
+    If binary is set, each calldata descriptor is written as the TLV frames of all its structs (see
+    `erc7730.convert.calldata.v1.tlv.tlv_descriptor`), instead of a JSON line with hex encoded structs.
+
+    :param paths: paths to search for descriptor files
+    :param write: function called with each NDJSON line (including the trailing newline), or TLV frames bytes
+    :param out: output adder
+    :param source: source URL of the descriptor file, or base URL of the directory if a directory is given
+    :param chain_id: if set, only emit calldata descriptors for given chain ID
+    :param jobs: if set, number of worker processes to use (0 for one per CPU core)
+    :param binary: if set, write calldata descriptors as binary TLV frames instead of NDJSON
+    :return: number of descriptor files converted, number of calldata descriptors written
+    """
+    items = ((file, _source(file, root, source)) for file, root in _get_files(paths, out))
+    convert = partial(calldata_file, chain_id=chain_id, binary=binary)
+    results: Iterator[CalldataFileResult] = (
+        imap_ordered(convert, items, jobs) if jobs is not None else (convert(item) for item in items)
+    )
+
+    files, count = 0, 0
+    for file, records, outputs in results:
+        file_out = AddFileOutputAdder(delegate=out, file=file)
+        for output in outputs:
+            file_out.add(output_from_compact(output))
+        for record in records:
+            write(record)
+        files += 1
+        count += len(records)
+    return files, count
+
+
+def calldata_file(
+    item: tuple[Path, str | None], chain_id: int | None = None, binary: bool = False
+) -> CalldataFileResult:
+    """
+    Convert a single ERC-7730 descriptor file to calldata descriptors.
+
+    :param item: ERC-7730 descriptor file path, and source URL of the descriptor file
+    :param chain_id: if set, only emit calldata descriptors for given chain ID
+    :param binary: if set, encode calldata descriptors as binary TLV frames instead of NDJSON lines
+    :return: descriptor file path, calldata descriptors as NDJSON lines or TLV frames, and compact outputs
+    """
+    path, source = item
+    out = ListOutputAdder()
+    lines: list[str] = []
+    frames: list[bytes] = []
+    with ExceptionsToOutput(out):
+        input_descriptor = InputERC7730Descriptor.load(path)
+        for descriptor in erc7730_descriptor_to_calldata_descriptors(
+            input_descriptor, source=HttpUrl(source) if source is not None else None, chain_id=chain_id, out=out
+        ):
+            if binary:
+                frames.append(tlv_descriptor(descriptor))
+            else:
+                lines.append(descriptor.model_dump_json(exclude_none=True) + "\n")
+    return path, frames if binary else lines, [output_to_compact(output) for output in out.outputs]
+
+
+def _get_files(paths: list[Path], out: OutputAdder) -> Iterator[tuple[Path, Path | None]]:
+    for path in paths:
+        root = path if path.is_dir() else None
+        for file in get_erc7730_files(path, out=out):
+            yield file, root
+
+
+def _source(file: Path, root: Path | None, source: str | None) -> str | None:
+    if source is None or root is None:
+        return source
+    return f"{source.rstrip('/')}/{file.relative_to(root).as_posix()}"
@@ -5,129 +5,159 @@ An ABI tree is a tree representation of the ABI of a function inputs, enriched w
 paths to access values in the serialized calldata.
 """
 
+import json
 from abc import ABC, abstractmethod
-from typing import Annotated, Literal, assert_never, override
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any, ClassVar, override
 
 import eth_abi
 from eth_abi.grammar import BasicType, TupleType
-from pydantic import Field
 
 from erc7730.model.abi import Component, Function, InputOutput
-from erc7730.model.base import Model
 from erc7730.model.calldata.v1.value import (
     CalldataDescriptorTypeFamily,
 )
 
 
-class ABINode(Model, ABC):
-    """Represents a node in the tree defined by a function ABI."""
+class ABINode(ABC):
+    """
+    Represents a node in the tree defined by a function ABI.
 
-    @property
-    @abstractmethod
-    def is_dynamic(self) -> bool:
-        raise NotImplementedError()
+    Nodes are immutable, and their size and dynamic-ness are computed once at construction time, so that they can be
+    shared by all paths converted on the same function ABI.
+    """
+
+    __slots__ = ("is_dynamic", "size")
+
+    type: ClassVar[str]
+    """ABI tree node type."""
+
+    is_dynamic: bool
+    """Whether the node is dynamically sized (and thus referenced by offset in the calldata)."""
+
+    size: int
+    """Size of the node in calldata (in 32 bytes words), 1 for dynamic nodes."""
 
-    @property
     @abstractmethod
-    def size(self) -> int:
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert the node to a JSON serializable dict, for display purposes.
+
+        :return: dict representation of the node
+        """
         raise NotImplementedError()
 
+    @override
+    def __repr__(self) -> str:
+        return json.dumps(self.to_dict())
+
 
 class ABILeafNode(ABINode, ABC):
     """Represents a leaf node in the tree defined by a function ABI."""
 
-    type_family: CalldataDescriptorTypeFamily = Field(title="Data type family")
-    type_size: int | None = Field(default=None, title="Data type size (in bytes)")
+    __slots__ = ("type_family", "type_size")
+
+    def __init__(self, type_family: CalldataDescriptorTypeFamily, type_size: int | None = None) -> None:
+        self.type_family = type_family
+        self.type_size = type_size
+        self.size = 1
+
+    @override
+    def to_dict(self) -> dict[str, Any]:
+        return {"type_family": self.type_family, "type_size": self.type_size, "type": self.type}
 
 
 class ABIStruct(ABINode):
     """ABI node representing a function or a tuple."""
 
-    type: Literal["struct"] = Field(default="struct", title="ABI tree node type")
-    components: dict[str, "ABITree"] = Field(title="Struct components")
-    offsets: dict[str, int] = Field(title="Struct components offsets")
+    __slots__ = ("components", "offsets")
 
-    @override
-    @property
-    def is_dynamic(self) -> bool:
-        return any(comp.is_dynamic for comp in self.components.values())
+    type = "struct"
+
+    def __init__(self, components: dict[str, "ABITree"], offsets: dict[str, int]) -> None:
+        self.components = components
+        self.offsets = offsets
+        self.is_dynamic = any(comp.is_dynamic for comp in components.values())
+        self.size = 1 if self.is_dynamic else sum(comp.size for comp in components.values())
 
     @override
-    @property
-    def size(self) -> int:
-        return 1 if self.is_dynamic else sum(comp.size for comp in self.components.values())
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "type": self.type,
+            "components": {name: component.to_dict() for name, component in self.components.items()},
+            "offsets": self.offsets,
+        }
 
 
 class ABIStaticArray(ABINode):
     """ABI node representing an array with static size."""
 
-    type: Literal["static_array"] = Field(default="static_array", title="ABI tree node type")
-    dimension: int = Field(title="Array dimension", ge=0)
-    component: "ABITree" = Field(title="Array element type")
+    __slots__ = ("component", "dimension")
 
-    @override
-    @property
-    def is_dynamic(self) -> bool:
-        return self.component.is_dynamic
+    type = "static_array"
+
+    def __init__(self, dimension: int, component: "ABITree") -> None:
+        if dimension < 0:
+            raise ValueError(f"Invalid array dimension: {dimension}")
+        self.dimension = dimension
+        self.component = component
+        self.is_dynamic = component.is_dynamic
+        self.size = 1 if self.is_dynamic else dimension * component.size
 
     @override
-    @property
-    def size(self) -> int:
-        return 1 if self.is_dynamic else self.dimension * self.component.size
+    def to_dict(self) -> dict[str, Any]:
+        return {"type": self.type, "dimension": self.dimension, "component": self.component.to_dict()}
 
 
 class ABIDynamicArray(ABINode):
     """ABI node representing an array with dynamic size."""
 
-    type: Literal["dynamic_array"] = Field(default="dynamic_array", title="ABI tree node type")
-    component: "ABITree" = Field(title="Array element type")
+    __slots__ = ("component",)
 
-    @override
-    @property
-    def is_dynamic(self) -> bool:
-        return True
+    type = "dynamic_array"
+
+    def __init__(self, component: "ABITree") -> None:
+        self.component = component
+        self.is_dynamic = True
+        self.size = 1
 
     @override
-    @property
-    def size(self) -> int:
-        return 1
+    def to_dict(self) -> dict[str, Any]:
+        return {"type": self.type, "component": self.component.to_dict()}
 
 
 class ABIStaticLeaf(ABILeafNode):
     """ABI node representing a scalar type with static size."""
 
-    type: Literal["static_leaf"] = Field(default="static_leaf", title="ABI tree node type")
+    __slots__ = ()
 
-    @override
-    @property
-    def is_dynamic(self) -> bool:
-        return False
+    type = "static_leaf"
 
-    @override
-    @property
-    def size(self) -> int:
-        return 1
+    def __init__(self, type_family: CalldataDescriptorTypeFamily, type_size: int | None = None) -> None:
+        super().__init__(type_family, type_size)
+        self.is_dynamic = False
 
 
 class ABIDynamicLeaf(ABILeafNode):
     """ABI node representing a scalar type with dynamic size."""
 
-    type: Literal["dynamic_leaf"] = Field(default="dynamic_leaf", title="ABI tree node type")
+    __slots__ = ()
 
-    @override
-    @property
-    def is_dynamic(self) -> bool:
-        return True
+    type = "dynamic_leaf"
 
-    @override
-    @property
-    def size(self) -> int:
-        return 1
+    def __init__(self, type_family: CalldataDescriptorTypeFamily, type_size: int | None = None) -> None:
+        super().__init__(type_family, type_size)
+        self.is_dynamic = True
 
 
-ABITree = Annotated[
-    ABIStruct | ABIStaticArray | ABIDynamicArray | ABIStaticLeaf | ABIDynamicLeaf, Field(discriminator="type")
-]
+ABITree = ABIStruct | ABIStaticArray | ABIDynamicArray | ABIStaticLeaf | ABIDynamicLeaf
+
+ABI_TREE_CACHE_SIZE = 4096
+"""Maximum number of function ABI trees kept in memory."""
+
+_ComponentKey = tuple[str, str, tuple["_ComponentKey", ...] | None]
+"""Hashable representation of an ABI component: (name, type, components)."""
 
 
 def function_to_abi_tree(function: Function) -> ABITree:
@@ -137,30 +167,47 @@ def function_to_abi_tree(function: Function) -> ABITree:
     An ABI tree is a tree representation of the ABI of a function inputs, enriched with some metadata to ease crafting
     paths to access values in the serialized calldata.
 
+    ABI trees are immutable and memoized by function inputs (names and types), so all fields, selectors and deployments
+    of a function share a single tree.
+
     @param function: function ABI
     @return:
     """
-    return _struct_component_to_abi_tree(function)
+    return _struct_to_abi_tree(_components_key(function.inputs))
+
 
+def _components_key(components: Sequence[InputOutput | Component] | None) -> tuple[_ComponentKey, ...]:
+    return tuple(
+        (component.name, component.type, _components_key(component.components) if component.components else None)
+        for component in components or ()
+    )
 
-def _component_to_abi_tree(inp: InputOutput | Component) -> ABITree:
+
+@lru_cache(maxsize=ABI_TREE_CACHE_SIZE)
+def _parse_type(type_str: str) -> TupleType | BasicType:
+    return eth_abi.grammar.parse(type_str)
+
+
+def _component_to_abi_tree(inp: _ComponentKey) -> ABITree:
     """
     Convert an ABI component to an ABI tree node.
 
     @param inp: ABI element (can be a single component, or a function input)
     @return: ABI tree
     """
-    match eth_abi.grammar.parse(inp.type):
+    name, type_str, components = inp
+    match _parse_type(type_str):
         case TupleType():
-            return _struct_component_to_abi_tree(inp)
+            return _struct_to_abi_tree(components or ())
 
         case BasicType() as tp:
             if tp.is_array:
+                component: ABITree
                 match tp.base:
                     case "tuple" | "struct":
-                        component = _struct_component_to_abi_tree(inp)
+                        component = _struct_to_abi_tree(components or ())
                     case _:
-                        component = _component_to_abi_tree(inp.model_copy(update={"type": tp.item_type.to_type_str()}))
+                        component = _component_to_abi_tree((name, tp.item_type.to_type_str(), components))
 
                 if len(dimension := tp.arrlist[-1]) == 0:
                     return ABIDynamicArray(component=component)
@@ -169,7 +216,7 @@ def _component_to_abi_tree(inp: InputOutput | Component) -> ABITree:
 
             match tp.base:
                 case "tuple" | "struct":
-                    return _struct_component_to_abi_tree(inp)
+                    return _struct_to_abi_tree(components or ())
                 case "int":
                     type_family = CalldataDescriptorTypeFamily.INT
                     type_size = (tp.sub or 256) // 8
@@ -202,37 +249,23 @@ def _component_to_abi_tree(inp: InputOutput | Component) -> ABITree:
             raise Exception(f"Unexpected ABI type: {type(unknown)}")
 
 
-def _struct_component_to_abi_tree(inp: Function | InputOutput | Component) -> ABITree:
+@lru_cache(maxsize=ABI_TREE_CACHE_SIZE)
+def _struct_to_abi_tree(input_components: tuple[_ComponentKey, ...]) -> ABITree:
     """
-    Convert a struct-like ABI component to an ABI tree node (can be the top level function directly).
+    Convert a struct-like ABI component to an ABI tree node (can be the top level function inputs directly).
 
-    @param inp: ABI element
+    @param input_components: ABI element components
     @return: ABI tree
     """
 
-    # get inputs/components list based on argument type
-    input_components: list[InputOutput | Component] = []
-    match inp:
-        case Function(inputs=inputs):
-            if inputs is not None:
-                input_components.extend(inputs)
-        case InputOutput(components=inp_components):
-            if inp_components is not None:
-                input_components.extend(inp_components)
-        case Component(components=inp_components):
-            if inp_components is not None:
-                input_components.extend(inp_components)
-        case _:
-            assert_never(inp)
-
     # recurse and compute field offsets
     components: dict[str, ABITree] = {}
     offsets: dict[str, int] = {}
     offset = 0
-    for _, component in enumerate(input_components):
+    for component in input_components:
         node = _component_to_abi_tree(component)
-        components[component.name] = node
-        offsets[component.name] = offset
+        components[component[0]] = node
+        offsets[component[0]] = offset
         offset += node.size
 
     return ABIStruct(components=components, offsets=offsets)
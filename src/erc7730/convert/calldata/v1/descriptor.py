@@ -9,7 +9,7 @@ from pydantic_string_url import HttpUrl
 from erc7730.common.abi import get_functions
 from erc7730.common.ledger import ledger_network_id
 from erc7730.common.output import OutputAdder
-from erc7730.convert.calldata.v1.selector import convert_selector
+from erc7730.convert.calldata.v1.selector import compile_selector, convert_selector
 from erc7730.convert.resolved.convert_erc7730_input_to_resolved import (
     ERC7730InputToResolved,
 )
@@ -45,8 +45,7 @@ def convert_descriptor(
     context = cast(ResolvedContractContext, resolved_descriptor.context)
     abis: dict[Selector, Function] = get_functions(context.contract.abi).functions
 
-    output_descriptors = []
-
+    deployments = []
     for deployment in context.contract.deployments:
         if chain_id is not None and chain_id != deployment.chainId:
             continue
@@ -55,25 +54,25 @@ def convert_descriptor(
             out.warning(f"Chain id {deployment.chainId} is not known, skipping it")
             continue
 
-        for selector, format in resolved_descriptor.display.formats.items():
-            if (abi := abis.get(selector)) is None:
-                out.error(
-                    title="Invalid selector",
-                    message=f"Selector {selector} not found in ABI.",
-                )
-                continue
-
-            descriptor = convert_selector(
-                descriptor=resolved_descriptor,
-                deployment=deployment,
-                selector=selector,
-                format=format,
-                abi=abi,
-                source=source,
-                out=out,
+        deployments.append(deployment)
+
+    if not deployments:
+        return []
+
+    compiled_selectors = []
+    for selector, format in resolved_descriptor.display.formats.items():
+        if (abi := abis.get(selector)) is None:
+            out.error(
+                title="Invalid selector",
+                message=f"Selector {selector} not found in ABI.",
             )
+            continue
 
-            if descriptor is not None:
-                output_descriptors.append(descriptor)
+        if (compiled := compile_selector(resolved_descriptor, selector, format, abi, out)) is not None:
+            compiled_selectors.append(compiled)
 
-    return output_descriptors
+    return [
+        convert_selector(descriptor=resolved_descriptor, deployment=deployment, compiled=compiled, source=source)
+        for deployment in deployments
+        for compiled in compiled_selectors
+    ]
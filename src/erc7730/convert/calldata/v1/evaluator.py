@@ -0,0 +1,489 @@
+"""
+Evaluation of calldata descriptor values against the calldata of a transaction.
+
+The calldata is decoded once, and all values of a calldata descriptor are evaluated against a single view of the
+argument data. Path prefixes shared between fields (for instance, several fields of the same struct) are resolved
+once, and paths on arrays can select several elements.
+
+Many transactions for the same selector can be evaluated as a batch, returning one column of values per field: values
+at a static offset in calldata are read directly at that offset in each transaction, with one decoding pass per column,
+and only values behind dynamic paths are walked per transaction. Values are still decoded one transaction at a time (ABI
+words are 256 bit integers), the gain comes from not walking paths and not creating per transaction evaluators.
+"""
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, assert_never
+
+from erc7730.common.binary import from_hex
+from erc7730.model.calldata.descriptor import CalldataDescriptorV1
+from erc7730.model.calldata.v1.instruction import CalldataDescriptorInstructionFieldV1
+from erc7730.model.calldata.v1.param import CalldataDescriptorParamNFTV1, CalldataDescriptorParamTokenAmountV1
+from erc7730.model.calldata.v1.value import (
+    CalldataDescriptorContainerPathV1,
+    CalldataDescriptorContainerPathValueV1,
+    CalldataDescriptorDataPathV1,
+    CalldataDescriptorPathElementArrayV1,
+    CalldataDescriptorPathElementLeafV1,
+    CalldataDescriptorPathElementRefV1,
+    CalldataDescriptorPathElementSliceV1,
+    CalldataDescriptorPathElementTupleV1,
+    CalldataDescriptorPathLeafType,
+    CalldataDescriptorTypeFamily,
+    CalldataDescriptorValueConstantV1,
+    CalldataDescriptorValuePathV1,
+    CalldataDescriptorValueV1,
+)
+from erc7730.model.types import Address, HexStr
+
+WORD_SIZE = 32
+ADDRESS_SIZE = 20
+
+_TUPLE = 0
+_ARRAY = 1
+_REF = 2
+
+_Op = tuple[Any, ...]
+"""Compact, hashable form of a TUPLE/ARRAY/REF path element, used as memoization key."""
+
+_Children = dict[_Op, "_Node"]
+"""Memoized path elements resolved from a given cursor."""
+
+_Cursor = tuple[int, int, _Children]
+"""Resolved cursor: (offset, reference offset, memoized path elements resolved from this cursor)."""
+
+_Node = tuple[bool, list[_Cursor]]
+"""Resolved path element: (whether the element selects several array elements, resulting cursors)."""
+
+
+@dataclass(kw_only=True, frozen=True)
+class EvaluatedField:
+    """Values of a calldata descriptor field, evaluated against a transaction."""
+
+    field: CalldataDescriptorInstructionFieldV1
+    value: Any
+    token: Any = None
+    collection: Any = None
+
+
+@dataclass(kw_only=True, frozen=True)
+class EvaluatedColumn:
+    """Values of a calldata descriptor field, evaluated against a batch of transactions (one value per transaction)."""
+
+    field: CalldataDescriptorInstructionFieldV1
+    values: list[Any]
+    tokens: list[Any] | None = None
+    collections: list[Any] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledValue:
+    """
+    Calldata descriptor value, compiled once to be evaluated against many transactions without walking the model.
+
+    Exactly one of constant value, container value or data path (ops + leaf) is set.
+    """
+
+    constant: Any = None
+    container: CalldataDescriptorContainerPathValueV1 | None = None
+    ops: tuple[_Op, ...] | None = None
+    dynamic: bool = False
+    leaf_slice: tuple[int | None, int | None] | None = None
+    decode: Callable[[bytes | memoryview], Any] = bytes
+
+
+def compile_value(value: CalldataDescriptorValueV1) -> CompiledValue:
+    """
+    Compile a calldata descriptor value for evaluation with `CalldataEvaluator`.
+
+    @param value: constant or path value
+    @return: compiled value
+    """
+    match value:
+        case CalldataDescriptorValueConstantV1():
+            return CompiledValue(constant=value.value)
+        case CalldataDescriptorValuePathV1(binary_path=CalldataDescriptorContainerPathV1() as path):
+            return CompiledValue(container=path.value)
+        case CalldataDescriptorValuePathV1(binary_path=CalldataDescriptorDataPathV1() as path):
+            return _compile_data_path(path, value.type_family)
+        case _:
+            raise ValueError(f"Unsupported value: {value}")
+
+
+def _compile_data_path(path: CalldataDescriptorDataPathV1, type_family: CalldataDescriptorTypeFamily) -> CompiledValue:
+    ops: list[_Op] = []
+    leaf_type: CalldataDescriptorPathLeafType | None = None
+    leaf_slice: CalldataDescriptorPathElementSliceV1 | None = None
+
+    for element in path.elements:
+        if leaf_type is not None and not isinstance(element, CalldataDescriptorPathElementSliceV1):
+            raise ValueError("Leaf can only be followed by a slice")
+        match element:
+            case CalldataDescriptorPathElementTupleV1():
+                ops.append((_TUPLE, element.offset))
+            case CalldataDescriptorPathElementArrayV1():
+                ops.append((_ARRAY, element.weight, *_array_bounds(element)))
+            case CalldataDescriptorPathElementRefV1():
+                ops.append((_REF,))
+            case CalldataDescriptorPathElementLeafV1():
+                leaf_type = element.leaf_type
+            case CalldataDescriptorPathElementSliceV1():
+                if leaf_type is None:
+                    raise ValueError("Slice can only be used as last element of the path")
+                leaf_slice = element
+            case _:
+                assert_never(element)
+
+    match leaf_type:
+        case None:
+            raise ValueError("Path did not resolve to a leaf element")
+        case CalldataDescriptorPathLeafType.ARRAY_LEAF:
+            raise NotImplementedError("Array leaf is not supported in v1 of protocol")
+        case CalldataDescriptorPathLeafType.TUPLE_LEAF:
+            raise NotImplementedError("Tuple leaf is not supported in v1 of protocol")
+        case CalldataDescriptorPathLeafType.STATIC_LEAF | CalldataDescriptorPathLeafType.DYNAMIC_LEAF:
+            pass
+        case _:
+            assert_never(leaf_type)
+
+    return CompiledValue(
+        ops=tuple(ops),
+        dynamic=leaf_type == CalldataDescriptorPathLeafType.DYNAMIC_LEAF,
+        leaf_slice=None if leaf_slice is None else (leaf_slice.start, leaf_slice.end),
+        decode=_decoder(type_family),
+    )
+
+
+class CalldataEvaluator:
+    """
+    Evaluator of calldata descriptor values against the calldata of a single transaction.
+
+    Values are returned as typed Python values: integers for (u)int types, booleans, "0x" prefixed hex strings for
+    addresses and bytes, and strings. A path selecting several array elements (full array, or array slice) returns a
+    list of values (nested lists for nested arrays).
+
+    Container values (sender, destination and amount of the transaction) can only be evaluated if provided.
+    """
+
+    __slots__ = ("_data", "_root", "_sender", "_to", "_value")
+
+    def __init__(
+        self,
+        calldata: HexStr | bytes,
+        sender: Address | None = None,
+        to: Address | None = None,
+        value: int | None = None,
+    ) -> None:
+        """
+        @param calldata: serialized function call data (selector + arguments), as hex string or bytes
+        @param sender: transaction sender address, if known
+        @param to: transaction destination address, if known
+        @param value: transaction native currency amount, if known
+        """
+        data = from_hex(calldata) if isinstance(calldata, str) else calldata
+        self._data = memoryview(data)[4:]
+        self._root: _Children = {}
+        self._sender = sender
+        self._to = to
+        self._value = value
+
+    def evaluate_descriptor(self, descriptor: CalldataDescriptorV1) -> list[EvaluatedField]:
+        """
+        Evaluate all field values of a calldata descriptor.
+
+        @param descriptor: calldata descriptor, for the selector of the calldata
+        @return: evaluated values, in fields order
+        """
+        evaluated: list[EvaluatedField] = []
+        for field in descriptor.fields:
+            param = field.param
+            token = collection = None
+            if isinstance(param, CalldataDescriptorParamTokenAmountV1) and param.token is not None:
+                token = self.evaluate(param.token)
+            elif isinstance(param, CalldataDescriptorParamNFTV1):
+                collection = self.evaluate(param.collection)
+            evaluated.append(
+                EvaluatedField(field=field, value=self.evaluate(param.value), token=token, collection=collection)
+            )
+        return evaluated
+
+    def evaluate(self, value: CalldataDescriptorValueV1 | CompiledValue) -> Any:
+        """
+        Evaluate a single calldata descriptor value.
+
+        @param value: constant or path value, or value compiled with `compile_value`
+        @return: decoded value
+        """
+        compiled = value if isinstance(value, CompiledValue) else compile_value(value)
+        if compiled.ops is not None:
+            return self._walk(compiled.ops, 0, 0, 0, self._root, compiled)
+        if compiled.container is not None:
+            return self._container(compiled.container)
+        return compiled.constant
+
+    def _container(self, container: CalldataDescriptorContainerPathValueV1) -> Any:
+        match container:
+            case CalldataDescriptorContainerPathValueV1.FROM:
+                result: Any = self._sender
+            case CalldataDescriptorContainerPathValueV1.TO:
+                result = self._to
+            case CalldataDescriptorContainerPathValueV1.VALUE:
+                result = self._value
+            case _:
+                assert_never(container)
+        if result is None:
+            raise ValueError(f"Container value {container.name} is not available")
+        return result
+
+    def _walk(
+        self, ops: tuple[_Op, ...], i: int, offset: int, ref_offset: int, children: _Children, leaf: CompiledValue
+    ) -> Any:
+        while i < len(ops):
+            op = ops[i]
+            if (node := children.get(op)) is None:
+                node = children[op] = self._step(op, offset, ref_offset)
+            multiple, cursors = node
+            i += 1
+            if multiple:
+                return [self._walk(ops, i, *cursor, leaf) for cursor in cursors]
+            ((offset, ref_offset, children),) = cursors
+        raw = self._dynamic(offset) if leaf.dynamic else self._read(offset, WORD_SIZE)
+        if leaf.leaf_slice is not None:
+            raw = _slice(raw, *leaf.leaf_slice)
+        return leaf.decode(raw)
+
+    def _step(self, op: _Op, offset: int, ref_offset: int) -> _Node:
+        kind = op[0]
+        if kind == _TUPLE:
+            return False, [(offset + op[1] * WORD_SIZE, offset, {})]
+        if kind == _REF:
+            return False, [(ref_offset + self._word(offset), ref_offset, {})]
+        _, weight, start, end, multiple = op
+        first, last = _resolve_bounds(start, end, self._word(offset), bool(multiple))
+        base = offset + WORD_SIZE
+        return bool(multiple), [(base + index * weight * WORD_SIZE, base, {}) for index in range(first, last)]
+
+    def _read(self, offset: int, length: int) -> memoryview:
+        if offset < 0 or offset + length > len(self._data):
+            raise IndexError(f"Calldata is too short: cannot read {length} bytes at offset {offset}")
+        return self._data[offset : offset + length]
+
+    def _word(self, offset: int) -> int:
+        return int.from_bytes(self._read(offset, WORD_SIZE), byteorder="big")
+
+    def _dynamic(self, offset: int) -> memoryview:
+        return self._read(offset + WORD_SIZE, self._word(offset))
+
+
+class CalldataBatchEvaluator:
+    """
+    Batch evaluator of a calldata descriptor against the calldata of many transactions for the same selector.
+
+    The evaluation plan (static offset of each value, if any) is computed once per descriptor, so the evaluator can be
+    reused for many batches. Values at a static offset are decoded column by column, other values are evaluated with a
+    CalldataEvaluator per transaction. Values returned are the same as with CalldataEvaluator.
+    """
+
+    __slots__ = ("_compiled", "_descriptor", "_selector", "_static_offsets")
+
+    def __init__(self, descriptor: CalldataDescriptorV1) -> None:
+        """
+        @param descriptor: calldata descriptor, for the selector of all transactions
+        """
+        self._descriptor = descriptor
+        self._selector = from_hex(descriptor.transaction_info.selector)
+        self._static_offsets: dict[int, int | None] = {}
+        self._compiled: dict[int, CompiledValue] = {}
+        for field in descriptor.fields:
+            for value in _field_values(field):
+                if isinstance(value, CalldataDescriptorValuePathV1):
+                    self._static_offsets[id(value)] = _static_offset(value)
+                self._compiled[id(value)] = compile_value(value)
+
+    def evaluate(
+        self,
+        calldata: Sequence[HexStr | bytes],
+        senders: Sequence[Address] | None = None,
+        tos: Sequence[Address] | None = None,
+        values: Sequence[int] | None = None,
+    ) -> list[EvaluatedColumn]:
+        """
+        Evaluate all field values of the calldata descriptor, for a batch of transactions.
+
+        @param calldata: serialized function call data of each transaction
+        @param senders: sender address of each transaction, if known
+        @param tos: destination address of each transaction, if known
+        @param values: native currency amount of each transaction, if known
+        @return: one column of evaluated values per field, in fields order
+        """
+        rows = [from_hex(data) if isinstance(data, str) else data for data in calldata]
+        for i, row in enumerate(rows):
+            if row[:4] != self._selector:
+                raise ValueError(f"Calldata of transaction {i} does not match descriptor selector")
+        batch = _Batch(
+            rows=rows,
+            containers={
+                CalldataDescriptorContainerPathValueV1.FROM: senders,
+                CalldataDescriptorContainerPathValueV1.TO: tos,
+                CalldataDescriptorContainerPathValueV1.VALUE: values,
+            },
+        )
+
+        columns: list[EvaluatedColumn] = []
+        for field in self._descriptor.fields:
+            param = field.param
+            tokens = collections = None
+            if isinstance(param, CalldataDescriptorParamTokenAmountV1) and param.token is not None:
+                tokens = self._column(param.token, batch)
+            elif isinstance(param, CalldataDescriptorParamNFTV1):
+                collections = self._column(param.collection, batch)
+            columns.append(
+                EvaluatedColumn(
+                    field=field, values=self._column(param.value, batch), tokens=tokens, collections=collections
+                )
+            )
+        return columns
+
+    def _column(self, value: CalldataDescriptorValueV1, batch: "_Batch") -> list[Any]:
+        match value:
+            case CalldataDescriptorValueConstantV1():
+                return [value.value] * len(batch.rows)
+            case CalldataDescriptorValuePathV1(binary_path=CalldataDescriptorContainerPathV1() as path):
+                if (container := batch.containers[path.value]) is None:
+                    raise ValueError(f"Container value {path.value.name} is not available")
+                if len(container) != len(batch.rows):
+                    raise ValueError(f"Container value {path.value.name} must be provided for each transaction")
+                return list(container)
+            case CalldataDescriptorValuePathV1():
+                if (offset := self._static_offsets.get(id(value))) is None:
+                    compiled = self._compiled[id(value)]
+                    return [evaluator.evaluate(compiled) for evaluator in batch.evaluators()]
+                start, end = 4 + offset, 4 + offset + WORD_SIZE
+                if batch.rows and end > min(map(len, batch.rows)):
+                    i = next(i for i, row in enumerate(batch.rows) if len(row) < end)
+                    raise IndexError(f"Calldata of transaction {i} is too short: cannot read value at offset {offset}")
+                return _decode_column(batch.rows, start, value.type_family)
+            case _:
+                raise ValueError(f"Unsupported value: {value}")
+
+
+@dataclass(kw_only=True)
+class _Batch:
+    """Calldata of a batch of transactions, with per transaction evaluators created on first use."""
+
+    rows: list[bytes]
+    containers: dict[CalldataDescriptorContainerPathValueV1, Sequence[Any] | None]
+    _evaluators: list[CalldataEvaluator] | None = None
+
+    def evaluators(self) -> list[CalldataEvaluator]:
+        if self._evaluators is None:
+            self._evaluators = [CalldataEvaluator(row) for row in self.rows]
+        return self._evaluators
+
+
+def _field_values(field: CalldataDescriptorInstructionFieldV1) -> list[CalldataDescriptorValueV1]:
+    param = field.param
+    values = [param.value]
+    if isinstance(param, CalldataDescriptorParamTokenAmountV1) and param.token is not None:
+        values.append(param.token)
+    elif isinstance(param, CalldataDescriptorParamNFTV1):
+        values.append(param.collection)
+    return values
+
+
+def _static_offset(value: CalldataDescriptorValuePathV1) -> int | None:
+    """Get offset of a value in argument data, if it is a static leaf at a static offset (tuples only, no slice)."""
+    if not isinstance(path := value.binary_path, CalldataDescriptorDataPathV1):
+        return None
+    *elements, leaf = path.elements
+    if not (
+        isinstance(leaf, CalldataDescriptorPathElementLeafV1)
+        and leaf.leaf_type == CalldataDescriptorPathLeafType.STATIC_LEAF
+        and value.type_family not in (CalldataDescriptorTypeFamily.FIXED, CalldataDescriptorTypeFamily.UFIXED)
+    ):
+        return None
+    offset = 0
+    for element in elements:
+        if not isinstance(element, CalldataDescriptorPathElementTupleV1):
+            return None
+        offset += element.offset * WORD_SIZE
+    return offset
+
+
+def _decode_column(rows: list[bytes], start: int, type_family: CalldataDescriptorTypeFamily) -> list[Any]:
+    """
+    Decode the static word at the same offset of all rows, with the same result as `_decoder` on each word.
+
+    Where possible, builtin functions are mapped over the whole column, so that no Python code runs per row.
+    """
+    end = start + WORD_SIZE
+    match type_family:
+        case CalldataDescriptorTypeFamily.INT:
+            return [int.from_bytes(row[start:end], byteorder="big", signed=True) for row in rows]
+        case CalldataDescriptorTypeFamily.UINT:
+            # int.from_bytes is big endian by default
+            return list(map(int.from_bytes, map(itemgetter(slice(start, end)), rows)))
+        case CalldataDescriptorTypeFamily.FIXED:
+            raise NotImplementedError("Fixed point numbers are not supported")
+        case CalldataDescriptorTypeFamily.UFIXED:
+            raise NotImplementedError("Unsigned fixed point numbers are not supported")
+        case CalldataDescriptorTypeFamily.ADDRESS:
+            return ["0x" + row[end - ADDRESS_SIZE : end].hex() for row in rows]
+        case CalldataDescriptorTypeFamily.BYTES:
+            return ["0x" + row[start:end].hex() for row in rows]
+        case CalldataDescriptorTypeFamily.BOOL:
+            return list(map(any, map(itemgetter(slice(start, end)), rows)))
+        case CalldataDescriptorTypeFamily.STRING:
+            return [bytes(row[start:end]).decode("ascii") for row in rows]
+        case _:
+            assert_never(type_family)
+
+
+def _array_bounds(element: CalldataDescriptorPathElementArrayV1) -> tuple[int | None, int | None, bool]:
+    """Get array element bounds, and whether it selects several elements (ie it is not a single index)."""
+    start, end = element.start, element.end
+    single = start is not None and (end == start + 1 or (start == -1 and end is None))
+    return start, end, not single
+
+
+def _resolve_bounds(start: int | None, end: int | None, length: int, multiple: bool) -> tuple[int, int]:
+    first = 0 if start is None else start + length if start < 0 else start
+    last = length if end is None else end + length if end < 0 else end
+    if multiple:
+        if not 0 <= first <= last <= length:
+            raise IndexError(f"Array slice [{start}:{end}] out of bounds for array of length {length}")
+    elif not 0 <= first < length:
+        raise IndexError(f"Array index {start} out of bounds for array of length {length}")
+    return first, last
+
+
+def _slice(raw: memoryview, start: int | None, end: int | None) -> memoryview:
+    length = len(raw)
+    first = 0 if start is None else start + length if start < 0 else start
+    last = length if end is None else end + length if end < 0 else end
+    if not 0 <= first <= last <= length:
+        raise IndexError("Slice out of bounds")
+    return raw[first:last]
+
+
+def _decoder(type_family: CalldataDescriptorTypeFamily) -> Callable[[bytes | memoryview], Any]:
+    match type_family:
+        case CalldataDescriptorTypeFamily.INT:
+            return lambda raw: int.from_bytes(raw, byteorder="big", signed=True)
+        case CalldataDescriptorTypeFamily.UINT:
+            return lambda raw: int.from_bytes(raw, byteorder="big")
+        case CalldataDescriptorTypeFamily.FIXED:
+            raise NotImplementedError("Fixed point numbers are not supported")
+        case CalldataDescriptorTypeFamily.UFIXED:
+            raise NotImplementedError("Unsigned fixed point numbers are not supported")
+        case CalldataDescriptorTypeFamily.ADDRESS:
+            return lambda raw: "0x" + raw[-ADDRESS_SIZE:].hex()
+        case CalldataDescriptorTypeFamily.BYTES:
+            return lambda raw: "0x" + raw.hex()
+        case CalldataDescriptorTypeFamily.BOOL:
+            return lambda raw: any(raw)
+        case CalldataDescriptorTypeFamily.STRING:
+            return lambda raw: bytes(raw).decode("ascii")
+        case _:
+            assert_never(type_family)
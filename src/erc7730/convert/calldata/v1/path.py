@@ -2,6 +2,7 @@
 Conversion of ERC-7730 ABI paths to calldata descriptor binary paths.
 """
 
+import json
 from typing import Any, assert_never
 
 from erc7730.common.binary import from_hex
@@ -172,7 +173,7 @@ def convert_data_path(
     def error(message: str) -> CalldataDescriptorValuePathV1 | None:
         return out.error(
             title="Invalid data path",
-            message=f"""Path {path} cannot be applied to ABI function "{abi.model_dump_json(indent=2)}: at """
+            message=f"""Path {path} cannot be applied to ABI function "{json.dumps(abi.to_dict(), indent=2)}: at """
             f"{DataPathStr(absolute=True, elements=current_path_in)}, {message}",
         )
 
@@ -402,7 +403,7 @@ def apply_path_raw(calldata: HexStr, path: CalldataDescriptorDataPathV1) -> byte
                 offset += element.offset * 32
 
             case CalldataDescriptorPathElementArrayV1():
-                ref_offset = offset
+                ref_offset = offset + 32
                 array_length = int.from_bytes(argdata[offset : offset + 32], byteorder="big")
 
                 start = 0 if element.start is None else element.start
@@ -1,8 +1,12 @@
 """
 Conversion of an ERC-7730 descriptor to a calldata descriptor (for a single chain + selector).
+
+Conversion is split in two steps: the deployment independent part (ABI tree, field instructions, fields hash) is
+compiled once per selector, then combined with each deployment transaction info and enum instructions.
 """
 
 import hashlib
+from dataclasses import dataclass
 from typing import cast
 
 from eth_typing import ChainId as EthChainId
@@ -21,6 +25,7 @@ from erc7730.model.calldata.descriptor import (
     CalldataDescriptorV1,
 )
 from erc7730.model.calldata.v1.instruction import (
+    CalldataDescriptorInstructionFieldV1,
     CalldataDescriptorInstructionTransactionInfoV1,
 )
 from erc7730.model.resolved.context import ResolvedDeployment
@@ -29,43 +34,43 @@ from erc7730.model.resolved.display import ResolvedFormat
 from erc7730.model.types import Selector
 
 
-def convert_selector(
+@dataclass(kw_only=True, frozen=True)
+class CompiledSelector:
+    """
+    Deployment independent part of the calldata descriptor of a selector, computed once and shared by all deployments.
+    """
+
+    selector: Selector
+    format: ResolvedFormat
+    fields: list[CalldataDescriptorInstructionFieldV1]
+    hash: str
+
+
+def compile_selector(
     descriptor: ResolvedERC7730Descriptor,
-    deployment: ResolvedDeployment,
     selector: Selector,
     format: ResolvedFormat,
     abi: Function,
-    source: HttpUrl | None,
     out: OutputAdder,
-) -> CalldataDescriptor | None:
+) -> CompiledSelector | None:
     """
-    Generate output calldata descriptor for a single selector ("format" in ERC-7730 source descriptor).
+    Compile the deployment independent part of the calldata descriptor of a single selector: ABI tree, field
+    instructions and fields hash.
 
-    If descriptor is invalid, None is returned. Errors are logged to the console.
+    If format is invalid, None is returned. Errors are logged to the console.
 
     :param descriptor: resolved source ERC-7730 descriptor
-    :param deployment: chain id / contract address for which the descriptor is generated
     :param selector: function for which the descriptor is generated
     :param format: ERC-7730 format for the selector
     :param abi: ABI of the function
-    :param source: source of the descriptor file
     :param out: error handler
-    :return: output calldata descriptors (1 per chain + selector)
+    :return: compiled selector
     """
 
     abi_tree = function_to_abi_tree(abi)
 
-    creator_legal_name: str | None = None
-    creator_url: str | None = None
-    deploy_date: str | None = None
-    if (owner_info := descriptor.metadata.info) is not None:
-        creator_legal_name = owner_info.legalName
-        creator_url = owner_info.url
-        deploy_date = owner_info.deploymentDate.strftime("%Y-%m-%dT%H:%M:%SZ") if owner_info.deploymentDate else None
-
-    enums = convert_enums(deployment, selector, descriptor.metadata.enums)
-
-    enums_by_id = {enum.enum_id: enum.id for enum in enums}
+    # enum instruction ids only depend on the enum definitions order, not on the deployment
+    enums_by_id = {enum_id: i for i, enum_id in enumerate(descriptor.metadata.enums or {})}
 
     fields = []
     for input_field in format.fields:
@@ -77,11 +82,39 @@ def convert_selector(
     for field in fields:
         hash.update(from_hex(field.descriptor))
 
+    return CompiledSelector(selector=selector, format=format, fields=fields, hash=hash.digest().hex())
+
+
+def convert_selector(
+    descriptor: ResolvedERC7730Descriptor,
+    deployment: ResolvedDeployment,
+    compiled: CompiledSelector,
+    source: HttpUrl | None,
+) -> CalldataDescriptor:
+    """
+    Generate output calldata descriptor for a single selector ("format" in ERC-7730 source descriptor) and deployment.
+
+    :param descriptor: resolved source ERC-7730 descriptor
+    :param deployment: chain id / contract address for which the descriptor is generated
+    :param compiled: compiled selector, see `compile_selector`
+    :param source: source of the descriptor file
+    :return: output calldata descriptor
+    """
+    selector, format = compiled.selector, compiled.format
+
+    creator_legal_name: str | None = None
+    creator_url: str | None = None
+    deploy_date: str | None = None
+    if (owner_info := descriptor.metadata.info) is not None:
+        creator_legal_name = owner_info.legalName
+        creator_url = owner_info.url
+        deploy_date = owner_info.deploymentDate.strftime("%Y-%m-%dT%H:%M:%SZ") if owner_info.deploymentDate else None
+
     transaction_info = CalldataDescriptorInstructionTransactionInfoV1(
         chain_id=EthChainId(deployment.chainId),
         address=deployment.address,
         selector=selector,
-        hash=hash.digest().hex(),
+        hash=compiled.hash,
         operation_type=first_not_none(format.intent, format.id, selector),  # type:ignore
         creator_name=descriptor.metadata.owner,
         creator_legal_name=creator_legal_name,
@@ -97,6 +130,6 @@ def convert_selector(
         address=deployment.address,
         selector=selector,
         transaction_info=transaction_info,
-        enums=enums,
-        fields=fields,
+        enums=convert_enums(deployment, selector, descriptor.metadata.enums),
+        fields=compiled.fields,
     )
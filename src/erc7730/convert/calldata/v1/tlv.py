@@ -4,12 +4,14 @@ Encoding of calldata descriptor instructions to TLV format.
 See https://github.com/LedgerHQ/generic_parser for specifications of these payloads.
 """
 
+from collections.abc import Callable
 from datetime import datetime
 from enum import IntEnum
 from typing import assert_never
 
-from erc7730.common.binary import from_hex, tlv
+from erc7730.common.binary import TLVWriter
 from erc7730.common.pydantic import pydantic_enum_by_name
+from erc7730.model.calldata.descriptor import CalldataDescriptorV1
 from erc7730.model.calldata.types import TrustedNameSource, TrustedNameType
 from erc7730.model.calldata.v1.instruction import (
     CalldataDescriptorInstructionEnumValueV1,
@@ -43,6 +45,13 @@ from erc7730.model.calldata.v1.value import (
 )
 
 
+@pydantic_enum_by_name
+class CalldataDescriptorFrameType(IntEnum):
+    TRANSACTION_INFO = 0x01
+    ENUM_VALUE = 0x02
+    FIELD = 0x03
+
+
 @pydantic_enum_by_name
 class CalldataDescriptorTransactionInfoTag(IntEnum):
     VERSION = 0x00
@@ -177,6 +186,26 @@ class CalldataDescriptorPathSliceElementTag(IntEnum):
     END = 0x02
 
 
+def tlv_descriptor(obj: CalldataDescriptorV1) -> bytes:
+    """
+    Encode all structs of a calldata descriptor in a single buffer, as a sequence of frames.
+
+    Each frame is made of the frame type (1 byte), the length of the struct (2 bytes, big endian) and the struct TLV.
+    The TRANSACTION_INFO frame comes first, followed by ENUM_VALUE frames then FIELD frames, so descriptors can be
+    concatenated in a stream: each TRANSACTION_INFO frame starts a new descriptor.
+
+    @param obj: calldata descriptor
+    @return: encoded frames
+    """
+    writer = TLVWriter()
+    _write_frame(writer, CalldataDescriptorFrameType.TRANSACTION_INFO, write_transaction_info, obj.transaction_info)
+    for enum in obj.enums:
+        _write_frame(writer, CalldataDescriptorFrameType.ENUM_VALUE, write_enum_value, enum)
+    for field in obj.fields:
+        _write_frame(writer, CalldataDescriptorFrameType.FIELD, write_field, field)
+    return writer.getvalue()
+
+
 def tlv_transaction_info(obj: CalldataDescriptorInstructionTransactionInfoV1) -> bytes:
     """
     Encode a struct of type TRANSACTION_INFO.
@@ -184,268 +213,298 @@ def tlv_transaction_info(obj: CalldataDescriptorInstructionTransactionInfoV1) ->
     @param obj: object representation of struct
     @return: encoded struct TLV
     """
-    out = bytearray()
-    out += tlv(CalldataDescriptorTransactionInfoTag.VERSION, obj.version.to_bytes(1))
-    out += tlv(CalldataDescriptorTransactionInfoTag.CHAIN_ID, obj.chain_id.to_bytes(8))
-    out += tlv(CalldataDescriptorTransactionInfoTag.CONTRACT_ADDR, from_hex(obj.address))
-    out += tlv(CalldataDescriptorTransactionInfoTag.SELECTOR, from_hex(obj.selector))
-    out += tlv(CalldataDescriptorTransactionInfoTag.FIELDS_HASH, from_hex(obj.hash))
-    out += tlv(CalldataDescriptorTransactionInfoTag.OPERATION_TYPE, obj.operation_type)
+    writer = TLVWriter()
+    write_transaction_info(writer, obj)
+    return writer.getvalue()
+
+
+def tlv_enum_value(obj: CalldataDescriptorInstructionEnumValueV1) -> bytes:
+    """
+    Encode a struct of type ENUM_VALUE.
+
+    @param obj: object representation of struct
+    @return: encoded struct TLV
+    """
+    writer = TLVWriter()
+    write_enum_value(writer, obj)
+    return writer.getvalue()
+
+
+def tlv_field(obj: CalldataDescriptorInstructionFieldV1) -> bytes:
+    """
+    Encode a struct of type FIELD.
+
+    @param obj: object representation of struct
+    @return: encoded struct TLV
+    """
+    writer = TLVWriter()
+    write_field(writer, obj)
+    return writer.getvalue()
+
+
+def _write_frame[T](
+    writer: TLVWriter, frame_type: CalldataDescriptorFrameType, write: Callable[[TLVWriter, T], None], obj: T
+) -> None:
+    buffer = writer.buffer
+    buffer.append(frame_type)
+    buffer += b"\x00\x00"
+    start = len(buffer)
+    write(writer, obj)
+    buffer[start - 2 : start] = (len(buffer) - start).to_bytes(2)
+
+
+def write_transaction_info(writer: TLVWriter, obj: CalldataDescriptorInstructionTransactionInfoV1) -> None:
+    """
+    Write a struct of type TRANSACTION_INFO.
+
+    @param writer: TLV writer
+    @param obj: object representation of struct
+    """
+    writer.integer(CalldataDescriptorTransactionInfoTag.VERSION, obj.version, 1)
+    writer.integer(CalldataDescriptorTransactionInfoTag.CHAIN_ID, obj.chain_id, 8)
+    writer.hex(CalldataDescriptorTransactionInfoTag.CONTRACT_ADDR, obj.address)
+    writer.hex(CalldataDescriptorTransactionInfoTag.SELECTOR, obj.selector)
+    writer.hex(CalldataDescriptorTransactionInfoTag.FIELDS_HASH, obj.hash)
+    writer.tlv(CalldataDescriptorTransactionInfoTag.OPERATION_TYPE, obj.operation_type)
 
     if (creator_name := obj.creator_name) is not None:
-        out += tlv(CalldataDescriptorTransactionInfoTag.CREATOR_NAME, creator_name)
+        writer.tlv(CalldataDescriptorTransactionInfoTag.CREATOR_NAME, creator_name)
 
     if (creator_legal_name := obj.creator_legal_name) is not None:
-        out += tlv(CalldataDescriptorTransactionInfoTag.CREATOR_LEGAL_NAME, creator_legal_name)
+        writer.tlv(CalldataDescriptorTransactionInfoTag.CREATOR_LEGAL_NAME, creator_legal_name)
 
     if (creator_url := obj.creator_url) is not None:
-        out += tlv(CalldataDescriptorTransactionInfoTag.CREATOR_URL, creator_url)
+        writer.tlv(CalldataDescriptorTransactionInfoTag.CREATOR_URL, creator_url)
 
     if (contract_name := obj.contract_name) is not None:
-        out += tlv(CalldataDescriptorTransactionInfoTag.CONTRACT_NAME, contract_name)
+        writer.tlv(CalldataDescriptorTransactionInfoTag.CONTRACT_NAME, contract_name)
 
     if (deploy_date := obj.deploy_date) is not None:
         tstamp = int(datetime.fromisoformat(deploy_date).timestamp())
-        out += tlv(CalldataDescriptorTransactionInfoTag.DEPLOY_DATE, tstamp.to_bytes(4))
-
-    return out
+        writer.integer(CalldataDescriptorTransactionInfoTag.DEPLOY_DATE, tstamp, 4)
 
 
-def tlv_enum_value(obj: CalldataDescriptorInstructionEnumValueV1) -> bytes:
+def write_enum_value(writer: TLVWriter, obj: CalldataDescriptorInstructionEnumValueV1) -> None:
     """
-    Encode a struct of type ENUM_VALUE.
+    Write a struct of type ENUM_VALUE.
 
+    @param writer: TLV writer
     @param obj: object representation of struct
-    @return: encoded struct TLV
     """
-    out = bytearray()
-    out += tlv(CalldataDescriptorEnumValueTag.VERSION, obj.version.to_bytes(1))
-    out += tlv(CalldataDescriptorEnumValueTag.CHAIN_ID, obj.chain_id.to_bytes(8))
-    out += tlv(CalldataDescriptorEnumValueTag.CONTRACT_ADDR, from_hex(obj.address))
-    out += tlv(CalldataDescriptorEnumValueTag.SELECTOR, from_hex(obj.selector))
-    out += tlv(CalldataDescriptorEnumValueTag.ID, obj.id.to_bytes(1))
-    out += tlv(CalldataDescriptorEnumValueTag.VALUE, obj.value.to_bytes(1))
-    out += tlv(CalldataDescriptorEnumValueTag.NAME, obj.name)
-    return out
+    writer.integer(CalldataDescriptorEnumValueTag.VERSION, obj.version, 1)
+    writer.integer(CalldataDescriptorEnumValueTag.CHAIN_ID, obj.chain_id, 8)
+    writer.hex(CalldataDescriptorEnumValueTag.CONTRACT_ADDR, obj.address)
+    writer.hex(CalldataDescriptorEnumValueTag.SELECTOR, obj.selector)
+    writer.integer(CalldataDescriptorEnumValueTag.ID, obj.id, 1)
+    writer.integer(CalldataDescriptorEnumValueTag.VALUE, obj.value, 1)
+    writer.tlv(CalldataDescriptorEnumValueTag.NAME, obj.name)
 
 
-def tlv_field(obj: CalldataDescriptorInstructionFieldV1) -> bytes:
+def write_field(writer: TLVWriter, obj: CalldataDescriptorInstructionFieldV1) -> None:
     """
-    Encode a struct of type FIELD.
+    Write a struct of type FIELD.
 
+    @param writer: TLV writer
     @param obj: object representation of struct
-    @return: encoded struct TLV
     """
-    out = bytearray()
-    out += tlv(CalldataDescriptorFieldTag.VERSION, obj.version.to_bytes(1))
-    out += tlv(CalldataDescriptorFieldTag.NAME, obj.name)
+    writer.integer(CalldataDescriptorFieldTag.VERSION, obj.version, 1)
+    writer.tlv(CalldataDescriptorFieldTag.NAME, obj.name)
 
-    param_type: CalldataDescriptorParamType
-    param_value: bytes
     match obj.param:
         case CalldataDescriptorParamRawV1():
-            param_type = CalldataDescriptorParamType.RAW
-            param_value = tlv_param_raw(obj.param)
+            writer.integer(CalldataDescriptorFieldTag.PARAM_TYPE, CalldataDescriptorParamType.RAW.value, 1)
+            with writer.struct(CalldataDescriptorFieldTag.PARAM):
+                write_param_raw(writer, obj.param)
         case CalldataDescriptorParamAmountV1():
-            param_type = CalldataDescriptorParamType.AMOUNT
-            param_value = tlv_param_amount(obj.param)
+            writer.integer(CalldataDescriptorFieldTag.PARAM_TYPE, CalldataDescriptorParamType.AMOUNT.value, 1)
+            with writer.struct(CalldataDescriptorFieldTag.PARAM):
+                write_param_amount(writer, obj.param)
         case CalldataDescriptorParamTokenAmountV1():
-            param_type = CalldataDescriptorParamType.TOKEN_AMOUNT
-            param_value = tlv_param_token_amount(obj.param)
+            writer.integer(CalldataDescriptorFieldTag.PARAM_TYPE, CalldataDescriptorParamType.TOKEN_AMOUNT.value, 1)
+            with writer.struct(CalldataDescriptorFieldTag.PARAM):
+                write_param_token_amount(writer, obj.param)
         case CalldataDescriptorParamNFTV1():
-            param_type = CalldataDescriptorParamType.NFT
-            param_value = tlv_param_nft(obj.param)
+            writer.integer(CalldataDescriptorFieldTag.PARAM_TYPE, CalldataDescriptorParamType.NFT.value, 1)
+            with writer.struct(CalldataDescriptorFieldTag.PARAM):
+                write_param_nft(writer, obj.param)
         case CalldataDescriptorParamDatetimeV1():
-            param_type = CalldataDescriptorParamType.DATETIME
-            param_value = tlv_param_datetime(obj.param)
+            writer.integer(CalldataDescriptorFieldTag.PARAM_TYPE, CalldataDescriptorParamType.DATETIME.value, 1)
+            with writer.struct(CalldataDescriptorFieldTag.PARAM):
+                write_param_datetime(writer, obj.param)
         case CalldataDescriptorParamDurationV1():
-            param_type = CalldataDescriptorParamType.DURATION
-            param_value = tlv_param_duration(obj.param)
+            writer.integer(CalldataDescriptorFieldTag.PARAM_TYPE, CalldataDescriptorParamType.DURATION.value, 1)
+            with writer.struct(CalldataDescriptorFieldTag.PARAM):
+                write_param_duration(writer, obj.param)
         case CalldataDescriptorParamUnitV1():
-            param_type = CalldataDescriptorParamType.UNIT
-            param_value = tlv_param_unit(obj.param)
+            writer.integer(CalldataDescriptorFieldTag.PARAM_TYPE, CalldataDescriptorParamType.UNIT.value, 1)
+            with writer.struct(CalldataDescriptorFieldTag.PARAM):
+                write_param_unit(writer, obj.param)
         case CalldataDescriptorParamEnumV1():
-            param_type = CalldataDescriptorParamType.ENUM
-            param_value = tlv_param_enum(obj.param)
+            writer.integer(CalldataDescriptorFieldTag.PARAM_TYPE, CalldataDescriptorParamType.ENUM.value, 1)
+            with writer.struct(CalldataDescriptorFieldTag.PARAM):
+                write_param_enum(writer, obj.param)
         case CalldataDescriptorParamTrustedNameV1():
-            param_type = CalldataDescriptorParamType.TRUSTED_NAME
-            param_value = tlv_param_trusted_name(obj.param)
+            writer.integer(CalldataDescriptorFieldTag.PARAM_TYPE, CalldataDescriptorParamType.TRUSTED_NAME.value, 1)
+            with writer.struct(CalldataDescriptorFieldTag.PARAM):
+                write_param_trusted_name(writer, obj.param)
         case _:
             assert_never(obj.param)
 
-    out += tlv(CalldataDescriptorFieldTag.PARAM_TYPE, param_type.value.to_bytes(1))
-    out += tlv(CalldataDescriptorFieldTag.PARAM, param_value)
 
-    return out
-
-
-def tlv_param_raw(obj: CalldataDescriptorParamRawV1) -> bytes:
+def write_param_raw(writer: TLVWriter, obj: CalldataDescriptorParamRawV1) -> None:
     """
-    Encode a struct of type PARAM_RAW.
+    Write a struct of type PARAM_RAW.
 
+    @param writer: TLV writer
     @param obj: object representation of struct
-    @return: encoded struct TLV
     """
-    out = bytearray()
-    out += tlv(CalldataDescriptorParamRawTag.VERSION, obj.version.to_bytes(1))
-    out += tlv(CalldataDescriptorParamRawTag.VALUE, tlv_value(obj.value))
-    return out
+    writer.integer(CalldataDescriptorParamRawTag.VERSION, obj.version, 1)
+    with writer.struct(CalldataDescriptorParamRawTag.VALUE):
+        write_value(writer, obj.value)
 
 
-def tlv_param_amount(obj: CalldataDescriptorParamAmountV1) -> bytes:
+def write_param_amount(writer: TLVWriter, obj: CalldataDescriptorParamAmountV1) -> None:
     """
-    Encode a struct of type PARAM_AMOUNT.
+    Write a struct of type PARAM_AMOUNT.
 
+    @param writer: TLV writer
     @param obj: object representation of struct
-    @return: encoded struct TLV
     """
-    out = bytearray()
-    out += tlv(CalldataDescriptorParamAmountTag.VERSION, obj.version.to_bytes(1))
-    out += tlv(CalldataDescriptorParamAmountTag.VALUE, tlv_value(obj.value))
-    return out
+    writer.integer(CalldataDescriptorParamAmountTag.VERSION, obj.version, 1)
+    with writer.struct(CalldataDescriptorParamAmountTag.VALUE):
+        write_value(writer, obj.value)
 
 
-def tlv_param_token_amount(obj: CalldataDescriptorParamTokenAmountV1) -> bytes:
+def write_param_token_amount(writer: TLVWriter, obj: CalldataDescriptorParamTokenAmountV1) -> None:
     """
-    Encode a struct of type PARAM_TOKEN_AMOUNT.
+    Write a struct of type PARAM_TOKEN_AMOUNT.
 
+    @param writer: TLV writer
     @param obj: object representation of struct
-    @return: encoded struct TLV
     """
-    out = bytearray()
-    out += tlv(CalldataDescriptorParamTokenAmountTag.VERSION, obj.version.to_bytes(1))
-    out += tlv(CalldataDescriptorParamTokenAmountTag.VALUE, tlv_value(obj.value))
+    writer.integer(CalldataDescriptorParamTokenAmountTag.VERSION, obj.version, 1)
+    with writer.struct(CalldataDescriptorParamTokenAmountTag.VALUE):
+        write_value(writer, obj.value)
 
     if (token := obj.token) is not None:
-        out += tlv(CalldataDescriptorParamTokenAmountTag.TOKEN, tlv_value(token))
+        with writer.struct(CalldataDescriptorParamTokenAmountTag.TOKEN):
+            write_value(writer, token)
 
     if (native_currencies := obj.native_currencies) is not None:
         for currency in native_currencies:
-            out += tlv(CalldataDescriptorParamTokenAmountTag.NATIVE_CURRENCY, from_hex(currency))
+            writer.hex(CalldataDescriptorParamTokenAmountTag.NATIVE_CURRENCY, currency)
 
     if (threshold := obj.threshold) is not None:
-        out += tlv(CalldataDescriptorParamTokenAmountTag.THRESHOLD, from_hex(threshold))
+        writer.hex(CalldataDescriptorParamTokenAmountTag.THRESHOLD, threshold)
 
     if (above_threshold_message := obj.above_threshold_message) is not None:
-        out += tlv(CalldataDescriptorParamTokenAmountTag.ABOVE_THRESHOLD_MSG, above_threshold_message)
-
-    return out
+        writer.tlv(CalldataDescriptorParamTokenAmountTag.ABOVE_THRESHOLD_MSG, above_threshold_message)
 
 
-def tlv_param_nft(obj: CalldataDescriptorParamNFTV1) -> bytes:
+def write_param_nft(writer: TLVWriter, obj: CalldataDescriptorParamNFTV1) -> None:
     """
-    Encode a struct of type PARAM_NFT.
+    Write a struct of type PARAM_NFT.
 
+    @param writer: TLV writer
     @param obj: object representation of struct
-    @return: encoded struct TLV
     """
-    out = bytearray()
-    out += tlv(CalldataDescriptorParamNFTTag.VERSION, obj.version.to_bytes(1))
-    out += tlv(CalldataDescriptorParamNFTTag.VALUE, tlv_value(obj.value))
-    out += tlv(CalldataDescriptorParamNFTTag.COLLECTION, tlv_value(obj.collection))
-    return out
+    writer.integer(CalldataDescriptorParamNFTTag.VERSION, obj.version, 1)
+    with writer.struct(CalldataDescriptorParamNFTTag.VALUE):
+        write_value(writer, obj.value)
+    with writer.struct(CalldataDescriptorParamNFTTag.COLLECTION):
+        write_value(writer, obj.collection)
 
 
-def tlv_param_datetime(obj: CalldataDescriptorParamDatetimeV1) -> bytes:
+def write_param_datetime(writer: TLVWriter, obj: CalldataDescriptorParamDatetimeV1) -> None:
     """
-    Encode a struct of type PARAM_DATETIME.
+    Write a struct of type PARAM_DATETIME.
 
+    @param writer: TLV writer
     @param obj: object representation of struct
-    @return: encoded struct TLV
     """
-    out = bytearray()
-    out += tlv(CalldataDescriptorParamDateTimeTag.VERSION, obj.version.to_bytes(1))
-    out += tlv(CalldataDescriptorParamDateTimeTag.VALUE, tlv_value(obj.value))
-    out += tlv(CalldataDescriptorParamDateTimeTag.TYPE, obj.date_type.to_bytes(1))
-    return out
+    writer.integer(CalldataDescriptorParamDateTimeTag.VERSION, obj.version, 1)
+    with writer.struct(CalldataDescriptorParamDateTimeTag.VALUE):
+        write_value(writer, obj.value)
+    writer.integer(CalldataDescriptorParamDateTimeTag.TYPE, obj.date_type, 1)
 
 
-def tlv_param_duration(obj: CalldataDescriptorParamDurationV1) -> bytes:
+def write_param_duration(writer: TLVWriter, obj: CalldataDescriptorParamDurationV1) -> None:
     """
-    Encode a struct of type PARAM_DURATION.
+    Write a struct of type PARAM_DURATION.
 
+    @param writer: TLV writer
     @param obj: object representation of struct
-    @return: encoded struct TLV
     """
-    out = bytearray()
-    out += tlv(CalldataDescriptorParamDurationTag.VERSION, obj.version.to_bytes(1))
-    out += tlv(CalldataDescriptorParamDurationTag.VALUE, tlv_value(obj.value))
-    return out
+    writer.integer(CalldataDescriptorParamDurationTag.VERSION, obj.version, 1)
+    with writer.struct(CalldataDescriptorParamDurationTag.VALUE):
+        write_value(writer, obj.value)
 
 
-def tlv_param_unit(obj: CalldataDescriptorParamUnitV1) -> bytes:
+def write_param_unit(writer: TLVWriter, obj: CalldataDescriptorParamUnitV1) -> None:
     """
-    Encode a struct of type PARAM_UNIT.
+    Write a struct of type PARAM_UNIT.
 
+    @param writer: TLV writer
     @param obj: object representation of struct
-    @return: encoded struct TLV
     """
-    out = bytearray()
-    out += tlv(CalldataDescriptorParamUnitTag.VERSION, obj.version.to_bytes(1))
-    out += tlv(CalldataDescriptorParamUnitTag.VALUE, tlv_value(obj.value))
-    out += tlv(CalldataDescriptorParamUnitTag.BASE, obj.base)
+    writer.integer(CalldataDescriptorParamUnitTag.VERSION, obj.version, 1)
+    with writer.struct(CalldataDescriptorParamUnitTag.VALUE):
+        write_value(writer, obj.value)
+    writer.tlv(CalldataDescriptorParamUnitTag.BASE, obj.base)
 
     if (decimals := obj.decimals) is not None:
-        out += tlv(CalldataDescriptorParamUnitTag.DECIMALS, decimals.to_bytes(1))
+        writer.integer(CalldataDescriptorParamUnitTag.DECIMALS, decimals, 1)
 
     if (prefix := obj.prefix) is not None:
-        out += tlv(CalldataDescriptorParamUnitTag.PREFIX, prefix.to_bytes(1))
+        writer.integer(CalldataDescriptorParamUnitTag.PREFIX, prefix, 1)
 
-    return out
 
-
-def tlv_param_enum(obj: CalldataDescriptorParamEnumV1) -> bytes:
+def write_param_enum(writer: TLVWriter, obj: CalldataDescriptorParamEnumV1) -> None:
     """
-    Encode a struct of type PARAM_ENUM.
+    Write a struct of type PARAM_ENUM.
 
+    @param writer: TLV writer
     @param obj: object representation of struct
-    @return: encoded struct TLV
     """
-    out = bytearray()
-    out += tlv(CalldataDescriptorParamEnumTag.VERSION, obj.version.to_bytes(1))
-    out += tlv(CalldataDescriptorParamEnumTag.VALUE, tlv_value(obj.value))
-    out += tlv(CalldataDescriptorParamEnumTag.ID, obj.id.to_bytes(1))
-    return out
+    writer.integer(CalldataDescriptorParamEnumTag.VERSION, obj.version, 1)
+    with writer.struct(CalldataDescriptorParamEnumTag.VALUE):
+        write_value(writer, obj.value)
+    writer.integer(CalldataDescriptorParamEnumTag.ID, obj.id, 1)
 
 
-def tlv_param_trusted_name(obj: CalldataDescriptorParamTrustedNameV1) -> bytes:
+def write_param_trusted_name(writer: TLVWriter, obj: CalldataDescriptorParamTrustedNameV1) -> None:
     """
-    Encode a struct of type PARAM_TRUSTED_NAME.
+    Write a struct of type PARAM_TRUSTED_NAME.
 
+    @param writer: TLV writer
     @param obj: object representation of struct
-    @return: encoded struct TLV
     """
-    out = bytearray()
-    out += tlv(CalldataDescriptorParamTrustedNameTag.VERSION, obj.version.to_bytes(1))
-    out += tlv(CalldataDescriptorParamTrustedNameTag.VALUE, tlv_value(obj.value))
-
-    out_types = bytearray()
-    for name_type in obj.types:
-        out_types += TrustedNameType(name_type).int_value.to_bytes(1)
-    out += tlv(CalldataDescriptorParamTrustedNameTag.TYPES, out_types)
-
-    out_sources = bytearray()
-    for name_source in obj.sources:
-        out_sources += TrustedNameSource(name_source).int_value.to_bytes(1)
-    out += tlv(CalldataDescriptorParamTrustedNameTag.SOURCES, out_sources)
-
-    return out
-
-
-def tlv_value(obj: CalldataDescriptorValueV1) -> bytes:
+    writer.integer(CalldataDescriptorParamTrustedNameTag.VERSION, obj.version, 1)
+    with writer.struct(CalldataDescriptorParamTrustedNameTag.VALUE):
+        write_value(writer, obj.value)
+    writer.tlv(
+        CalldataDescriptorParamTrustedNameTag.TYPES,
+        bytes(TrustedNameType(name_type).int_value for name_type in obj.types),
+    )
+    writer.tlv(
+        CalldataDescriptorParamTrustedNameTag.SOURCES,
+        bytes(TrustedNameSource(name_source).int_value for name_source in obj.sources),
+    )
+
+
+def write_value(writer: TLVWriter, obj: CalldataDescriptorValueV1) -> None:
     """
-    Encode a struct of type VALUE.
+    Write a struct of type VALUE.
 
+    @param writer: TLV writer
     @param obj: object representation of struct
-    @return: encoded struct TLV
     """
-    out = bytearray()
-    out += tlv(CalldataDescriptorValueTag.VERSION, obj.version.to_bytes(1))
-    out += tlv(CalldataDescriptorValueTag.TYPE_FAMILY, obj.type_family.value.to_bytes(1))
+    writer.integer(CalldataDescriptorValueTag.VERSION, obj.version, 1)
+    writer.integer(CalldataDescriptorValueTag.TYPE_FAMILY, obj.type_family.value, 1)
 
     if (type_size := obj.type_size) is not None:
         try:
-            out += tlv(CalldataDescriptorValueTag.TYPE_SIZE, type_size.to_bytes(1))
+            writer.integer(CalldataDescriptorValueTag.TYPE_SIZE, type_size, 1)
         except OverflowError:
             raise OverflowError(f"Type {obj.type_family} with size {type_size} bits is too big to convert") from None
 
@@ -453,64 +512,54 @@ def tlv_value(obj: CalldataDescriptorValueV1) -> bytes:
         case CalldataDescriptorValuePathV1() as path:
             match path.binary_path:
                 case CalldataDescriptorContainerPathV1() as container_path:
-                    out += tlv(CalldataDescriptorValueTag.CONTAINER_PATH, container_path.value.to_bytes(1))
+                    writer.integer(CalldataDescriptorValueTag.CONTAINER_PATH, container_path.value, 1)
                 case CalldataDescriptorDataPathV1() as data_path:
-                    out_path = bytearray()
-                    out_path += tlv(CalldataDescriptorPathElementTag.VERSION, path.version.to_bytes(1))
-                    for element in data_path.elements:
-                        out_path += tlv_data_path_element(element)
-                    out += tlv(CalldataDescriptorValueTag.DATA_PATH, out_path)
+                    with writer.struct(CalldataDescriptorValueTag.DATA_PATH):
+                        writer.integer(CalldataDescriptorPathElementTag.VERSION, path.version, 1)
+                        for element in data_path.elements:
+                            write_data_path_element(writer, element)
                 case _:
                     assert_never(path.binary_path)
         case CalldataDescriptorValueConstantV1() as constant:
-            out += tlv(CalldataDescriptorValueTag.CONSTANT, from_hex(constant.raw))
+            writer.hex(CalldataDescriptorValueTag.CONSTANT, constant.raw)
         case _:
             assert_never(obj)
 
-    return out
-
 
-def tlv_data_path_element(obj: CalldataDescriptorPathElementV1) -> bytes:
+def write_data_path_element(writer: TLVWriter, obj: CalldataDescriptorPathElementV1) -> None:
     """
-    Encode a struct of type PATH_ELEMENT.
+    Write a struct of type PATH_ELEMENT.
 
+    @param writer: TLV writer
     @param obj: object representation of struct
-    @return: encoded struct TLV
     """
-    out = bytearray()
     match obj:
         case CalldataDescriptorPathElementTupleV1() as tup:
-            out += tlv(CalldataDescriptorPathElementTag.TUPLE, tup.offset.to_bytes(2))
+            writer.integer(CalldataDescriptorPathElementTag.TUPLE, tup.offset, 2)
 
         case CalldataDescriptorPathElementArrayV1() as arr:
-            array_out = bytearray()
-            array_out += tlv(CalldataDescriptorPathArrayElementTag.WEIGHT, arr.weight.to_bytes(1))
-
-            if (start := arr.start) is not None:
-                array_out += tlv(CalldataDescriptorPathArrayElementTag.START, start.to_bytes(2, signed=True))
+            with writer.struct(CalldataDescriptorPathElementTag.ARRAY):
+                writer.integer(CalldataDescriptorPathArrayElementTag.WEIGHT, arr.weight, 1)
 
-            if (end := arr.end) is not None:
-                array_out += tlv(CalldataDescriptorPathArrayElementTag.END, end.to_bytes(2, signed=True))
+                if (start := arr.start) is not None:
+                    writer.integer(CalldataDescriptorPathArrayElementTag.START, start, 2, signed=True)
 
-            out += tlv(CalldataDescriptorPathElementTag.ARRAY, bytes(array_out))
+                if (end := arr.end) is not None:
+                    writer.integer(CalldataDescriptorPathArrayElementTag.END, end, 2, signed=True)
 
         case CalldataDescriptorPathElementRefV1():
-            out += tlv(CalldataDescriptorPathElementTag.REF)
+            writer.tlv(CalldataDescriptorPathElementTag.REF)
 
         case CalldataDescriptorPathElementLeafV1() as leaf:
-            out += tlv(CalldataDescriptorPathElementTag.LEAF, leaf.leaf_type.value.to_bytes(1))
+            writer.integer(CalldataDescriptorPathElementTag.LEAF, leaf.leaf_type.value, 1)
 
         case CalldataDescriptorPathElementSliceV1() as slice:
-            slice_out = bytearray()
-
-            if (start := slice.start) is not None:
-                slice_out += tlv(CalldataDescriptorPathSliceElementTag.START, start.to_bytes(2, signed=True))
-
-            if (end := slice.end) is not None:
-                slice_out += tlv(CalldataDescriptorPathSliceElementTag.END, end.to_bytes(2, signed=True))
+            with writer.struct(CalldataDescriptorPathElementTag.SLICE):
+                if (start := slice.start) is not None:
+                    writer.integer(CalldataDescriptorPathSliceElementTag.START, start, 2, signed=True)
 
-            out += tlv(CalldataDescriptorPathElementTag.SLICE, bytes(slice_out))
+                if (end := slice.end) is not None:
+                    writer.integer(CalldataDescriptorPathSliceElementTag.END, end, 2, signed=True)
 
         case _:
             assert_never(obj)
-    return out
@@ -1,21 +1,34 @@
+import sys
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
+from functools import cache
 from typing import Any, assert_never, override
 
-from pydantic import TypeAdapter, ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from typing_extensions import TypeVar
 
 from erc7730.common.output import OutputAdder
 from erc7730.common.properties import get_property
 from erc7730.model.input.descriptor import InputERC7730Descriptor
 from erc7730.model.input.path import ContainerPathStr, DataPathStr
-from erc7730.model.paths import ROOT_DESCRIPTOR_PATH, ArrayElement, ContainerPath, DataPath, DescriptorPath, Field
-from erc7730.model.paths.path_ops import descriptor_path_append, to_absolute
+from erc7730.model.paths import ArrayElement, ContainerPath, DataPath, DescriptorPath, Field
+from erc7730.model.paths.path_keys import DescriptorPathKey
+from erc7730.model.paths.path_ops import to_absolute
 from erc7730.model.types import MixedCaseAddress
 
 _T = TypeVar("_T", covariant=True)
 
 
+@cache
+def _address_adapter() -> TypeAdapter[MixedCaseAddress]:
+    return TypeAdapter(MixedCaseAddress)
+
+
+@cache
+def _path_adapter() -> TypeAdapter[DataPath | ContainerPath]:
+    return TypeAdapter(DataPathStr | ContainerPathStr)
+
+
 class ConstantProvider(ABC):
     """
     Resolver for constants values referenced by descriptor paths.
@@ -71,7 +84,7 @@ class ConstantProvider(ABC):
                     if path.absolute:
                         return True
                     try:
-                        TypeAdapter(MixedCaseAddress).validate_strings(str(path))
+                        _address_adapter().validate_strings(str(path))
                         out.error(
                             title="Invalid data path",
                             message=f""""{path}" is invalid, it must contain a data path to the address in the """
@@ -99,7 +112,7 @@ class ConstantProvider(ABC):
                 message=f"Constant path defined at {value} must be a path string, got {type(resolved_value).__name__}.",
             )
 
-        match TypeAdapter(DataPathStr | ContainerPathStr).validate_strings(resolved_value):
+        match _path_adapter().validate_strings(resolved_value):
             case ContainerPath() as path:
                 return path
             case DataPath() as path:
@@ -134,48 +147,65 @@ class ConstantProvider(ABC):
 class DefaultConstantProvider(ConstantProvider):
     """
     Resolver for constants values from a provided dictionary.
+
+    Values under the descriptor metadata (including constants) are indexed by path once, so resolving them is a single
+    lookup. Other paths are resolved by walking the descriptor.
     """
 
     def __init__(self, descriptor: InputERC7730Descriptor) -> None:
         self.descriptor: InputERC7730Descriptor = descriptor
+        self._values: dict[DescriptorPathKey, Any] = {}
+        self._index(descriptor.metadata, DescriptorPathKey(("metadata",)))
 
     @override
     def get(self, path: DescriptorPath, out: OutputAdder) -> Any:
-        current_target = self.descriptor
-        parent_path = ROOT_DESCRIPTOR_PATH
-        current_path = ROOT_DESCRIPTOR_PATH
+        try:
+            return self._values[DescriptorPathKey.of(path)]
+        except KeyError:
+            return self._walk(path, out)
+
+    def _index(self, value: Any, key: DescriptorPathKey) -> None:
+        self._values[key] = value
+        match value:
+            case BaseModel():
+                for name in type(value).model_fields:
+                    self._index(getattr(value, name), key.append(name))
+            case dict():
+                for name, item in value.items():
+                    self._index(item, key.append(sys.intern(name)))
+            case list():
+                for index, item in enumerate(value):
+                    self._index(item, key.append(index))
+            case _:
+                pass
 
-        for element in path.elements:
-            current_path = descriptor_path_append(current_path, element)
+    def _walk(self, path: DescriptorPath, out: OutputAdder) -> Any:
+        current_target: Any = self.descriptor
+
+        for depth, element in enumerate(path.elements):
             match element:
                 case Field(identifier=field):
                     if isinstance(current_target, Sequence):
-                        return out.error(
-                            title="Invalid constant path",
-                            message=f"""Path {current_path} is invalid, {parent_path} is an array.""",
-                        )
-                    else:
-                        try:
-                            current_target = get_property(current_target, field)
-                        except (AttributeError, KeyError):
-                            return out.error(
-                                title="Invalid constant path",
-                                message=f"""Path {current_path} is invalid, {parent_path} has no "{field}" field.""",
-                            )
+                        return _invalid_path(path, depth, f"{_prefix(path, depth)} is an array", out)
+                    try:
+                        current_target = get_property(current_target, field)
+                    except (AttributeError, KeyError):
+                        return _invalid_path(path, depth, f"""{_prefix(path, depth)} has no "{field}" field""", out)
                 case ArrayElement(index=i):
                     if not isinstance(current_target, Sequence):
-                        return out.error(
-                            title="Invalid constant path",
-                            message=f"Path {current_path} is invalid, {parent_path} is not an array.",
-                        )
+                        return _invalid_path(path, depth, f"{_prefix(path, depth)} is not an array", out)
                     if i >= len(current_target):
-                        return out.error(
-                            title="Invalid constant path",
-                            message=f"""Path {current_path} is invalid, index {i} is out of bounds.""",
-                        )
+                        return _invalid_path(path, depth, f"index {i} is out of bounds", out)
                     current_target = current_target[i]
                 case _:
                     assert_never(element)
-            parent_path = descriptor_path_append(parent_path, element)
 
         return current_target
+
+
+def _prefix(path: DescriptorPath, length: int) -> DescriptorPath:
+    return path.model_copy(update={"elements": path.elements[:length]})
+
+
+def _invalid_path(path: DescriptorPath, depth: int, reason: str, out: OutputAdder) -> None:
+    return out.error(title="Invalid constant path", message=f"Path {_prefix(path, depth + 1)} is invalid, {reason}.")
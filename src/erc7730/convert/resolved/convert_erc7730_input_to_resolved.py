@@ -9,7 +9,7 @@ from erc7730.common.output import ExceptionsToOutput, OutputAdder
 from erc7730.convert import ERC7730Converter
 from erc7730.convert.resolved.constants import ConstantProvider, DefaultConstantProvider
 from erc7730.convert.resolved.parameters import resolve_field_parameters
-from erc7730.convert.resolved.references import resolve_reference
+from erc7730.convert.resolved.references import ResolvedParametersCache, resolve_reference
 from erc7730.convert.resolved.values import resolve_field_value
 from erc7730.model.abi import ABI
 from erc7730.model.context import EIP712Schema
@@ -37,8 +37,8 @@ from erc7730.model.input.display import (
 )
 from erc7730.model.input.metadata import InputMetadata
 from erc7730.model.metadata import EnumDefinition
-from erc7730.model.paths import ROOT_DATA_PATH, Array, ArrayElement, ArraySlice, ContainerPath, DataPath, Field
-from erc7730.model.paths.path_ops import data_path_concat
+from erc7730.model.paths import ContainerPath, DataPath
+from erc7730.model.paths.path_keys import ROOT_DATA_PATH_KEY, ArrayKey, DataPathKey
 from erc7730.model.resolved.context import (
     ResolvedContract,
     ResolvedContractContext,
@@ -113,11 +113,8 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
                 if (resolved_enum := cls._resolve_enum(enum, out)) is not None:
                     resolved_enums[enum_id] = resolved_enum
 
-        return ResolvedMetadata(
-            owner=metadata.owner,
-            info=metadata.info,
-            token=metadata.token,
-            enums=resolved_enums,
+        return ResolvedMetadata.construct_trusted(
+            {"owner": metadata.owner, "info": metadata.info, "token": metadata.token, "enums": resolved_enums}
         )
 
     @classmethod
@@ -125,7 +122,7 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
         match enum:
             case HttpUrl() as url:
                 try:
-                    return client.get(url=url, model=EnumDefinition)
+                    return client.get_memoized(url=url, model=EnumDefinition)
                 except Exception as e:
                     return out.error(
                         title="Failed to fetch enum definition from URL",
@@ -143,7 +140,7 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
         if (contract := cls._resolve_contract(context.contract, out)) is None:
             return None
 
-        return ResolvedContractContext.model_validate({"$id": context.id, "contract": contract})
+        return ResolvedContractContext.construct_trusted({"$id": context.id, "contract": contract})
 
     @classmethod
     def _resolve_contract(cls, contract: InputContract, out: OutputAdder) -> ResolvedContract | None:
@@ -157,8 +154,8 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
         elif (factory := cls._resolve_factory(contract.factory, out)) is None:
             return None
 
-        return ResolvedContract(
-            abi=abi, deployments=deployments, addressMatcher=contract.addressMatcher, factory=factory
+        return ResolvedContract.construct_trusted(
+            {"abi": abi, "deployments": deployments, "addressMatcher": contract.addressMatcher, "factory": factory}
         )
 
     @classmethod
@@ -173,21 +170,23 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
 
     @classmethod
     def _resolve_deployment(cls, deployment: InputDeployment, out: OutputAdder) -> ResolvedDeployment | None:
-        return ResolvedDeployment(chainId=deployment.chainId, address=Address(deployment.address))
+        return ResolvedDeployment.construct_trusted(
+            {"chainId": deployment.chainId, "address": Address(deployment.address.lower())}
+        )
 
     @classmethod
     def _resolve_factory(cls, factory: InputFactory, out: OutputAdder) -> ResolvedFactory | None:
         if (deployments := cls._resolve_deployments(factory.deployments, out)) is None:
             return None
 
-        return ResolvedFactory(deployments=deployments, deployEvent=factory.deployEvent)
+        return ResolvedFactory.construct_trusted({"deployments": deployments, "deployEvent": factory.deployEvent})
 
     @classmethod
     def _resolve_abis(cls, abis: list[ABI] | HttpUrl, out: OutputAdder) -> list[ABI] | None:
         match abis:
             case HttpUrl() as url:
                 try:
-                    return client.get(url=url, model=list[ABI])
+                    return client.get_memoized(url=url, model=list[ABI])
                 except Exception as e:
                     return out.error(
                         title="Failed to fetch ABI from URL",
@@ -203,7 +202,7 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
         if (eip712 := cls._resolve_eip712(context.eip712, out)) is None:
             return None
 
-        return ResolvedEIP712Context.model_validate({"$id": context.id, "eip712": eip712})
+        return ResolvedEIP712Context.construct_trusted({"$id": context.id, "eip712": eip712})
 
     @classmethod
     def _resolve_eip712(cls, eip712: InputEIP712, out: OutputAdder) -> ResolvedEIP712 | None:
@@ -217,20 +216,26 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
         if (deployments := cls._resolve_deployments(eip712.deployments, out)) is None:
             return None
 
-        return ResolvedEIP712(
-            domain=domain,
-            schemas=schemas,
-            domainSeparator=eip712.domainSeparator,
-            deployments=deployments,
+        return ResolvedEIP712.construct_trusted(
+            {
+                "domain": domain,
+                "schemas": schemas,
+                "domainSeparator": eip712.domainSeparator,
+                "deployments": deployments,
+            }
         )
 
     @classmethod
     def _resolve_domain(cls, domain: InputDomain, out: OutputAdder) -> ResolvedDomain | None:
-        return ResolvedDomain(
-            name=domain.name,
-            version=domain.version,
-            chainId=domain.chainId,
-            verifyingContract=None if domain.verifyingContract is None else Address(domain.verifyingContract),
+        return ResolvedDomain.construct_trusted(
+            {
+                "name": domain.name,
+                "version": domain.version,
+                "chainId": domain.chainId,
+                "verifyingContract": None
+                if domain.verifyingContract is None
+                else Address(domain.verifyingContract.lower()),
+            }
         )
 
     @classmethod
@@ -246,7 +251,7 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
         match schema:
             case HttpUrl() as url:
                 try:
-                    return client.get(url=url, model=EIP712Schema)
+                    return client.get_memoized(url=url, model=EIP712Schema)
                 except Exception as e:
                     return out.error(
                         title="Failed to fetch EIP-712 schema from URL",
@@ -268,11 +273,12 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
     ) -> ResolvedDisplay | None:
         definitions = display.definitions or {}
         enums = enums or {}
+        references: ResolvedParametersCache = {}
         formats = {}
         for format_id, format in display.formats.items():
             if (resolved_format_id := cls._resolve_format_id(format_id, context, out)) is None:
                 return None
-            if (resolved_format := cls._resolve_format(format, definitions, enums, constants, out)) is None:
+            if (resolved_format := cls._resolve_format(format, definitions, references, enums, constants, out)) is None:
                 return None
             if resolved_format_id in formats:
                 return out.error(
@@ -286,7 +292,7 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
     @classmethod
     def _resolve_field_description(
         cls,
-        prefix: DataPath,
+        prefix: DataPathKey,
         definition: InputFieldDescription,
         enums: dict[Id, EnumDefinition],
         constants: ConstantProvider,
@@ -317,11 +323,19 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
         if (value := resolve_field_value(prefix, definition, definition.format, constants, out)) is None:
             return None
 
-        return ResolvedFieldDescription.model_validate(
+        if (label := constants.resolve(definition.label, out)) is None:
+            return None
+        if not isinstance(label, str):
+            return out.error(
+                title="Invalid constant label",
+                message=f"Label defined at {definition.label} must be a string, got {type(label).__name__}.",
+            )
+
+        return ResolvedFieldDescription.construct_trusted(
             {
                 "$id": definition.id,
                 "value": value,
-                "label": constants.resolve(definition.label, out),
+                "label": label,
                 "format": FieldFormat(definition.format) if definition.format is not None else None,
                 "params": params,
             }
@@ -356,14 +370,19 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
         cls,
         format: InputFormat,
         definitions: dict[Id, InputFieldDefinition],
+        references: ResolvedParametersCache,
         enums: dict[Id, EnumDefinition],
         constants: ConstantProvider,
         out: OutputAdder,
     ) -> ResolvedFormat | None:
-        if (fields := cls._resolve_fields(ROOT_DATA_PATH, format.fields, definitions, enums, constants, out)) is None:
+        if (
+            fields := cls._resolve_fields(
+                ROOT_DATA_PATH_KEY, format.fields, definitions, references, enums, constants, out
+            )
+        ) is None:
             return None
 
-        return ResolvedFormat.model_validate(
+        return ResolvedFormat.construct_trusted(
             {
                 "$id": format.id,
                 "intent": format.intent,
@@ -377,16 +396,21 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
     @classmethod
     def _resolve_fields(
         cls,
-        prefix: DataPath,
+        prefix: DataPathKey,
         fields: list[InputField],
         definitions: dict[Id, InputFieldDefinition],
+        references: ResolvedParametersCache,
         enums: dict[Id, EnumDefinition],
         constants: ConstantProvider,
         out: OutputAdder,
     ) -> list[ResolvedField] | None:
         resolved_fields = []
         for input_format in fields:
-            if (resolved_field := cls._resolve_field(prefix, input_format, definitions, enums, constants, out)) is None:
+            if (
+                resolved_field := cls._resolve_field(
+                    prefix, input_format, definitions, references, enums, constants, out
+                )
+            ) is None:
                 return None
             resolved_fields.extend(resolved_field)
         return resolved_fields
@@ -394,9 +418,10 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
     @classmethod
     def _resolve_field(
         cls,
-        prefix: DataPath,
+        prefix: DataPathKey,
         field: InputField,
         definitions: dict[Id, InputFieldDefinition],
+        references: ResolvedParametersCache,
         enums: dict[Id, EnumDefinition],
         constants: ConstantProvider,
         out: OutputAdder,
@@ -404,7 +429,9 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
         resolved_fields: list[ResolvedField] = []
         match field:
             case InputReference():
-                if (resolved_field := resolve_reference(prefix, field, definitions, enums, constants, out)) is None:
+                if (
+                    resolved_field := resolve_reference(prefix, field, definitions, enums, constants, out, references)
+                ) is None:
                     return None
                 resolved_fields.append(resolved_field)
             case InputFieldDescription():
@@ -414,7 +441,7 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
             case InputNestedFields():
                 if (
                     resolved_nested_fields := cls._resolve_nested_fields(
-                        prefix, field, definitions, enums, constants, out
+                        prefix, field, definitions, references, enums, constants, out
                     )
                 ) is None:
                     return None
@@ -426,9 +453,10 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
     @classmethod
     def _resolve_nested_fields(
         cls,
-        prefix: DataPath,
+        prefix: DataPathKey,
         fields: InputNestedFields,
         definitions: dict[Id, InputFieldDefinition],
+        references: ResolvedParametersCache,
         enums: dict[Id, EnumDefinition],
         constants: ConstantProvider,
         out: OutputAdder,
@@ -439,12 +467,12 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
                 message="Nested fields are only supported with data paths and not constant values.",
             )
 
-        path: DataPath
+        path: DataPathKey
         match constants.resolve_path(fields.path, out):
             case None:
                 return None
             case DataPath() as data_path:
-                path = data_path_concat(prefix, data_path)
+                path = prefix.concat(DataPathKey.of(data_path))
             case ContainerPath() as container_path:
                 return out.error(
                     title="Invalid path type",
@@ -455,20 +483,27 @@ class ERC7730InputToResolved(ERC7730Converter[InputERC7730Descriptor, ResolvedER
 
         if (
             resolved_fields := cls._resolve_fields(
-                prefix=path, fields=fields.fields, definitions=definitions, enums=enums, constants=constants, out=out
+                prefix=path,
+                fields=fields.fields,
+                definitions=definitions,
+                references=references,
+                enums=enums,
+                constants=constants,
+                out=out,
             )
         ) is None:
             return None
 
         match path.elements[-1]:
-            case Field() | ArrayElement():
+            case str() | int():
                 return resolved_fields
-            case ArraySlice():
+            case slice():
                 return out.error(
                     title="Invalid nested fields",
                     message="Using nested fields on an array slice is not allowed.",
                 )
-            case Array():
-                return [ResolvedNestedFields(value=ResolvedValuePath(path=path), fields=resolved_fields)]
+            case ArrayKey():
+                value = ResolvedValuePath.construct_trusted({"path": path.to_model()})
+                return [ResolvedNestedFields.construct_trusted({"value": value, "fields": resolved_fields})]
             case _:
                 assert_never(path.elements[-1])
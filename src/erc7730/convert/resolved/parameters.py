@@ -17,7 +17,7 @@ from erc7730.model.input.display import (
 )
 from erc7730.model.input.path import DescriptorPathStr
 from erc7730.model.metadata import EnumDefinition
-from erc7730.model.paths import DataPath
+from erc7730.model.paths.path_keys import DataPathKey
 from erc7730.model.resolved.display import (
     ResolvedAddressNameParameters,
     ResolvedCallDataParameters,
@@ -32,7 +32,7 @@ from erc7730.model.types import Address, HexStr, Id, MixedCaseAddress
 
 
 def resolve_field_parameters(
-    prefix: DataPath,
+    prefix: DataPathKey,
     params: InputFieldParameters | None,
     enums: dict[Id, EnumDefinition],
     constants: ConstantProvider,
@@ -60,7 +60,7 @@ def resolve_field_parameters(
 
 
 def resolve_address_name_parameters(
-    prefix: DataPath, params: InputAddressNameParameters, constants: ConstantProvider, out: OutputAdder
+    prefix: DataPathKey, params: InputAddressNameParameters, constants: ConstantProvider, out: OutputAdder
 ) -> ResolvedAddressNameParameters | None:
     return ResolvedAddressNameParameters(
         types=constants.resolve_or_none(params.types, out), sources=constants.resolve_or_none(params.sources, out)
@@ -68,7 +68,7 @@ def resolve_address_name_parameters(
 
 
 def resolve_calldata_parameters(
-    prefix: DataPath, params: InputCallDataParameters, constants: ConstantProvider, out: OutputAdder
+    prefix: DataPathKey, params: InputCallDataParameters, constants: ConstantProvider, out: OutputAdder
 ) -> ResolvedCallDataParameters | None:
     if (
         callee := resolve_path_or_constant_value(
@@ -89,7 +89,7 @@ def resolve_calldata_parameters(
 
 
 def resolve_token_amount_parameters(
-    prefix: DataPath, params: InputTokenAmountParameters, constants: ConstantProvider, out: OutputAdder
+    prefix: DataPathKey, params: InputTokenAmountParameters, constants: ConstantProvider, out: OutputAdder
 ) -> ResolvedTokenAmountParameters | None:
     token = resolve_path_or_constant_value(
         prefix=prefix,
@@ -137,7 +137,7 @@ def resolve_token_amount_parameters(
 
 
 def resolve_nft_parameters(
-    prefix: DataPath, params: InputNftNameParameters, constants: ConstantProvider, out: OutputAdder
+    prefix: DataPathKey, params: InputNftNameParameters, constants: ConstantProvider, out: OutputAdder
 ) -> ResolvedNftNameParameters | None:
     if (
         collection := resolve_path_or_constant_value(
@@ -155,13 +155,13 @@ def resolve_nft_parameters(
 
 
 def resolve_date_parameters(
-    prefix: DataPath, params: InputDateParameters, constants: ConstantProvider, out: OutputAdder
+    prefix: DataPathKey, params: InputDateParameters, constants: ConstantProvider, out: OutputAdder
 ) -> ResolvedDateParameters | None:
     return ResolvedDateParameters(encoding=constants.resolve(params.encoding, out))
 
 
 def resolve_unit_parameters(
-    prefix: DataPath, params: InputUnitParameters, constants: ConstantProvider, out: OutputAdder
+    prefix: DataPathKey, params: InputUnitParameters, constants: ConstantProvider, out: OutputAdder
 ) -> ResolvedUnitParameters | None:
     return ResolvedUnitParameters(
         base=constants.resolve(params.base, out),
@@ -171,7 +171,7 @@ def resolve_unit_parameters(
 
 
 def resolve_enum_parameters(
-    prefix: DataPath,
+    prefix: DataPathKey,
     params: InputEnumParameters,
     enums: dict[Id, EnumDefinition],
     constants: ConstantProvider,
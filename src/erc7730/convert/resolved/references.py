@@ -1,11 +1,11 @@
-import json
+from collections.abc import Hashable
+from functools import cache
 from typing import Any
 
 from pydantic import TypeAdapter
 
 from erc7730.common.options import first_not_none
 from erc7730.common.output import OutputAdder
-from erc7730.common.pydantic import model_to_json_str
 from erc7730.convert.resolved.constants import ConstantProvider
 from erc7730.convert.resolved.parameters import resolve_field_parameters
 from erc7730.convert.resolved.values import resolve_field_value
@@ -18,7 +18,8 @@ from erc7730.model.input.display import (
     InputReference,
 )
 from erc7730.model.metadata import EnumDefinition
-from erc7730.model.paths import DataPath, DescriptorPath, Field
+from erc7730.model.paths import DescriptorPath, Field
+from erc7730.model.paths.path_keys import DataPathKey
 from erc7730.model.paths.path_ops import descriptor_path_strip_prefix
 from erc7730.model.resolved.display import (
     ResolvedField,
@@ -29,16 +30,42 @@ from erc7730.model.types import Id
 
 DEFINITIONS_PATH = DescriptorPath(elements=[Field(identifier="display"), Field(identifier="definitions")])
 
+ResolvedParametersCache = dict[tuple[Id, Hashable, DataPathKey], ResolvedFieldParameters | None]
+"""Resolved parameters of references, by definition id, parameters overrides (frozen) and path prefix."""
+
+
+@cache
+def _parameters_adapter() -> TypeAdapter[InputFieldParameters]:
+    return TypeAdapter(InputFieldParameters)
+
 
 def resolve_reference(
-    prefix: DataPath,
+    prefix: DataPathKey,
     reference: InputReference,
     definitions: dict[Id, InputFieldDefinition],
     enums: dict[Id, EnumDefinition],
     constants: ConstantProvider,
     out: OutputAdder,
+    parameters_cache: ResolvedParametersCache | None = None,
 ) -> ResolvedField | None:
-    if (definition := _get_definition(reference.ref, definitions, out)) is None:
+    """
+    Resolve a reference to a display field definition.
+
+    Parameters of the definition, merged with the parameters overrides of the reference, are resolved once for a given
+    definition, overrides and path prefix if a cache is provided.
+
+    :param prefix: current path prefix
+    :param reference: reference to resolve
+    :param definitions: display field definitions, by id
+    :param enums: enum definitions, by id
+    :param constants: descriptor paths constants resolver
+    :param out: error handler
+    :param parameters_cache: cache of resolved parameters, shared by all references of a descriptor
+    :return: resolved field or None if error
+    """
+    if (definition_id := _get_definition_id(reference.ref, out)) is None:
+        return None
+    if (definition := _get_definition(definition_id, definitions, out)) is None:
         return None
 
     if (label := first_not_none(reference.label, definition.label)) is None:
@@ -48,36 +75,66 @@ def resolve_reference(
             f"{reference.ref}.",
         )
 
-    params: dict[str, Any] = {}
-    if (definition_params := definition.params) is not None:
-        params.update(json.loads(model_to_json_str(definition_params)))
-    if (reference_params := reference.params) is not None:
-        params.update(reference_params)
-
-    resolved_params: ResolvedFieldParameters | None = None
-
-    if params:
-        input_params: InputFieldParameters = TypeAdapter(InputFieldParameters).validate_json(json.dumps(params))
-        if (resolved_params := resolve_field_parameters(prefix, input_params, enums, constants, out)) is None:
+    key = (definition_id, _freeze(reference.params), prefix)
+    if parameters_cache is not None and key in parameters_cache:
+        resolved_params = parameters_cache[key]
+    else:
+        resolved_params = None
+        input_params = _merge_parameters(definition.params, reference.params)
+        if input_params is not None and (
+            (resolved_params := resolve_field_parameters(prefix, input_params, enums, constants, out)) is None
+        ):
             return None
+        if parameters_cache is not None:
+            parameters_cache[key] = resolved_params
 
     if (value := resolve_field_value(prefix, reference, definition.format, constants, out)) is None:
         return None
 
-    return ResolvedFieldDescription(
-        value=value,
-        label=str(constants.resolve(label, out)),
-        format=FieldFormat(definition.format),
-        params=resolved_params,
+    return ResolvedFieldDescription.construct_trusted(
+        {
+            "value": value,
+            "label": str(constants.resolve(label, out)),
+            "format": FieldFormat(definition.format),
+            "params": resolved_params,
+        }
     )
 
 
-def _get_definition(
-    ref: DescriptorPath, definitions: dict[Id, InputFieldDefinition], out: OutputAdder
-) -> InputFieldDefinition | None:
-    if (definition_id := _get_definition_id(ref, out)) is None:
+def _merge_parameters(
+    definition_params: InputFieldParameters | None, reference_params: dict[str, Any] | None
+) -> InputFieldParameters | None:
+    """
+    Merge parameters of a definition with the parameters overrides of a reference.
+
+    :param definition_params: validated parameters of the definition
+    :param reference_params: raw parameters overrides of the reference
+    :return: merged parameters, or None if no parameter is set
+    """
+    params: dict[str, Any] = {}
+    if definition_params is not None:
+        for name, field in type(definition_params).model_fields.items():
+            if (value := getattr(definition_params, name)) is not None:
+                params[field.alias or name] = value
+    if not params and not reference_params:
         return None
+    if not reference_params:
+        return definition_params
+    return _parameters_adapter().validate_python(params | reference_params, strict=False)
+
 
+def _freeze(value: Any) -> Hashable:
+    """Convert a raw JSON value to a hashable value, equal only for equal values of the same types."""
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return type(value), value
+
+
+def _get_definition(
+    definition_id: Id, definitions: dict[Id, InputFieldDefinition], out: OutputAdder
+) -> InputFieldDefinition | None:
     if (definition := definitions.get(definition_id)) is None:
         return out.error(
             title="Invalid display definition reference",
@@ -1,3 +1,4 @@
+from functools import cache
 from typing import assert_never
 
 from pydantic import TypeAdapter, ValidationError
@@ -8,13 +9,14 @@ from erc7730.convert.resolved.constants import ConstantProvider
 from erc7730.model.display import FieldFormat
 from erc7730.model.input.display import InputFieldBase
 from erc7730.model.paths import ContainerPath, DataPath, DescriptorPath
+from erc7730.model.paths.path_keys import DataPathKey
 from erc7730.model.paths.path_ops import data_or_container_path_concat
 from erc7730.model.resolved.display import ResolvedValue, ResolvedValueConstant, ResolvedValuePath
 from erc7730.model.types import HexStr, ScalarType
 
 
 def resolve_field_value(
-    prefix: DataPath,
+    prefix: DataPathKey,
     input_field: InputFieldBase,
     input_field_format: FieldFormat | None,
     constants: ConstantProvider,
@@ -65,7 +67,7 @@ def resolve_field_value(
 
 
 def resolve_path_or_constant_value(
-    prefix: DataPath,
+    prefix: DataPathKey,
     input_path: DescriptorPath | DataPath | ContainerPath | None,
     input_value: DescriptorPath | ScalarType | None,
     abi_type: ABIDataType,
@@ -93,7 +95,7 @@ def resolve_path_or_constant_value(
         if (path := constants.resolve_path(input_path, out)) is None:
             return None
 
-        return ResolvedValuePath(path=data_or_container_path_concat(prefix, path))
+        return ResolvedValuePath.construct_trusted({"path": data_or_container_path_concat(prefix.to_model(), path)})
 
     if input_value is not None:
         if (value := constants.resolve(input_value, out)) is None:
@@ -108,15 +110,22 @@ def resolve_path_or_constant_value(
         if (raw := encode_value(value, abi_type, out)) is None:
             return None
 
-        return ResolvedValueConstant(type_family=abi_type, type_size=len(raw) // 2 - 1, value=value, raw=raw)
+        return ResolvedValueConstant.construct_trusted(
+            {"type_family": abi_type, "type_size": len(raw) // 2 - 1, "value": value, "raw": raw}
+        )
 
     return None
 
 
+@cache
+def _hex_str_adapter() -> TypeAdapter[HexStr]:
+    return TypeAdapter(HexStr)
+
+
 def encode_value(value: ScalarType, abi_type: ABIDataType, out: OutputAdder) -> HexStr | None:
     if isinstance(value, str) and value.startswith("0x"):
         try:
-            return TypeAdapter(HexStr).validate_strings(value)
+            return _hex_str_adapter().validate_strings(value)
         except ValidationError:
             return out.error(
                 title="Invalid hex string",
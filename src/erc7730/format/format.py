@@ -1,10 +1,11 @@
 import os
 from concurrent.futures.thread import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from rich import print
 
-from erc7730.common.json import dict_from_json_file, dict_to_json_file
+from erc7730.common.json import dict_to_json_str, json_loads
 from erc7730.common.output import (
     AddFileOutputAdder,
     BufferAdder,
@@ -13,40 +14,48 @@ from erc7730.common.output import (
     ExceptionsToOutput,
     OutputAdder,
 )
+from erc7730.common.parallel import process_files
 from erc7730.list.list import get_erc7730_files
 
 
-def format_all_and_print_errors(paths: list[Path]) -> bool:
+def format_all_and_print_errors(paths: list[Path], jobs: int | None = None, check: bool = False) -> bool:
     """
     Format all ERC-7730 descriptor files at given paths and print errors.
 
     :param paths: paths to apply formatter on
+    :param jobs: if set, number of worker processes to use (0 for one per CPU core)
+    :param check: if set, only report files that are not formatted, without writing them
     :return: true if not errors occurred
     """
     out = DropFileOutputAdder(delegate=ConsoleOutputAdder())
 
-    count = format_all(paths, out)
+    count = format_all(paths, out, jobs, check)
+    summary = f"{'checked' if check else 'formatted'} {count} descriptor files"
 
     if out.has_errors:
-        print(f"[bold][red]formatted {count} descriptor files, some errors occurred ❌[/red][/bold]")
+        print(f"[bold][red]{summary}, some errors occurred ❌[/red][/bold]")
         return False
 
     if out.has_warnings:
-        print(f"[bold][yellow]formatted {count} descriptor files, some warnings occurred ⚠️[/yellow][/bold]")
+        print(f"[bold][yellow]{summary}, some warnings occurred ⚠️[/yellow][/bold]")
         return True
 
-    print(f"[bold][green]formatted {count} descriptor files, no errors occurred ✅[/green][/bold]")
+    print(f"[bold][green]{summary}, no errors occurred ✅[/green][/bold]")
     return True
 
 
-def format_all(paths: list[Path], out: OutputAdder) -> int:
+def format_all(paths: list[Path], out: OutputAdder, jobs: int | None = None, check: bool = False) -> int:
     """
     Format all ERC-7730 descriptor files at given paths.
 
     Paths can be files or directories, in which case all descriptor files in the directory are recursively formatted.
 
+    If jobs is set, files are formatted in a pool of worker processes, and outputs are reported in files order.
+
     :param paths: paths to apply formatter on
     :param out: output adder
+    :param jobs: if set, number of worker processes to use (0 for one per CPU core)
+    :param check: if set, only report files that are not formatted, without writing them
     :return: number of files formatted
     """
     files = list(get_erc7730_files(*paths, out=out))
@@ -58,26 +67,62 @@ def format_all(paths: list[Path], out: OutputAdder) -> int:
         return f.relative_to(root_path) if root_path is not None else None
 
     if len(files) > 1:
-        print(f"📝 formatting {len(files)} descriptor files…\n")
+        print(f"📝 {'checking' if check else 'formatting'} {len(files)} descriptor files…\n")
+
+    if jobs is not None:
+        process_files(
+            worker=partial(format_descriptor, check=check),
+            files=files,
+            out=out,
+            prolog=lambda f: _prolog(label(f) or f, check),
+            jobs=jobs,
+        )
+        return len(files)
 
     with ThreadPoolExecutor() as executor:
-        for future in (executor.submit(format_file, file, out, label(file)) for file in files):
+        for future in (executor.submit(format_file, file, out, label(file), check) for file in files):
             future.result()
 
     return len(files)
 
 
-def format_file(path: Path, out: OutputAdder, show_as: Path | None = None) -> None:
+def format_file(path: Path, out: OutputAdder, show_as: Path | None = None, check: bool = False) -> None:
     """
     Format a single ERC-7730 descriptor file.
 
     :param path: ERC-7730 descriptor file path
     :param show_as: if provided, print this label instead of the file path
     :param out: error handler
+    :param check: if set, only report an error if the file is not formatted, without writing it
     """
 
     label = path if show_as is None else show_as
     file_out = AddFileOutputAdder(delegate=out, file=path)
 
-    with BufferAdder(file_out, prolog=f"➡️ formatting [bold]{label}[/bold]…", epilog="") as out, ExceptionsToOutput(out):
-        dict_to_json_file(path, dict_from_json_file(path))
+    with BufferAdder(file_out, prolog=_prolog(label, check), epilog="") as out, ExceptionsToOutput(out):
+        format_descriptor(path, out, check)
+
+
+def format_descriptor(path: Path, out: OutputAdder, check: bool = False) -> None:
+    """
+    Format a single ERC-7730 descriptor file in place, without any output buffering.
+
+    The file is only written if formatting changes its content, so that already formatted files are left untouched
+    (including their modification time).
+
+    :param path: ERC-7730 descriptor file path
+    :param out: error handler
+    :param check: if set, only report an error if the file is not formatted, without writing it
+    """
+    content = path.read_bytes()
+    formatted = (dict_to_json_str(json_loads(content)) + "\n").encode()
+    if formatted == content:
+        return
+    if check:
+        out.error(title="File is not formatted", message="Descriptor file is not formatted, run `erc7730 format`.")
+        return
+    path.write_bytes(formatted)
+
+
+def _prolog(label: Path, check: bool = False) -> str:
+    return f"➡️ {'checking' if check else 'formatting'} [bold]{label}[/bold]…"
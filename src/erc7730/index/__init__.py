@@ -0,0 +1 @@
+"""Package implementing indexing commands to look up descriptors by deployment and selector."""
@@ -0,0 +1,181 @@
+"""
+Persistent index of a descriptors registry, mapping deployments and function selectors to the descriptor and format
+applying to them.
+
+The index allows to find the descriptor and format applying to a transaction with a single dictionary lookup, instead
+of loading and resolving every descriptor in the registry.
+"""
+
+import hashlib
+from concurrent.futures.thread import ThreadPoolExecutor
+from pathlib import Path
+
+from pydantic import Field
+from rich import print
+
+from erc7730.common.output import (
+    AddFileOutputAdder,
+    BufferAdder,
+    ConsoleOutputAdder,
+    DropFileOutputAdder,
+    ExceptionsToOutput,
+    ListOutputAdder,
+    OutputAdder,
+)
+from erc7730.convert.resolved.convert_erc7730_input_to_resolved import ERC7730InputToResolved
+from erc7730.list.list import get_erc7730_files
+from erc7730.model.base import Model
+from erc7730.model.input.descriptor import InputERC7730Descriptor
+from erc7730.model.resolved.context import ResolvedContractContext
+from erc7730.model.types import Address, Selector
+
+
+class RegistryIndexEntry(Model):
+    """Descriptor and format applying to a (chain id, contract address, selector) triple."""
+
+    descriptor: str = Field(
+        title="Descriptor", description="The descriptor file path, relative to the registry root directory."
+    )
+
+    format_key: str = Field(
+        title="Format Key", description="The format key in the descriptor display formats, as written in the file."
+    )
+
+    format_hash: str = Field(
+        title="Format Hash",
+        description="The SHA-256 digest of the resolved format, serialized as JSON, to detect format changes.",
+    )
+
+
+class RegistryIndex(Model):
+    """Index of a descriptors registry."""
+
+    entries: dict[str, RegistryIndexEntry] = Field(
+        default_factory=dict,
+        title="Entries",
+        description="Mapping of index keys (see `index_key`) to the descriptor and format applying to them.",
+    )
+
+    def lookup(self, chain_id: int, address: Address, selector: Selector) -> RegistryIndexEntry | None:
+        """
+        Look up the descriptor and format applying to a contract call.
+
+        :param chain_id: EIP-155 chain id
+        :param address: contract address (case insensitive)
+        :param selector: 4 bytes function selector, in hex string representation (case insensitive)
+        :return: index entry, or None if no descriptor applies to the contract call
+        """
+        return self.entries.get(index_key(chain_id, address, selector))
+
+
+def index_key(chain_id: int, address: Address, selector: Selector) -> str:
+    """
+    Compute the index key of a contract call.
+
+    :param chain_id: EIP-155 chain id
+    :param address: contract address (case insensitive)
+    :param selector: 4 bytes function selector, in hex string representation (case insensitive)
+    :return: index key
+    """
+    return f"{chain_id}:{address.lower()}:{selector.lower()}"
+
+
+def build_index_and_print_errors(registry: Path, output: Path) -> bool:
+    """
+    Index all ERC-7730 calldata descriptor files in a registry, write the index to a file, and print errors.
+
+    :param registry: registry root directory
+    :param output: index file path
+    :return: true if no error occurred
+    """
+    out = DropFileOutputAdder(delegate=ConsoleOutputAdder())
+
+    index = build_index(registry, out)
+    index.save(output)
+
+    if out.has_errors:
+        print(f"[bold][red]indexed {len(index.entries)} formats into {output}, some errors occurred ❌[/red][/bold]")
+        return False
+
+    if out.has_warnings:
+        print(f"[bold][yellow]indexed {len(index.entries)} formats into {output}, some warnings ⚠️[/yellow][/bold]")
+        return True
+
+    print(f"[bold][green]indexed {len(index.entries)} formats into {output}, no errors occurred ✅[/green][/bold]")
+    return True
+
+
+def build_index(registry: Path, out: OutputAdder) -> RegistryIndex:
+    """
+    Index all ERC-7730 calldata descriptor files in a registry.
+
+    Descriptors that fail to resolve are reported and skipped. If several descriptors apply to the same contract call,
+    an error is reported and the first descriptor (in path order) is indexed.
+
+    :param registry: registry root directory (or single descriptor file)
+    :param out: output adder
+    :return: registry index
+    """
+    files = list(get_erc7730_files(registry, out=out))
+    root = registry if registry.is_dir() else registry.parent
+
+    if len(files) > 1:
+        print(f"🗂️ indexing {len(files)} descriptor files…\n")
+
+    entries: dict[str, RegistryIndexEntry] = {}
+    with ThreadPoolExecutor() as executor:
+        for future in [executor.submit(index_file, file, root, out) for file in files]:
+            for key, entry in future.result().items():
+                if (existing := entries.get(key)) is not None:
+                    out.error(
+                        title="Duplicate index entry",
+                        message=f"Format {entry.format_key} of {entry.descriptor} applies to same contract call "
+                        f"{key} as format {existing.format_key} of {existing.descriptor}, it is not indexed.",
+                    )
+                else:
+                    entries[key] = entry
+
+    return RegistryIndex(entries=entries)
+
+
+def index_file(path: Path, registry: Path, out: OutputAdder) -> dict[str, RegistryIndexEntry]:
+    """
+    Index a single ERC-7730 descriptor file.
+
+    EIP-712 descriptors do not apply to contract calls, they are not indexed.
+
+    :param path: ERC-7730 descriptor file path
+    :param registry: registry root directory, descriptor paths are stored relative to it
+    :param out: error handler
+    :return: mapping of index keys to index entries
+    """
+    descriptor = path.relative_to(registry).as_posix()
+    file_out = AddFileOutputAdder(delegate=out, file=path)
+    prolog = f"➡️ indexing [bold]{descriptor}[/bold]…"
+
+    with BufferAdder(file_out, prolog=prolog, epilog="") as out, ExceptionsToOutput(out):
+        return _index_descriptor(path, descriptor, out)
+
+    return {}
+
+
+def _index_descriptor(path: Path, descriptor: str, out: OutputAdder) -> dict[str, RegistryIndexEntry]:
+    entries: dict[str, RegistryIndexEntry] = {}
+
+    input_descriptor = InputERC7730Descriptor.load(path)
+    if (resolved_descriptor := ERC7730InputToResolved().convert(input_descriptor, out)) is None:
+        return entries
+    if not isinstance(context := resolved_descriptor.context, ResolvedContractContext):
+        return entries
+
+    for format_key in input_descriptor.display.formats:
+        selector = ERC7730InputToResolved._resolve_format_id(format_key, context, ListOutputAdder())
+        if selector is None or (resolved_format := resolved_descriptor.display.formats.get(selector)) is None:
+            continue
+        format_hash = hashlib.sha256(resolved_format.model_dump_json().encode()).hexdigest()
+        for deployment in context.contract.deployments:
+            entries[index_key(deployment.chainId, deployment.address, selector)] = RegistryIndexEntry(
+                descriptor=descriptor, format_key=format_key, format_hash=format_hash
+            )
+
+    return entries
@@ -1,9 +1,11 @@
 import os
 from concurrent.futures.thread import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 
 from rich import print
 
+from erc7730.common import client
 from erc7730.common.output import (
     AddFileOutputAdder,
     BufferAdder,
@@ -11,11 +13,14 @@ from erc7730.common.output import (
     DropFileOutputAdder,
     ExceptionsToOutput,
     GithubAnnotationsAdder,
+    ListOutputAdder,
     OutputAdder,
 )
+from erc7730.common.parallel import output_from_compact, output_to_compact, process_files
 from erc7730.convert.resolved.convert_erc7730_input_to_resolved import ERC7730InputToResolved
 from erc7730.lint import ERC7730Linter
 from erc7730.lint.lint_base import MultiLinter
+from erc7730.lint.lint_cache import LintCache, LintCacheEntry
 from erc7730.lint.lint_transaction_type_classifier import ClassifyTransactionTypeLinter
 from erc7730.lint.lint_validate_abi import ValidateABILinter
 from erc7730.lint.lint_validate_display_fields import ValidateDisplayFieldsLinter
@@ -23,10 +28,12 @@ from erc7730.list.list import get_erc7730_files
 from erc7730.model.input.descriptor import InputERC7730Descriptor
 
 
-def lint_all_and_print_errors(paths: list[Path], gha: bool = False) -> bool:
+def lint_all_and_print_errors(
+    paths: list[Path], gha: bool = False, jobs: int | None = None, cache: LintCache | None = None
+) -> bool:
     out = GithubAnnotationsAdder() if gha else DropFileOutputAdder(delegate=ConsoleOutputAdder())
 
-    count = lint_all(paths, out)
+    count = lint_all(paths, out, jobs, cache)
 
     if out.has_errors:
         print(f"[bold][red]checked {count} descriptor files, some errors found ❌[/red][/bold]")
@@ -40,14 +47,18 @@ def lint_all_and_print_errors(paths: list[Path], gha: bool = False) -> bool:
     return True
 
 
-def lint_all(paths: list[Path], out: OutputAdder) -> int:
+def lint_all(paths: list[Path], out: OutputAdder, jobs: int | None = None, cache: LintCache | None = None) -> int:
     """
     Lint all ERC-7730 descriptor files at given paths.
 
     Paths can be files or directories, in which case all JSON files in the directory are recursively linted.
 
+    If jobs is set, files are linted in a pool of worker processes, and outputs are reported in files order.
+
     :param paths: paths to apply linter on
     :param out: output adder
+    :param jobs: if set, number of worker processes to use (0 for one per CPU core)
+    :param cache: if set, lint results cache to use
     :return: number of files checked
     """
     linter = MultiLinter(
@@ -69,14 +80,26 @@ def lint_all(paths: list[Path], out: OutputAdder) -> int:
     if len(files) > 1:
         print(f"🔍 checking {len(files)} descriptor files…\n")
 
+    if jobs is not None:
+        process_files(
+            worker=partial(lint_descriptor, linter=linter, cache=cache),
+            files=files,
+            out=out,
+            prolog=lambda f: _prolog(label(f) or f),
+            jobs=jobs,
+        )
+        return len(files)
+
     with ThreadPoolExecutor() as executor:
-        for future in (executor.submit(lint_file, file, linter, out, label(file)) for file in files):
+        for future in (executor.submit(lint_file, file, linter, out, label(file), cache) for file in files):
             future.result()
 
     return len(files)
 
 
-def lint_file(path: Path, linter: ERC7730Linter, out: OutputAdder, show_as: Path | None = None) -> None:
+def lint_file(
+    path: Path, linter: ERC7730Linter, out: OutputAdder, show_as: Path | None = None, cache: LintCache | None = None
+) -> None:
     """
     Lint a single ERC-7730 descriptor file.
 
@@ -84,13 +107,52 @@ def lint_file(path: Path, linter: ERC7730Linter, out: OutputAdder, show_as: Path
     :param show_as: if provided, print this label instead of the file path
     :param linter: linter instance
     :param out: error handler
+    :param cache: if set, lint results cache to use
     """
 
     label = path if show_as is None else show_as
     file_out = AddFileOutputAdder(delegate=out, file=path)
 
-    with BufferAdder(file_out, prolog=f"➡️ checking [bold]{label}[/bold]…", epilog="") as out, ExceptionsToOutput(out):
-        input_descriptor = InputERC7730Descriptor.load(path)
-        resolved_descriptor = ERC7730InputToResolved().convert(input_descriptor, out)
-        if resolved_descriptor is not None:
-            linter.lint(resolved_descriptor, out)
+    with BufferAdder(file_out, prolog=_prolog(label), epilog="") as out, ExceptionsToOutput(out):
+        lint_descriptor(path, out, linter, cache)
+
+
+def lint_descriptor(path: Path, out: OutputAdder, linter: ERC7730Linter, cache: LintCache | None = None) -> None:
+    """
+    Load, resolve and lint a single ERC-7730 descriptor file, without any output buffering.
+
+    If a cache is provided and contains up-to-date results for the descriptor, they are replayed instead. Results are
+    only stored in the cache if linting completed, and all URLs could be fetched.
+
+    :param path: ERC-7730 descriptor file path
+    :param out: error handler
+    :param linter: linter instance
+    :param cache: if set, lint results cache to use
+    """
+    if cache is None or (key := cache.key(path)) is None:
+        return _lint_descriptor(path, out, linter)
+
+    if (entry := cache.get(key)) is None:
+        file_out = ListOutputAdder()
+        completed = False
+        with client.record_fetches() as fetches, ExceptionsToOutput(file_out):
+            _lint_descriptor(path, file_out, linter)
+            completed = True
+        entry = LintCacheEntry(fetches=fetches, outputs=[output_to_compact(output) for output in file_out.outputs])
+        # do not replay transient failures (network errors, unexpected exceptions) in subsequent runs
+        if completed and None not in fetches.values():
+            cache.put(key, entry)
+
+    for output in entry.outputs:
+        out.add(output_from_compact(output))
+
+
+def _lint_descriptor(path: Path, out: OutputAdder, linter: ERC7730Linter) -> None:
+    input_descriptor = InputERC7730Descriptor.load(path)
+    resolved_descriptor = ERC7730InputToResolved().convert(input_descriptor, out)
+    if resolved_descriptor is not None:
+        linter.lint(resolved_descriptor, out)
+
+
+def _prolog(label: Path) -> str:
+    return f"➡️ checking [bold]{label}[/bold]…"
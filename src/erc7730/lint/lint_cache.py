@@ -0,0 +1,140 @@
+"""
+Content-addressed, persistent cache of lint results.
+
+Cache entries are keyed by a hash of the library version, the descriptor file and all the files it includes. Each entry
+also records the URLs fetched while linting the descriptor (ABIs, schemas, enums, reference ABIs, …) with the digest of
+their response bodies (results are not cached if some URLs could not be fetched). By default, entries are reused without
+checking these URLs, so that linting unchanged descriptors does not require network access (which is why the cache is
+opt-in on the command line):
+ - in offline mode, recorded digests are checked against the offline bundle
+ - in refresh mode, URLs are fetched again, and entries are only reused if all URLs still return the same content
+"""
+
+import hashlib
+import os
+import threading
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Any
+
+from pydantic import ValidationError
+from xdg_base_dirs import xdg_cache_home
+
+from erc7730.common import client
+from erc7730.common.bundle import Bundle
+from erc7730.common.json import load_json_with_includes
+from erc7730.common.parallel import CompactOutput
+from erc7730.model.base import Model
+
+
+class LintCacheEntry(Model):
+    """Cached lint result for a descriptor."""
+
+    fetches: dict[str, str | None]
+    outputs: list[CompactOutput]
+
+
+class LintCache:
+    """
+    Persistent cache of lint results, stored as one JSON file per entry.
+
+    Entries are reused as is by default. If refresh is set, URLs recorded in entries are fetched again to check they
+    still return the same content. If an offline bundle is set, URL digests recorded in entries are checked against it.
+
+    In refresh mode, URL digests are memoized for the lifetime of the instance, so an instance should be used for a
+    single lint run.
+    """
+
+    def __init__(self, directory: Path | None = None, refresh: bool = False, bundle: Bundle | None = None) -> None:
+        self.directory: Path = directory if directory is not None else xdg_cache_home() / "erc7730" / "lint"
+        self.refresh = refresh
+        self.bundle = bundle
+        self._digests: dict[str, str | None] = {}
+        self._bundle_urls: dict[str, str | None] | None = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        bundle_path = None if self.bundle is None else self.bundle.path
+        return {"directory": self.directory, "refresh": self.refresh, "bundle": bundle_path}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.directory = state["directory"]
+        self.refresh = state["refresh"]
+        self.bundle = None if state["bundle"] is None else Bundle(state["bundle"])
+        self._digests = {}
+        self._bundle_urls = None
+        self._lock = threading.Lock()
+
+    def key(self, path: Path) -> str | None:
+        """
+        Compute the cache key of a descriptor file.
+
+        :param path: descriptor file path
+        :return: cache key, or None if the descriptor or one of its includes cannot be read
+        """
+        digest = hashlib.sha256(_library_version().encode())
+        try:
+            for file in sorted(load_json_with_includes(path).dependencies):
+                with open(file, "rb") as f:
+                    digest.update(hashlib.sha256(f.read()).digest())
+        except Exception:
+            return None
+        return digest.hexdigest()
+
+    def get(self, key: str) -> LintCacheEntry | None:
+        """
+        Get a cache entry, if it exists and the URLs it depends on are up-to-date (see `LintCache`).
+
+        :param key: cache key
+        :return: cache entry, or None on cache miss
+        """
+        try:
+            with open(self.directory / f"{key}.json", "rb") as f:
+                entry = LintCacheEntry.model_validate_json(f.read())
+        except (OSError, ValidationError):
+            return None
+        if self.refresh:
+            if any(self._get_digest(url) != digest for url, digest in entry.fetches.items()):
+                return None
+        elif self.bundle is not None:
+            urls = self._get_bundle_urls()
+            if any(url not in urls or urls[url] != digest for url, digest in entry.fetches.items()):
+                return None
+        return entry
+
+    def put(self, key: str, entry: LintCacheEntry) -> None:
+        """
+        Store a cache entry, atomically replacing any existing entry.
+
+        :param key: cache key
+        :param entry: cache entry
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        with NamedTemporaryFile("w", dir=self.directory, suffix=".tmp", delete=False) as f:
+            f.write(entry.model_dump_json())
+        os.replace(f.name, self.directory / f"{key}.json")
+        with self._lock:
+            for url, digest in entry.fetches.items():
+                self._digests.setdefault(url, digest)
+
+    def _get_bundle_urls(self) -> dict[str, str | None]:
+        with self._lock:
+            if self._bundle_urls is None and self.bundle is not None:
+                self._bundle_urls = self.bundle.urls
+            return self._bundle_urls or {}
+
+    def _get_digest(self, url: str) -> str | None:
+        with self._lock:
+            if url in self._digests:
+                return self._digests[url]
+        digest = client.get_digest(url)
+        with self._lock:
+            return self._digests.setdefault(url, digest)
+
+
+def _library_version() -> str:
+    try:
+        return version("erc7730")
+    except PackageNotFoundError:
+        return "unknown"
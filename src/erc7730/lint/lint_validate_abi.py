@@ -1,10 +1,13 @@
 from typing import final, override
 
+from pydantic_string_url import HttpUrl
+
 from erc7730.common import client
 from erc7730.common.abi import compute_signature, get_functions
 from erc7730.common.output import OutputAdder
 from erc7730.lint import ERC7730Linter
-from erc7730.model.resolved.context import ResolvedContractContext, ResolvedEIP712Context
+from erc7730.lint.reference_abis import ReferenceABIs
+from erc7730.model.resolved.context import ResolvedContractContext, ResolvedDeployment, ResolvedEIP712Context
 from erc7730.model.resolved.descriptor import ResolvedERC7730Descriptor
 
 
@@ -14,8 +17,13 @@ class ValidateABILinter(ERC7730Linter):
     - resolves the ABI from the descriptor (URL or provided)
     - resolves the ABI from *scan (given chainId and address of descriptor)
     - => compares the two ABIs
+
+    Reference ABIs are fetched once per linter instance, and all deployments of a descriptor are fetched concurrently.
     """
 
+    def __init__(self, reference_abis: ReferenceABIs | None = None) -> None:
+        self.reference_abis = reference_abis if reference_abis is not None else ReferenceABIs()
+
     @override
     def lint(self, descriptor: ResolvedERC7730Descriptor, out: OutputAdder) -> None:
         if isinstance(descriptor.context, ResolvedEIP712Context):
@@ -28,16 +36,19 @@ class ValidateABILinter(ERC7730Linter):
     def _validate_eip712_schemas(cls, context: ResolvedEIP712Context, out: OutputAdder) -> None:
         pass  # not implemented
 
-    @classmethod
-    def _validate_contract_abis(cls, context: ResolvedContractContext, out: OutputAdder) -> None:
+    def _validate_contract_abis(self, context: ResolvedContractContext, out: OutputAdder) -> None:
         if not isinstance(context.contract.abi, list):
             raise ValueError("Contract ABIs should have been resolved")
 
         if (deployments := context.contract.deployments) is None:
             return
+
+        self.reference_abis.prefetch([(deployment.chainId, deployment.address) for deployment in deployments])
+        descriptor_abis = get_functions(context.contract.abi)
+
         for deployment in deployments:
             try:
-                if (abis := client.get_contract_abis(deployment.chainId, deployment.address)) is None:
+                if (reference_abis := self.reference_abis.get(deployment.chainId, deployment.address)) is None:
                     continue
             except Exception as e:
                 out.warning(
@@ -47,14 +58,11 @@ class ValidateABILinter(ERC7730Linter):
                 )
                 continue
 
-            reference_abis = get_functions(abis)
-            descriptor_abis = get_functions(context.contract.abi)
-            url = client.get_contract_explorer_url(deployment.chainId, deployment.address)
-
             if reference_abis.proxy:
                 return out.info(
                     title="Proxy contract",
-                    message=f"Contract {url} is likely to be a proxy, validation of descriptor ABIs skipped",
+                    message=f"Contract {_explorer_url(deployment)} is likely to be a proxy, validation of descriptor "
+                    "ABIs skipped",
                 )
 
             for selector, abi in descriptor_abis.functions.items():
@@ -62,11 +70,16 @@ class ValidateABILinter(ERC7730Linter):
                     out.warning(
                         title="Extra function",
                         message=f"Function {compute_signature(abi)} (selector: {selector}) defined in descriptor ABIs "
-                        f"does not exist in reference ABI (see {url})",
+                        f"does not exist in reference ABI (see {_explorer_url(deployment)})",
                     )
                 elif descriptor_abis.functions[selector] != reference_abis.functions[selector]:
                     out.warning(
                         title="Function mismatch",
                         message=f"Function {compute_signature(abi)} (selector: {selector}) defined in descriptor ABIs "
-                        f"does not match reference ABI (see {url})",
+                        f"does not match reference ABI (see {_explorer_url(deployment)})",
                     )
+
+
+def _explorer_url(deployment: ResolvedDeployment) -> HttpUrl:
+    # only computed when needed, as it requires fetching supported chains
+    return client.get_contract_explorer_url(deployment.chainId, deployment.address)
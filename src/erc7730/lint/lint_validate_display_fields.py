@@ -3,20 +3,16 @@ from typing import final, override
 from erc7730.common.abi import function_to_selector
 from erc7730.common.output import OutputAdder
 from erc7730.lint import ERC7730Linter
-from erc7730.model.paths import DataPath, Field
-from erc7730.model.paths.path_ops import data_path_ends_with, path_starts_with, to_absolute
+from erc7730.model.paths.path_keys import DataPathKey
 from erc7730.model.paths.path_schemas import (
-    compute_abi_schema_paths,
-    compute_eip712_schema_paths,
-    compute_format_schema_paths,
+    compute_abi_schema_path_keys,
+    compute_eip712_schema_path_keys,
+    compute_format_schema_path_keys,
 )
 from erc7730.model.resolved.context import EIP712Schema, ResolvedContractContext, ResolvedEIP712Context
 from erc7730.model.resolved.descriptor import ResolvedERC7730Descriptor
 
-AUTHORIZED_MISSING_DISPLAY_FIELDS = {
-    Field(identifier="nonce"),
-    Field(identifier="sigDeadline"),
-}
+AUTHORIZED_MISSING_DISPLAY_FIELDS = {"nonce", "sigDeadline"}
 
 
 @final
@@ -51,20 +47,20 @@ class ValidateDisplayFieldsLinter(ERC7730Linter):
                             message=f"Schema primary type `{schema.primaryType}` must have a display format defined.",
                         )
                         continue
-                    eip712_paths = compute_eip712_schema_paths(schema)
+                    eip712_paths = compute_eip712_schema_path_keys(schema)
                     primary_type_format = descriptor.display.formats[schema.primaryType]
-                    format_paths = compute_format_schema_paths(primary_type_format).data_paths
+                    format_paths = compute_format_schema_path_keys(primary_type_format).data_paths
 
                     if (excluded := primary_type_format.excluded) is not None:
-                        excluded_paths = [to_absolute(path) for path in excluded]
+                        excluded_paths = [DataPathKey.of(path).to_absolute() for path in excluded]
                     else:
                         excluded_paths = []
 
                     for path in eip712_paths - format_paths:
-                        if any(path_starts_with(path, excluded_path) for excluded_path in excluded_paths):
+                        if any(path.starts_with(excluded_path) for excluded_path in excluded_paths):
                             continue
 
-                        if any(data_path_ends_with(path, allowed) for allowed in AUTHORIZED_MISSING_DISPLAY_FIELDS):
+                        if any(path.ends_with(allowed) for allowed in AUTHORIZED_MISSING_DISPLAY_FIELDS):
                             out.debug(
                                 title="Optional Display field missing",
                                 message=f"No display field is defined for path `{path}` in message "
@@ -103,10 +99,10 @@ class ValidateDisplayFieldsLinter(ERC7730Linter):
     @classmethod
     def _validate_abi_paths(cls, descriptor: ResolvedERC7730Descriptor, out: OutputAdder) -> None:
         if isinstance(descriptor.context, ResolvedContractContext):
-            abi_paths_by_selector: dict[str, set[DataPath]] = {}
+            abi_paths_by_selector: dict[str, set[DataPathKey]] = {}
             for abi in descriptor.context.contract.abi:
                 if abi.type == "function":
-                    abi_paths_by_selector[function_to_selector(abi)] = compute_abi_schema_paths(abi)
+                    abi_paths_by_selector[function_to_selector(abi)] = compute_abi_schema_path_keys(abi)
 
             for selector, fmt in descriptor.display.formats.items():
                 if selector not in abi_paths_by_selector:
@@ -115,19 +111,19 @@ class ValidateDisplayFieldsLinter(ERC7730Linter):
                         message=f"Selector {selector} not found in ABI.",
                     )
                     continue
-                format_paths = compute_format_schema_paths(fmt).data_paths
+                format_paths = compute_format_schema_path_keys(fmt).data_paths
                 abi_paths = abi_paths_by_selector[selector]
 
                 if (excluded := fmt.excluded) is not None:
-                    excluded_paths = [to_absolute(path) for path in excluded]
+                    excluded_paths = [DataPathKey.of(path).to_absolute() for path in excluded]
                 else:
                     excluded_paths = []
 
                 for path in abi_paths - format_paths:
-                    if any(path_starts_with(path, excluded_path) for excluded_path in excluded_paths):
+                    if any(path.starts_with(excluded_path) for excluded_path in excluded_paths):
                         continue
 
-                    if any(data_path_ends_with(path, allowed) for allowed in AUTHORIZED_MISSING_DISPLAY_FIELDS):
+                    if any(path.ends_with(allowed) for allowed in AUTHORIZED_MISSING_DISPLAY_FIELDS):
                         out.debug(
                             title="Optional Display Field Missing",
                             message=f"No display field is defined for path `{path}` in function {selector}. If "
@@ -0,0 +1,114 @@
+"""
+Run-wide service fetching reference ABIs of deployed contracts, used to validate descriptor ABIs.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, final
+from uuid import uuid4
+from weakref import WeakValueDictionary
+
+from erc7730.common import client
+from erc7730.common.abi import Functions, get_functions
+from erc7730.model.types import Address
+
+DEFAULT_MAX_CONCURRENCY = 8
+"""Default maximum number of reference ABIs fetched concurrently."""
+
+
+@dataclass(frozen=True)
+class _ReferenceABIResult:
+    functions: Functions | None
+    error: Exception | None
+    fetches: dict[str, str | None]
+
+
+@final
+class ReferenceABIs:
+    """
+    Run-wide service fetching reference ABIs of deployed contracts (see `client.get_contract_abis`).
+
+    Each (chain id, address) pair is fetched at most once per instance, even if it is requested concurrently by several
+    descriptors. Fetches run in a bounded pool of threads, so that all deployments of a descriptor can be fetched
+    concurrently without flooding remote APIs.
+
+    Instances are unpickled to a single instance per process (the one they were pickled from, in the same process), so
+    that worker processes receiving the service with each chunk of files share fetched ABIs across chunks.
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY, instance_id: str | None = None) -> None:
+        self.max_concurrency = max_concurrency
+        self.instance_id = instance_id if instance_id is not None else uuid4().hex
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._results: dict[tuple[int, str], Future[_ReferenceABIResult]] = {}
+        with _INSTANCES_LOCK:
+            _INSTANCES[self.instance_id] = self
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _unpickle_reference_abis, (self.instance_id, self.max_concurrency)
+
+    def prefetch(self, deployments: list[tuple[int, Address]]) -> None:
+        """
+        Start fetching reference ABIs of given deployments in the background, if not already fetched.
+
+        :param deployments: (chain id, contract address) pairs
+        """
+        for chain_id, address in deployments:
+            self._fetch(chain_id, address)
+
+    def get(self, chain_id: int, address: Address) -> Functions | None:
+        """
+        Get the functions of the reference ABI of a deployed contract, fetching it if needed.
+
+        URL fetches done to get the reference ABI are replayed in current context (see `client.record_fetches`), even
+        if they were done for another descriptor.
+
+        :param chain_id: EIP-155 chain ID
+        :param address: EVM contract address
+        :return: functions of the reference ABI, or None if not available
+        :raises Exception: if fetching the reference ABI failed
+        """
+        result = self._fetch(chain_id, address).result()
+        client.replay_fetches(result.fetches)
+        if result.error is not None:
+            raise result.error
+        return result.functions
+
+    def _fetch(self, chain_id: int, address: Address) -> Future[_ReferenceABIResult]:
+        key = (chain_id, address.lower())
+        with self._lock:
+            if (result := self._results.get(key)) is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_concurrency, thread_name_prefix="reference-abis"
+                    )
+                result = self._results[key] = self._executor.submit(_fetch_reference_abi, chain_id, address)
+        return result
+
+
+_INSTANCES: "WeakValueDictionary[str, ReferenceABIs]" = WeakValueDictionary()
+"""Instances of the current process, by instance id."""
+
+_UNPICKLED_INSTANCES: dict[str, ReferenceABIs] = {}
+"""Instances created by unpickling, kept for the lifetime of the process (worker processes only unpickle instances)."""
+
+_INSTANCES_LOCK = threading.RLock()
+
+
+def _unpickle_reference_abis(instance_id: str, max_concurrency: int) -> ReferenceABIs:
+    with _INSTANCES_LOCK:
+        if (instance := _INSTANCES.get(instance_id)) is None:
+            instance = _UNPICKLED_INSTANCES[instance_id] = ReferenceABIs(max_concurrency, instance_id)
+        return instance
+
+
+def _fetch_reference_abi(chain_id: int, address: Address) -> _ReferenceABIResult:
+    with client.record_fetches() as fetches:
+        try:
+            if (abis := client.get_contract_abis(chain_id, address)) is None:
+                return _ReferenceABIResult(functions=None, error=None, fetches=fetches)
+            return _ReferenceABIResult(functions=get_functions(abis), error=None, fetches=fetches)
+        except Exception as e:
+            return _ReferenceABIResult(functions=None, error=e, fetches=fetches)
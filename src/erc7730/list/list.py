@@ -43,7 +43,7 @@ def get_erc7730_files(*paths: Path, out: OutputAdder) -> Generator[Path, None, N
             else:
                 out.error(title="Invalid path", message=f"{path} is not an ERC-7730 descriptor file")
         elif path.is_dir():
-            for file in path.rglob("*.json"):
+            for file in sorted(path.rglob("*.json")):
                 if is_erc7730_file(file):
                     yield file
         else:
@@ -1,42 +1,21 @@
 import json
 import logging
 import os
+import sys
+from enum import StrEnum, auto
 from pathlib import Path
 from typing import Annotated, assert_never
 
-import dotenv
-
-from eip712.convert.input_to_resolved import EIP712InputToResolvedConverter
-from eip712.model.input.descriptor import InputEIP712DAppDescriptor
-from pydantic import RootModel
-from pydantic_string_url import HttpUrl
 from rich import print
 from typer import Argument, Exit, Option, Typer
 
-from erc7730.common.output import ConsoleOutputAdder
-from erc7730.convert.calldata.convert_erc7730_input_to_calldata import erc7730_descriptor_to_calldata_descriptors
-from erc7730.convert.convert import convert_to_file_and_print_errors
-from erc7730.convert.ledger.eip712.convert_eip712_to_erc7730 import EIP712toERC7730Converter
-from erc7730.convert.ledger.eip712.convert_erc7730_to_eip712 import ERC7730toEIP712Converter
-from erc7730.convert.resolved.convert_erc7730_input_to_resolved import ERC7730InputToResolved
-from erc7730.format.format import format_all_and_print_errors
-from erc7730.generate.generate import generate_descriptor
-from erc7730.lint.lint import lint_all_and_print_errors
-from erc7730.list.list import list_all
 from erc7730.model import ERC7730ModelType
-from erc7730.model.base import Model
-from erc7730.model.calldata.descriptor import CalldataDescriptor
-from erc7730.model.input.descriptor import InputERC7730Descriptor
-from erc7730.model.resolved.descriptor import ResolvedERC7730Descriptor
-from erc7730.model.types import Address
-
-dotenv.load_dotenv()
 
-if os.environ.get("DEBUG", "0") == "1":
-    logging.basicConfig(
-        format="%(levelname)s [%(asctime)s] %(name)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S", level=logging.DEBUG
-    )
+# Subcommand implementations are imported in command bodies, so that the CLI only pays for the modules it actually uses
+# (importing all converters, models and dependencies takes about a second, which is significant for pre-commit hooks).
 
+OFFLINE_HELP = "Serve all remote resources from the offline bundle, without network access (see prefetch command)"
+BUNDLE_HELP = "The offline bundle path (defaults to ~/.cache/erc7730/bundle)"
 
 app = Typer(
     name="erc7730",
@@ -54,6 +33,47 @@ convert_app = Typer(
     """,
 )
 app.add_typer(convert_app)
+index_app = Typer(
+    name="index",
+    no_args_is_help=True,
+    short_help="Commands to index descriptor files by deployment and selector.",
+    help="""
+    Commands to build and query an index of descriptor files, mapping (chain id, contract address, selector) to the
+    descriptor file and format applying to contract calls.
+    """,
+)
+app.add_typer(index_app)
+
+INDEX_HELP = "The index file path"
+DEFAULT_INDEX_PATH = Path("erc7730-index.json")
+
+
+def _configure_offline(offline: bool, bundle: Path | None) -> Path | None:
+    from erc7730.common import client
+    from erc7730.common.bundle import DEFAULT_BUNDLE_PATH
+
+    if not offline:
+        return None
+
+    bundle = bundle or DEFAULT_BUNDLE_PATH
+    # environment variable is inherited by worker processes
+    os.environ[client.OFFLINE_BUNDLE_ENV] = str(bundle)
+    client.configure(client.ClientSettings(offline_bundle=bundle))
+    return bundle
+
+
+@app.callback()
+def callback() -> None:
+    import dotenv
+
+    dotenv.load_dotenv()
+
+    if os.environ.get("DEBUG", "0") == "1":
+        logging.basicConfig(
+            format="%(levelname)s [%(asctime)s] %(name)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+            level=logging.DEBUG,
+        )
 
 
 @app.command(
@@ -66,6 +86,10 @@ app.add_typer(convert_app)
 def command_schema(
     model_type: Annotated[ERC7730ModelType, Argument(help="The descriptor form ")] = ERC7730ModelType.INPUT,
 ) -> None:
+    from erc7730.model.base import Model
+    from erc7730.model.input.descriptor import InputERC7730Descriptor
+    from erc7730.model.resolved.descriptor import ResolvedERC7730Descriptor
+
     descriptor_type: type[Model]
     match model_type:
         case ERC7730ModelType.INPUT:
@@ -88,8 +112,27 @@ def command_schema(
 def command_lint(
     paths: Annotated[list[Path], Argument(help="The files or directory paths to lint")],
     gha: Annotated[bool, Option(help="Enable Github annotations output")] = False,
+    jobs: Annotated[
+        int | None, Option(help="Lint files in N worker processes (0 for one per CPU core)", show_default=False)
+    ] = None,
+    cache: Annotated[
+        bool, Option(help="Reuse lint results of unchanged descriptors, without checking the URLs they fetched")
+    ] = False,
+    refresh: Annotated[
+        bool, Option(help="Fetch URLs used by cached lint results again, to check they did not change")
+    ] = False,
+    offline: Annotated[bool, Option(help=OFFLINE_HELP)] = False,
+    bundle: Annotated[Path | None, Option(help=BUNDLE_HELP, show_default=False)] = None,
 ) -> None:
-    if not lint_all_and_print_errors(paths, gha):
+    from erc7730.common.bundle import Bundle
+    from erc7730.lint.lint import lint_all_and_print_errors
+    from erc7730.lint.lint_cache import LintCache
+
+    bundle_path = _configure_offline(offline, bundle)
+    lint_cache = None
+    if cache:
+        lint_cache = LintCache(refresh=refresh, bundle=None if bundle_path is None else Bundle(bundle_path))
+    if not lint_all_and_print_errors(paths, gha, jobs, lint_cache):
         raise Exit(1)
 
 
@@ -103,6 +146,8 @@ def command_lint(
 def command_list(
     paths: Annotated[list[Path] | None, Argument(help="The files or directory paths to search")] = None,
 ) -> None:
+    from erc7730.list.list import list_all
+
     if not list_all(paths or [Path.cwd()]):
         raise Exit(1)
 
@@ -112,12 +157,41 @@ def command_list(
     short_help="Format descriptor files.",
     help="""
     Recursively find and format all descriptor files, starting from current directory by default.
+
+    Files that are already formatted are not written. With --check, files are not written at all, and the command
+    fails if some files are not formatted.
     """,
 )
 def command_format(
     paths: Annotated[list[Path] | None, Argument(help="The files or directory paths to search")] = None,
+    jobs: Annotated[
+        int | None, Option(help="Format files in N worker processes (0 for one per CPU core)", show_default=False)
+    ] = None,
+    check: Annotated[bool, Option(help="Only check that files are formatted, without writing them")] = False,
 ) -> None:
-    if not format_all_and_print_errors(paths or [Path.cwd()]):
+    from erc7730.format.format import format_all_and_print_errors
+
+    if not format_all_and_print_errors(paths or [Path.cwd()], jobs, check):
+        raise Exit(1)
+
+
+@app.command(
+    name="prefetch",
+    short_help="Prefetch remote dependencies of descriptor files.",
+    help="""
+    Recursively find all descriptor files, starting from current directory by default, and store all their remote
+    dependencies (ABIs, EIP-712 schemas and enums referenced by URL, reference ABIs of deployments, …) in an offline
+    bundle, so that they can be linted and resolved without network access using the --offline option.
+    """,
+)
+def command_prefetch(
+    paths: Annotated[list[Path] | None, Argument(help="The files or directory paths to search")] = None,
+    bundle: Annotated[Path | None, Option(help=BUNDLE_HELP, show_default=False)] = None,
+) -> None:
+    from erc7730.common.bundle import DEFAULT_BUNDLE_PATH, Bundle
+    from erc7730.prefetch.prefetch import prefetch_all_and_print_errors
+
+    if not prefetch_all_and_print_errors(paths or [Path.cwd()], Bundle(bundle or DEFAULT_BUNDLE_PATH)):
         raise Exit(1)
 
 
@@ -139,7 +213,14 @@ def command_format(
 )
 def command_resolve(
     input_path: Annotated[Path, Argument(help="The input ERC-7730 file path")],
+    offline: Annotated[bool, Option(help=OFFLINE_HELP)] = False,
+    bundle: Annotated[Path | None, Option(help=BUNDLE_HELP, show_default=False)] = None,
 ) -> None:
+    from erc7730.common.output import ConsoleOutputAdder
+    from erc7730.convert.resolved.convert_erc7730_input_to_resolved import ERC7730InputToResolved
+    from erc7730.model.input.descriptor import InputERC7730Descriptor
+
+    _configure_offline(offline, bundle)
     input_descriptor = InputERC7730Descriptor.load(input_path)
     if (resolved_descriptor := ERC7730InputToResolved().convert(input_descriptor, ConsoleOutputAdder())) is None:
         raise Exit(1)
@@ -165,6 +246,10 @@ def command_generate(
     local: Annotated[bool, Option(help="Use local artifact data from environment variables (set by Hardhat plugin)")] = False,
     output: Annotated[Path | None, Option(help="Output file path for the generated ERC-7730 descriptor")] = None,
 ) -> None:
+    from pydantic_string_url import HttpUrl
+
+    from erc7730.generate.generate import generate_descriptor
+
     if schema is not None and abi is not None:
         print("Cannot specify both ABI and schema.")
         raise Exit(1)
@@ -268,26 +353,78 @@ def command_generate(
         print(result_json)
 
 
+class CalldataFormat(StrEnum):
+    """
+    The output format of the calldata command.
+    """
+
+    JSON = auto()
+    BINARY = auto()
+
+
 @app.command(
     name="calldata",
-    short_help="Display calldata descriptors for an ERC-7730 file.",
+    short_help="Display calldata descriptors for ERC-7730 files.",
     help="""
-    Display calldata descriptor(s) for an ERC-7730 file.
+    Display calldata descriptor(s) for ERC-7730 files.
+
+    If a single file is given, calldata descriptors are printed as a JSON array. If several files or directories are
+    given (or with --ndjson), descriptor files are converted recursively and calldata descriptors are streamed as
+    newline delimited JSON (one calldata descriptor per line), as soon as each file is converted.
+
+    With --format=binary, calldata descriptors are streamed as raw TLV frames instead of JSON: each calldata
+    descriptor is a TRANSACTION_INFO frame, followed by its ENUM_VALUE and FIELD frames, each frame being made of its
+    type (1 byte), its length (2 bytes, big endian) and the TLV struct.
     """,
 )
 def command_calldata(
-    input_erc7730_path: Annotated[Path, Argument(help="The input ERC-7730 file path")],
-    source: Annotated[str | None, Option(help="Source URL of the descriptor file")] = None,
+    paths: Annotated[list[Path], Argument(help="The input ERC-7730 files or directory paths")],
+    source: Annotated[
+        str | None, Option(help="Source URL of the descriptor file (or base URL of the directory)")
+    ] = None,
     chain_id: Annotated[int | None, Option(help="Only emit calldata descriptors for given chain ID")] = None,
+    ndjson: Annotated[bool, Option(help="Stream calldata descriptors as newline delimited JSON")] = False,
+    format: Annotated[
+        CalldataFormat, Option(help="Output format (JSON with hex encoded structs, or binary TLV frames)")
+    ] = CalldataFormat.JSON,
+    output: Annotated[Path | None, Option(help="Output file path (defaults to stdout)", show_default=False)] = None,
+    jobs: Annotated[
+        int | None, Option(help="Convert files in N worker processes (0 for one per CPU core)", show_default=False)
+    ] = None,
 ) -> None:
-    input_descriptor = InputERC7730Descriptor.load(input_erc7730_path)
+    binary = format == CalldataFormat.BINARY
+    if binary or ndjson or len(paths) > 1 or paths[0].is_dir():
+        from erc7730.convert.calldata.stream import calldata_all_and_print_errors
+
+        if output is None:
+            stdout = sys.stdout.buffer if binary else sys.stdout
+            success = calldata_all_and_print_errors(paths, stdout, source, chain_id, jobs, binary)
+            stdout.flush()
+        else:
+            with open(output, "wb") if binary else open(output, "w", encoding="utf-8") as f:
+                success = calldata_all_and_print_errors(paths, f, source, chain_id, jobs, binary)
+        if not success:
+            raise Exit(1)
+        return
+
+    from pydantic import RootModel
+    from pydantic_string_url import HttpUrl
+
+    from erc7730.convert.calldata.convert_erc7730_input_to_calldata import erc7730_descriptor_to_calldata_descriptors
+    from erc7730.model.calldata.descriptor import CalldataDescriptor
+    from erc7730.model.input.descriptor import InputERC7730Descriptor
+
+    input_descriptor = InputERC7730Descriptor.load(paths[0])
 
     model = RootModel[list[CalldataDescriptor]](
         erc7730_descriptor_to_calldata_descriptors(
             input_descriptor, source=HttpUrl(source) if source is not None else None, chain_id=chain_id
         )
     )
-    print(model.model_dump_json(indent=2, exclude_none=True))
+    if output is None:
+        print(model.model_dump_json(indent=2, exclude_none=True))
+    else:
+        output.write_text(model.model_dump_json(indent=2, exclude_none=True), encoding="utf-8")
 
 
 if __name__ == "__main__":
@@ -305,6 +442,12 @@ def command_convert_eip712_to_erc7730(
     input_eip712_path: Annotated[Path, Argument(help="The input EIP-712 file path")],
     output_erc7730_path: Annotated[Path, Argument(help="The output ERC-7730 file path")],
 ) -> None:
+    from eip712.convert.input_to_resolved import EIP712InputToResolvedConverter
+    from eip712.model.input.descriptor import InputEIP712DAppDescriptor
+
+    from erc7730.convert.convert import convert_to_file_and_print_errors
+    from erc7730.convert.ledger.eip712.convert_eip712_to_erc7730 import EIP712toERC7730Converter
+
     input_descriptor = InputEIP712DAppDescriptor.load(input_eip712_path)
     resolved_descriptor = EIP712InputToResolvedConverter().convert(input_descriptor)
     if not convert_to_file_and_print_errors(
@@ -326,6 +469,12 @@ def command_convert_erc7730_to_eip712(
     input_erc7730_path: Annotated[Path, Argument(help="The input ERC-7730 file path")],
     output_eip712_path: Annotated[Path, Argument(help="The output EIP-712 file path")],
 ) -> None:
+    from erc7730.common.output import ConsoleOutputAdder
+    from erc7730.convert.convert import convert_to_file_and_print_errors
+    from erc7730.convert.ledger.eip712.convert_erc7730_to_eip712 import ERC7730toEIP712Converter
+    from erc7730.convert.resolved.convert_erc7730_input_to_resolved import ERC7730InputToResolved
+    from erc7730.model.input.descriptor import InputERC7730Descriptor
+
     input_descriptor = InputERC7730Descriptor.load(input_erc7730_path)
     resolved_descriptor = ERC7730InputToResolved().convert(input_descriptor, ConsoleOutputAdder())
     if resolved_descriptor is None or not convert_to_file_and_print_errors(
@@ -334,3 +483,45 @@ def command_convert_erc7730_to_eip712(
         converter=ERC7730toEIP712Converter(),
     ):
         raise Exit(1)
+
+
+@index_app.command(
+    name="build",
+    short_help="Index descriptor files of a registry.",
+    help="""
+    Recursively find all calldata descriptor files in a registry, resolve them and write an index mapping
+    (chain id, contract address, selector) to the descriptor file and format applying to contract calls.
+    """,
+)
+def command_index_build(
+    registry: Annotated[Path, Argument(help="The registry root directory")],
+    output: Annotated[Path, Option(help=INDEX_HELP)] = DEFAULT_INDEX_PATH,
+    offline: Annotated[bool, Option(help=OFFLINE_HELP)] = False,
+    bundle: Annotated[Path | None, Option(help=BUNDLE_HELP, show_default=False)] = None,
+) -> None:
+    from erc7730.index.index import build_index_and_print_errors
+
+    _configure_offline(offline, bundle)
+    if not build_index_and_print_errors(registry, output):
+        raise Exit(1)
+
+
+@index_app.command(
+    name="query",
+    short_help="Find the descriptor applying to a contract call.",
+    help="""
+    Find the descriptor file and format applying to a contract call in an index built with `erc7730 index build`.
+    """,
+)
+def command_index_query(
+    chain_id: Annotated[int, Option(help="The EIP-155 chain id")],
+    address: Annotated[str, Option(help="The contract address")],
+    selector: Annotated[str, Option(help="The 4 bytes function selector")],
+    index: Annotated[Path, Option(help=INDEX_HELP)] = DEFAULT_INDEX_PATH,
+) -> None:
+    from erc7730.index.index import RegistryIndex
+
+    if (entry := RegistryIndex.load(index).lookup(chain_id, address, selector)) is None:
+        print(f"No descriptor found for selector {selector} of contract {address} on chain {chain_id}")
+        raise Exit(1)
+    print(entry.to_json_string())
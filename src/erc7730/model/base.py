@@ -4,8 +4,9 @@ Base model for library, using pydantic.
 See https://docs.pydantic.dev
 """
 
+import os
 from pathlib import Path
-from typing import Self
+from typing import Any, Self
 
 from pydantic import BaseModel, ConfigDict
 
@@ -16,6 +17,24 @@ from erc7730.common.pydantic import (
     model_to_json_str,
 )
 
+FULL_VALIDATION_ENV = "ERC7730_FULL_VALIDATION"
+"""Environment variable to validate models built from trusted values (debug switch, see `set_full_validation`)."""
+
+_full_validation = os.environ.get(FULL_VALIDATION_ENV, "0") == "1"
+
+
+def set_full_validation(enabled: bool) -> None:
+    """
+    Enable or disable full validation of models built from trusted values with `Model.construct_trusted`.
+
+    Full validation is disabled by default, it can be enabled to debug library code building invalid models. The default
+    is set from the ERC7730_FULL_VALIDATION environment variable.
+
+    :param enabled: whether models built from trusted values are validated
+    """
+    global _full_validation
+    _full_validation = enabled
+
 
 class Model(BaseModel):
     """
@@ -33,8 +52,25 @@ class Model(BaseModel):
         validate_assignment=True,
         arbitrary_types_allowed=False,
         allow_inf_nan=False,
+        defer_build=True,
     )
 
+    @classmethod
+    def construct_trusted(cls, values: dict[str, Any]) -> Self:
+        """
+        Build a model from trusted values, without validation.
+
+        Values must already be valid: fields of validated models, or models built by the library itself. They are used
+        as is, without copy or coercion. If full validation is enabled (see `set_full_validation`), values are validated
+        as with `model_validate`.
+
+        :param values: field values, keyed by field alias (or name for fields without alias)
+        :return: in-memory representation of model
+        """
+        if _full_validation:
+            return cls.model_validate(values)
+        return cls.model_construct(**values)  # type: ignore[return-value]
+
     @classmethod
     def load(cls, path: Path) -> Self:
         """
@@ -0,0 +1,304 @@
+"""
+Compact representation of paths, for internal use by the library.
+
+Path models (`DataPath`, `DescriptorPath`) are pydantic models, which are costly to build, hash and compare. Path keys
+represent the same paths as immutable tuples of plain elements (interned field identifiers, array indices, slices),
+with a cached hash. They are used by the resolver, linters and schema paths computations, and converted from/to path
+models at API boundaries only.
+"""
+
+import sys
+from enum import Enum
+from functools import lru_cache
+from typing import Final, Self, assert_never, final, override
+
+from erc7730.model.paths import (
+    Array,
+    ArrayElement,
+    ArraySlice,
+    DataPath,
+    DataPathElement,
+    DescriptorPath,
+    DescriptorPathElement,
+    Field,
+)
+
+ELEMENT_CACHE_SIZE = 4096
+"""Maximum number of path element models kept in memory (elements are immutable, so models are shared)."""
+
+
+class ArrayKey(Enum):
+    """Path key element designating all elements of an array."""
+
+    ARRAY = "[]"
+
+    @override
+    def __str__(self) -> str:
+        return self.value
+
+
+ARRAY: Final = ArrayKey.ARRAY
+
+DataPathKeyElement = str | int | slice | ArrayKey
+"""Element of a data path key: field identifier, array element index, array slice or all array elements."""
+
+DescriptorPathKeyElement = str | int
+"""Element of a descriptor path key: field identifier or array element index."""
+
+
+@final
+class DataPathKey:
+    """
+    Compact, immutable and hashable representation of a `DataPath`.
+
+    Hash is computed once, and field identifiers are interned, so that path keys are cheap to use in sets and dicts.
+    """
+
+    __slots__ = ("_hash", "_model", "absolute", "elements")
+
+    absolute: bool
+    elements: tuple[DataPathKeyElement, ...]
+
+    def __init__(self, absolute: bool, elements: tuple[DataPathKeyElement, ...] = ()) -> None:
+        self.absolute = absolute
+        self.elements = elements
+        self._hash = hash((absolute, elements))
+        self._model: DataPath | None = None
+
+    @classmethod
+    def of(cls, path: DataPath) -> Self:
+        """
+        Convert a data path model to a path key.
+
+        :param path: data path
+        :return: path key
+        """
+        return cls(path.absolute, tuple(_data_key_element(element) for element in path.elements))
+
+    def to_model(self) -> DataPath:
+        """
+        Convert path key to a data path model.
+
+        Models are built once per path key, callers must not mutate the returned object.
+
+        :return: data path
+        """
+        if (model := self._model) is None:
+            elements = [_data_element_model(element) for element in self.elements]
+            # elements are already models, validating the path itself is cheaper than constructing it in Python
+            model = self._model = DataPath(absolute=self.absolute, elements=elements)
+        return model
+
+    def append(self, element: DataPathKeyElement) -> "DataPathKey":
+        """
+        Append an element to path.
+
+        :param element: element to append
+        :return: concatenated path
+        """
+        return DataPathKey(self.absolute, (*self.elements, element))
+
+    def concat(self, child: "DataPathKey") -> "DataPathKey":
+        """
+        Concatenate a child path to this path. If the child path is absolute, it is returned as is.
+
+        :param child: child path
+        :return: concatenated path
+        """
+        if child.absolute:
+            return child
+        return DataPathKey(self.absolute, self.elements + child.elements)
+
+    def to_absolute(self) -> "DataPathKey":
+        """
+        Convert path to an absolute path.
+
+        :return: absolute path
+        """
+        return self if self.absolute else DataPathKey(True, self.elements)
+
+    def to_schema(self) -> "DataPathKey":
+        """
+        Convert path to a schema path: array elements are replaced by arrays, slices are removed.
+
+        Example: #.foo.[].[-2].bar.[1:5] -> #.foo.[].[].bar
+
+        :return: schema path
+        """
+        elements: list[DataPathKeyElement] = []
+        for element in self.elements:
+            match element:
+                case str():
+                    elements.append(element)
+                case int() | ArrayKey():
+                    elements.append(ARRAY)
+                # TODO: Spec also allows slicing on array type, but for now it is only used on primitive types
+                case slice():
+                    pass
+                case _:
+                    assert_never(element)
+        return DataPathKey(self.absolute, tuple(elements))
+
+    def starts_with(self, prefix: "DataPathKey") -> bool:
+        """
+        Check if path starts with a given prefix.
+
+        :param prefix: prefix to check
+        :return: True if path starts with prefix
+        """
+        return self.absolute == prefix.absolute and self.elements[: len(prefix.elements)] == prefix.elements
+
+    def ends_with(self, element: DataPathKeyElement) -> bool:
+        """
+        Check if path ends with a given element.
+
+        :param element: element to check
+        :return: True if path ends with element
+        """
+        return bool(self.elements) and self.elements[-1] == element
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, DataPathKey):
+            return NotImplemented
+        return self._hash == other._hash and self.absolute == other.absolute and self.elements == other.elements
+
+    @override
+    def __hash__(self) -> int:
+        return self._hash
+
+    @override
+    def __str__(self) -> str:
+        return f"{'#.' if self.absolute else ''}{'.'.join(_element_str(element) for element in self.elements)}"
+
+    @override
+    def __repr__(self) -> str:
+        return f"DataPathKey({self})"
+
+
+@final
+class DescriptorPathKey:
+    """
+    Compact, immutable and hashable representation of a `DescriptorPath`.
+
+    Hash is computed once, and field identifiers are interned, so that path keys are cheap to use in sets and dicts.
+    """
+
+    __slots__ = ("_hash", "elements")
+
+    elements: tuple[DescriptorPathKeyElement, ...]
+
+    def __init__(self, elements: tuple[DescriptorPathKeyElement, ...] = ()) -> None:
+        self.elements = elements
+        self._hash = hash(elements)
+
+    @classmethod
+    def of(cls, path: DescriptorPath) -> Self:
+        """
+        Convert a descriptor path model to a path key.
+
+        :param path: descriptor path
+        :return: path key
+        """
+        return cls(tuple(_descriptor_key_element(element) for element in path.elements))
+
+    def to_model(self) -> DescriptorPath:
+        """
+        Convert path key to a descriptor path model.
+
+        :return: descriptor path
+        """
+        elements = [_descriptor_element_model(element) for element in self.elements]
+        return DescriptorPath(elements=elements)
+
+    def append(self, element: DescriptorPathKeyElement) -> "DescriptorPathKey":
+        """
+        Append an element to path.
+
+        :param element: element to append
+        :return: concatenated path
+        """
+        return DescriptorPathKey((*self.elements, element))
+
+    @override
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, DescriptorPathKey):
+            return NotImplemented
+        return self._hash == other._hash and self.elements == other.elements
+
+    @override
+    def __hash__(self) -> int:
+        return self._hash
+
+    @override
+    def __str__(self) -> str:
+        return f"$.{'.'.join(_element_str(element) for element in self.elements)}"
+
+    @override
+    def __repr__(self) -> str:
+        return f"DescriptorPathKey({self})"
+
+
+ROOT_DATA_PATH_KEY = DataPathKey(True)
+ROOT_DESCRIPTOR_PATH_KEY = DescriptorPathKey()
+
+
+def _data_key_element(element: DataPathElement) -> DataPathKeyElement:
+    match element:
+        case Field(identifier=identifier):
+            return sys.intern(identifier)
+        case ArrayElement(index=index):
+            return index
+        case ArraySlice(start=start, end=end):
+            return slice(start, end)
+        case Array():
+            return ARRAY
+        case _:
+            assert_never(element)
+
+
+def _descriptor_key_element(element: DescriptorPathElement) -> DescriptorPathKeyElement:
+    match element:
+        case Field(identifier=identifier):
+            return sys.intern(identifier)
+        case ArrayElement(index=index):
+            return index
+        case _:
+            assert_never(element)
+
+
+@lru_cache(maxsize=ELEMENT_CACHE_SIZE)
+def _data_element_model(element: DataPathKeyElement) -> DataPathElement:
+    match element:
+        case str():
+            return Field.construct_trusted({"identifier": element})
+        case int():
+            return ArrayElement.construct_trusted({"index": element})
+        case slice():
+            return ArraySlice.construct_trusted({"start": element.start, "end": element.stop})
+        case ArrayKey():
+            return Array.construct_trusted({})
+        case _:
+            assert_never(element)
+
+
+def _descriptor_element_model(element: DescriptorPathKeyElement) -> DescriptorPathElement:
+    return _data_element_model(element)  # type: ignore[return-value]
+
+
+def _element_str(element: DataPathKeyElement) -> str:
+    match element:
+        case str():
+            return element
+        case int():
+            return f"[{element}]"
+        case slice():
+            return f"[{'' if element.start is None else element.start}:{'' if element.stop is None else element.stop}]"
+        case ArrayKey():
+            return element.value
+        case _:
+            assert_never(element)
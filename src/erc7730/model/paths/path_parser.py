@@ -1,3 +1,4 @@
+from functools import cache, lru_cache
 from typing import Any
 
 from lark import Lark, UnexpectedInput
@@ -17,8 +18,7 @@ from erc7730.model.paths import (
     Field,
 )
 
-PATH_PARSER = Lark(
-    grammar=r"""
+PATH_GRAMMAR = r"""
         ?path: descriptor_path | container_path | data_path
     
         descriptor_path: "$." descriptor_path_component ("." descriptor_path_component)*
@@ -38,9 +38,16 @@ PATH_PARSER = Lark(
         array_element: "[" array_index "]"
         slice_array_index: array_index?
         array_slice: "[" slice_array_index ":" slice_array_index "]"
-    """,
-    start="path",
-)
+    """
+
+
+PATH_CACHE_SIZE = 4096
+"""Maximum number of parsed paths kept in memory (paths are immutable, so parsed objects are shared)."""
+
+
+@cache
+def _array_index_adapter() -> TypeAdapter[ArrayIndex]:
+    return TypeAdapter(ArrayIndex)
 
 
 class PathTransformer(Transformer_InPlaceRecursive):
@@ -55,7 +62,7 @@ class PathTransformer(Transformer_InPlaceRecursive):
 
     def array_index(self, ast: Any) -> ArrayIndex:
         (value,) = ast
-        return TypeAdapter(ArrayIndex).validate_strings(value)
+        return _array_index_adapter().validate_strings(value)
 
     def array_element(self, ast: Any) -> ArrayElement:
         (value,) = ast
@@ -92,21 +99,32 @@ class PathTransformer(Transformer_InPlaceRecursive):
 PATH_TRANSFORMER = PathTransformer()
 
 
+@cache
+def _path_parser() -> Lark:
+    # LALR parser applies the transformer while parsing, without building an intermediate parse tree
+    return Lark(grammar=PATH_GRAMMAR, start="path", parser="lalr", transformer=PATH_TRANSFORMER)
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
 def to_path(path: str) -> ContainerPath | DataPath | DescriptorPath:
     """
     Parse a path string into a domain model object.
 
+    Parsed paths are cached, callers must not mutate the returned object.
+
     :param path: the path input string
     :return: an union of all possible path types
     :raises ValueError: if the input string is not a valid path
     :raises Exception: if the path parsing fails for an unexpected reason
     """
     try:
-        return PATH_TRANSFORMER.transform(PATH_PARSER.parse(path))
+        return _path_parser().parse(path)  # type: ignore[return-value]
     except UnexpectedInput as e:
         # TODO improve error reporting, see:
         #  https://github.com/lark-parser/lark/blob/master/examples/advanced/error_reporting_lalr.py
         raise ValueError(f"""Invalid path "{path}": {e}""") from None
+    except ValidationError as e:
+        raise ValueError(f"""Invalid path "{path}": {e}`""") from None
     except VisitError as e:
         if isinstance(e.orig_exc, ValidationError):
             raise ValueError(f"""Invalid path "{path}": {e.orig_exc}`""") from None
@@ -1,3 +1,4 @@
+import sys
 from dataclasses import dataclass
 from typing import assert_never
 
@@ -5,17 +6,8 @@ from eip712.model.schema import EIP712SchemaField
 
 from erc7730.model.abi import Component, Function, InputOutput
 from erc7730.model.context import EIP712Schema
-from erc7730.model.paths import (
-    ROOT_DATA_PATH,
-    Array,
-    ArrayElement,
-    ArraySlice,
-    ContainerPath,
-    DataPath,
-    DataPathElement,
-    Field,
-)
-from erc7730.model.paths.path_ops import data_path_append
+from erc7730.model.paths import ContainerPath, DataPath
+from erc7730.model.paths.path_keys import ARRAY, ROOT_DATA_PATH_KEY, DataPathKey
 from erc7730.model.resolved.display import (
     ResolvedAddressNameParameters,
     ResolvedCallDataParameters,
@@ -41,10 +33,26 @@ class FormatPaths:
     container_paths: set[ContainerPath]  # References to values in the container
 
 
+@dataclass(kw_only=True, frozen=True)
+class FormatPathKeys:
+    data_paths: set[DataPathKey]  # References to values in the serialized data
+    container_paths: set[ContainerPath]  # References to values in the container
+
+
 def compute_eip712_schema_paths(schema: EIP712Schema) -> set[DataPath]:
     """
     Compute the sets of valid schema paths for an EIP-712 schema.
 
+    :param schema: EIP-712 schema
+    :return: valid schema paths
+    """
+    return {path.to_model() for path in compute_eip712_schema_path_keys(schema)}
+
+
+def compute_eip712_schema_path_keys(schema: EIP712Schema) -> set[DataPathKey]:
+    """
+    Compute the sets of valid schema paths for an EIP-712 schema, as path keys.
+
     :param schema: EIP-712 schema
     :return: valid schema paths
     """
@@ -52,22 +60,22 @@ def compute_eip712_schema_paths(schema: EIP712Schema) -> set[DataPath]:
     if (primary_type := schema.types.get(schema.primaryType)) is None:
         raise ValueError(f"Invalid schema: primaryType {schema.primaryType} not in types")
 
-    paths: set[DataPath] = set()
+    paths: set[DataPathKey] = set()
 
-    def append_paths(path: DataPath, current_type: list[EIP712SchemaField]) -> None:
+    def append_paths(path: DataPathKey, current_type: list[EIP712SchemaField]) -> None:
         for field in current_type:
             if len(field.name) == 0:
                 continue  # skip unnamed parameters
 
-            sub_path = data_path_append(path, Field(identifier=field.name))
+            sub_path = path.append(sys.intern(field.name))
 
             field_base_type = field.type.rstrip("[]")
 
             if field_base_type in {"bytes"}:
-                paths.add(data_path_append(sub_path, Array()))
+                paths.add(sub_path.append(ARRAY))
 
             if field_base_type != field.type:
-                sub_path = data_path_append(sub_path, Array())
+                sub_path = sub_path.append(ARRAY)
                 paths.add(sub_path)
 
             if (target_type := schema.types.get(field_base_type)) is not None:
@@ -75,7 +83,7 @@ def compute_eip712_schema_paths(schema: EIP712Schema) -> set[DataPath]:
             else:
                 paths.add(sub_path)
 
-    append_paths(ROOT_DATA_PATH, primary_type)
+    append_paths(ROOT_DATA_PATH_KEY, primary_type)
 
     return paths
 
@@ -87,24 +95,34 @@ def compute_abi_schema_paths(abi: Function) -> set[DataPath]:
     :param abi: Solidity ABI function
     :return: valid schema paths
     """
-    paths: set[DataPath] = set()
+    return {path.to_model() for path in compute_abi_schema_path_keys(abi)}
+
 
-    def append_paths(path: DataPath, params: list[InputOutput] | list[Component] | None) -> None:
+def compute_abi_schema_path_keys(abi: Function) -> set[DataPathKey]:
+    """
+    Compute the sets of valid schema paths for an ABI function, as path keys.
+
+    :param abi: Solidity ABI function
+    :return: valid schema paths
+    """
+    paths: set[DataPathKey] = set()
+
+    def append_paths(path: DataPathKey, params: list[InputOutput] | list[Component] | None) -> None:
         if not params:
             return None
         for param in params:
             if len(param.name) == 0:
                 continue  # skip unnamed parameters
 
-            sub_path = data_path_append(path, Field(identifier=param.name))
+            sub_path = path.append(sys.intern(param.name))
 
             param_base_type = param.type.rstrip("[]")
 
             if param_base_type in {"bytes"}:
-                paths.add(data_path_append(sub_path, Array()))
+                paths.add(sub_path.append(ARRAY))
 
             if param_base_type != param.type:
-                sub_path = data_path_append(sub_path, Array())
+                sub_path = sub_path.append(ARRAY)
                 paths.add(sub_path)
 
             if param.components:
@@ -112,7 +130,7 @@ def compute_abi_schema_paths(abi: Function) -> set[DataPath]:
             else:
                 paths.add(sub_path)
 
-    append_paths(ROOT_DATA_PATH, abi.inputs)
+    append_paths(ROOT_DATA_PATH_KEY, abi.inputs)
 
     return paths
 
@@ -124,7 +142,18 @@ def compute_format_schema_paths(format: ResolvedFormat) -> FormatPaths:
     :param format: resolved $.display.format section
     :return: schema paths used by field formats
     """
-    data_paths: set[DataPath] = set()  # references to values in the serialized data
+    paths = compute_format_schema_path_keys(format)
+    return FormatPaths(data_paths={path.to_model() for path in paths.data_paths}, container_paths=paths.container_paths)
+
+
+def compute_format_schema_path_keys(format: ResolvedFormat) -> FormatPathKeys:
+    """
+    Compute the sets of schema paths referred in an ERC7730 Format section, with data paths as path keys.
+
+    :param format: resolved $.display.format section
+    :return: schema paths used by field formats
+    """
+    data_paths: set[DataPathKey] = set()  # references to values in the serialized data
     container_paths: set[ContainerPath] = set()  # references to values in the container
 
     if format.fields is not None:
@@ -136,7 +165,7 @@ def compute_format_schema_paths(format: ResolvedFormat) -> FormatPaths:
                 case ContainerPath():
                     container_paths.add(path)
                 case DataPath():
-                    data_paths.add(data_path_to_schema_path(path))
+                    data_paths.add(DataPathKey.of(path).to_schema())
                 case _:
                     assert_never(path)
 
@@ -183,7 +212,7 @@ def compute_format_schema_paths(format: ResolvedFormat) -> FormatPaths:
         for field in format.fields:
             append_paths(field)
 
-    return FormatPaths(data_paths=data_paths, container_paths=container_paths)
+    return FormatPathKeys(data_paths=data_paths, container_paths=container_paths)
 
 
 def data_path_to_schema_path(path: DataPath) -> DataPath:
@@ -195,17 +224,4 @@ def data_path_to_schema_path(path: DataPath) -> DataPath:
     :param path: data path
     :return: schema path
     """
-
-    def to_schema(element: DataPathElement) -> DataPathElement | None:
-        match element:
-            case Field() as f:
-                return f
-            case Array() | ArrayElement():
-                return Array()
-            # TODO: Spec also allows slicing on array type, but for now it is only used on primitive types
-            case ArraySlice():
-                return None
-            case _:
-                assert_never(element)
-
-    return path.model_copy(update={"elements": [to_schema(e) for e in path.elements if to_schema(e) is not None]})
+    return DataPathKey.of(path).to_schema().to_model()
@@ -0,0 +1 @@
+"""Package implementing prefetching commands to lint and resolve descriptor files offline."""
@@ -0,0 +1,133 @@
+import os
+from concurrent.futures.thread import ThreadPoolExecutor
+from pathlib import Path
+
+from pydantic_string_url import HttpUrl
+from rich import print
+
+from erc7730.common import client
+from erc7730.common.bundle import Bundle
+from erc7730.common.output import (
+    AddFileOutputAdder,
+    BufferAdder,
+    ConsoleOutputAdder,
+    DropFileOutputAdder,
+    ExceptionsToOutput,
+    ListOutputAdder,
+    Output,
+    OutputAdder,
+)
+from erc7730.convert.resolved.convert_erc7730_input_to_resolved import ERC7730InputToResolved
+from erc7730.lint import ERC7730Linter
+from erc7730.lint.lint_validate_abi import ValidateABILinter
+from erc7730.list.list import get_erc7730_files
+from erc7730.model.input.descriptor import InputERC7730Descriptor
+
+
+def prefetch_all_and_print_errors(paths: list[Path], bundle: Bundle) -> bool:
+    """
+    Prefetch all remote dependencies of ERC-7730 descriptor files at given paths into an offline bundle, and print
+    errors.
+
+    :param paths: paths to search for descriptor files
+    :param bundle: offline bundle to store fetched resources into
+    :return: true if no error occurred
+    """
+    out = DropFileOutputAdder(delegate=ConsoleOutputAdder())
+
+    count = prefetch_all(paths, bundle, out)
+
+    if out.has_errors:
+        print(f"[bold][red]prefetched {count} URLs into {bundle.path}, some errors occurred ❌[/red][/bold]")
+        return False
+
+    if out.has_warnings:
+        print(f"[bold][yellow]prefetched {count} URLs into {bundle.path}, some warnings occurred ⚠️[/yellow][/bold]")
+        return True
+
+    print(f"[bold][green]prefetched {count} URLs into {bundle.path}, no errors occurred ✅[/green][/bold]")
+    return True
+
+
+def prefetch_all(paths: list[Path], bundle: Bundle, out: OutputAdder) -> int:
+    """
+    Prefetch all remote dependencies of ERC-7730 descriptor files at given paths into an offline bundle.
+
+    Remote dependencies are all URLs fetched when linting descriptors: ABIs, EIP-712 schemas and enums referenced by
+    URL, reference ABIs of all deployments, and supported chains. URLs that cannot be fetched are also recorded in the
+    bundle, so that failures are reproduced offline.
+
+    Response bodies are captured as URLs are fetched, so the bundle contains exactly the content that descriptors were
+    resolved and linted with. Objects memoized by the client are dropped first, so that all URLs are actually fetched.
+
+    :param paths: paths to search for descriptor files
+    :param bundle: offline bundle to store fetched resources into
+    :param out: output adder
+    :return: number of URLs prefetched
+    """
+    files = list(get_erc7730_files(*paths, out=out))
+
+    if len(files) <= 1 or not (root_path := os.path.commonpath(files)):
+        root_path = None
+
+    def label(f: Path) -> Path | None:
+        return f.relative_to(root_path) if root_path is not None else None
+
+    if len(files) > 1:
+        print(f"📥 prefetching dependencies of {len(files)} descriptor files…\n")
+
+    linter = ValidateABILinter()
+    fetches: dict[str, str | None] = {}
+    client.clear_memoized()
+
+    with client.capture_bodies() as bodies:
+        with client.record_fetches() as supported_chains_fetches, ExceptionsToOutput(out):
+            client.get_bytes(HttpUrl(f"https://{client.ETHERSCAN}/v2/chainlist"))
+        fetches.update(supported_chains_fetches)
+
+        with ThreadPoolExecutor() as executor:
+            for future in (executor.submit(prefetch_file, file, linter, out, label(file)) for file in files):
+                fetches.update(future.result())
+
+    for url, digest in sorted(fetches.items()):
+        if digest is None:
+            out.warning(title="Failed to prefetch URL", message=f"Fetching {url} failed, failure is recorded in bundle")
+            bundle.add(url, None)
+        elif (body := bodies.get(digest)) is None:
+            out.error(title="Failed to prefetch URL", message=f"Response body of {url} was not captured")
+        else:
+            bundle.add(url, body)
+
+    bundle.save()
+    return len(fetches)
+
+
+def prefetch_file(
+    path: Path, linter: ERC7730Linter, out: OutputAdder, show_as: Path | None = None
+) -> dict[str, str | None]:
+    """
+    Collect remote dependencies of a single ERC-7730 descriptor file.
+
+    :param path: ERC-7730 descriptor file path
+    :param linter: linter instance, used to fetch reference ABIs
+    :param out: error handler
+    :param show_as: if provided, print this label instead of the file path
+    :return: mapping of fetched URLs to body digests (None if fetching failed)
+    """
+    label = path if show_as is None else show_as
+    file_out = AddFileOutputAdder(delegate=out, file=path)
+
+    with BufferAdder(file_out, prolog=f"➡️ prefetching [bold]{label}[/bold]…", epilog="") as out:
+        lint_out = ListOutputAdder()
+        with client.record_fetches() as fetches, ExceptionsToOutput(lint_out):
+            input_descriptor = InputERC7730Descriptor.load(path)
+            resolved_descriptor = ERC7730InputToResolved().convert(input_descriptor, lint_out)
+            if resolved_descriptor is not None:
+                linter.lint(resolved_descriptor, lint_out)
+
+        # only errors preventing to collect dependencies are reported, lint warnings are not relevant here
+        for output in lint_out.outputs:
+            if output.level == Output.Level.ERROR:
+                out.add(output)
+
+    return fetches
@@ -0,0 +1 @@
+"""Package implementing clear-signing rendering of transactions, using resolved descriptors."""
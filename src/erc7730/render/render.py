@@ -0,0 +1,483 @@
+"""
+Clear-signing rendering of transactions: formatting of the fields a wallet displays to the user for a transaction, as
+described by the display formats of resolved ERC-7730 descriptors.
+
+Formats are compiled to render plans once per (chain id, contract address, selector), and plans are cached by format
+hash, so identical formats shared by several deployments or descriptors are only compiled once. Rendering a transaction
+then only evaluates the compiled plan against its calldata, without walking the descriptor models.
+"""
+
+import hashlib
+import json
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from decimal import Context, Decimal
+from functools import partial
+from typing import Any, assert_never, cast
+
+from eth_utils import to_checksum_address
+from pydantic import Field
+
+from erc7730.common.abi import compute_signature, get_functions
+from erc7730.common.binary import from_hex
+from erc7730.common.output import ListOutputAdder, OutputAdder
+from erc7730.convert.calldata.v1.abi import ABITree, function_to_abi_tree
+from erc7730.convert.calldata.v1.evaluator import CalldataEvaluator, CompiledValue, compile_value
+from erc7730.convert.calldata.v1.path import convert_value
+from erc7730.model.abi import Function
+from erc7730.model.base import Model
+from erc7730.model.display import DateEncoding, FieldFormat
+from erc7730.model.metadata import TokenInfo
+from erc7730.model.resolved.context import ResolvedContractContext
+from erc7730.model.resolved.descriptor import ResolvedERC7730Descriptor
+from erc7730.model.resolved.display import (
+    ResolvedDateParameters,
+    ResolvedEnumParameters,
+    ResolvedField,
+    ResolvedFieldDescription,
+    ResolvedFormat,
+    ResolvedNestedFields,
+    ResolvedNftNameParameters,
+    ResolvedTokenAmountParameters,
+    ResolvedUnitParameters,
+    ResolvedValue,
+)
+from erc7730.model.types import Address, HexStr, Selector
+
+ETHER = TokenInfo(name="Ether", ticker="ETH", decimals=18)
+"""Default native currency, for chains without an explicit native currency."""
+
+TokenLookup = Callable[[int, Address], TokenInfo | None]
+"""Function returning the token information of a (chain id, token address), if known."""
+
+NameLookup = Callable[[int, Address], str | None]
+"""Function returning the trusted name of a (chain id, address), if known."""
+
+_DECIMAL = Context(prec=100)
+"""Decimal context large enough to represent any 256 bits integer exactly."""
+
+_SI_PREFIXES = {
+    -24: "y",
+    -21: "z",
+    -18: "a",
+    -15: "f",
+    -12: "p",
+    -9: "n",
+    -6: "µ",
+    -3: "m",
+    0: "",
+    3: "k",
+    6: "M",
+    9: "G",
+    12: "T",
+    15: "P",
+    18: "E",
+    21: "Z",
+    24: "Y",
+}
+"""SI prefixes by power of 10, for units with prefix enabled."""
+
+
+class RenderedField(Model):
+    """A field, as displayed to the user."""
+
+    label: str = Field(title="Label", description="The field label.")
+
+    value: str = Field(title="Value", description="The formatted field value.")
+
+    format: FieldFormat | None = Field(
+        default=None, title="Format", description="The format used to format the field value."
+    )
+
+
+class RenderedTransaction(Model):
+    """A transaction, as displayed to the user."""
+
+    intent: str = Field(title="Intent", description="The intent of the transaction.")
+
+    fields: list[RenderedField] = Field(title="Fields", description="The formatted fields, in display order.")
+
+
+@dataclass(kw_only=True, frozen=True)
+class RenderContext:
+    """Transaction independent and transaction specific information used to format field values."""
+
+    chain_id: int
+    to: Address
+    own_token: TokenInfo | None
+    native_currency: TokenInfo
+    tokens: TokenLookup | None
+    names: NameLookup | None
+
+
+FieldRenderer = Callable[[RenderContext, Any, Any], str]
+"""Function formatting a field value, given the render context, the value and the value of its token/collection."""
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
+class FieldPlan:
+    """A compiled field: how to evaluate its value (and token/collection value, if any) and how to format it."""
+
+    label: str
+    format: FieldFormat | None
+    value: CompiledValue
+    param: CompiledValue | None
+    render: FieldRenderer
+
+
+@dataclass(kw_only=True, frozen=True)
+class RenderPlan:
+    """A compiled format, for a single selector."""
+
+    intent: str
+    fields: tuple[FieldPlan, ...]
+    own_token: TokenInfo | None
+
+
+@dataclass(kw_only=True, frozen=True)
+class _Registration:
+    descriptor: ResolvedERC7730Descriptor
+    selector: Selector
+    format: ResolvedFormat
+    abi: Function
+
+
+class Renderer:
+    """
+    Renderer of transactions to the fields displayed to the user, using resolved ERC-7730 descriptors with a contract
+    context.
+
+    Token and address name resolution are delegated to lookup functions, as they require data sources (token lists,
+    name services) that are out of the scope of this library. If not provided, tokens are only known if the called
+    contract descriptor declares its own token metadata, and addresses are displayed in checksum form.
+    """
+
+    def __init__(
+        self,
+        descriptors: Iterable[ResolvedERC7730Descriptor] = (),
+        tokens: TokenLookup | None = None,
+        names: NameLookup | None = None,
+        native_currencies: Mapping[int, TokenInfo] | None = None,
+    ) -> None:
+        """
+        :param descriptors: resolved descriptors to render transactions with (descriptors without contract context are
+            ignored)
+        :param tokens: function returning token information, if known
+        :param names: function returning trusted names of addresses, if known
+        :param native_currencies: native currency of each chain id, defaults to Ether
+        """
+        self._registrations: dict[tuple[int, str, str], _Registration] = {}
+        self._plans: dict[tuple[int, str, str], RenderPlan] = {}
+        self._plans_by_hash: dict[str, RenderPlan] = {}
+        self._tokens = tokens
+        self._names = names
+        self._native_currencies = native_currencies or {}
+        for descriptor in descriptors:
+            self.add(descriptor)
+
+    def add(self, descriptor: ResolvedERC7730Descriptor) -> None:
+        """
+        Register a resolved descriptor, replacing previously registered formats for the same deployments and selectors.
+
+        :param descriptor: resolved descriptor (ignored if it does not have a contract context)
+        """
+        if not isinstance(context := descriptor.context, ResolvedContractContext):
+            return
+        abis = get_functions(context.contract.abi).functions
+        for selector, format in descriptor.display.formats.items():
+            if (abi := abis.get(selector)) is None:
+                continue
+            for deployment in context.contract.deployments:
+                key = (deployment.chainId, deployment.address.lower(), selector.lower())
+                self._registrations[key] = _Registration(
+                    descriptor=descriptor, selector=selector, format=format, abi=abi
+                )
+                self._plans.pop(key, None)
+
+    def render(
+        self,
+        chain_id: int,
+        to: Address,
+        calldata: HexStr | bytes,
+        value: int = 0,
+        sender: Address | None = None,
+    ) -> RenderedTransaction | None:
+        """
+        Render a transaction.
+
+        :param chain_id: transaction chain id
+        :param to: transaction destination (called contract) address
+        :param calldata: transaction calldata (selector + arguments), as hex string or bytes
+        :param value: transaction native currency amount
+        :param sender: transaction sender address, if known
+        :return: rendered transaction, or None if no descriptor applies to the transaction
+        :raises ValueError: if the format applying to the transaction is invalid, or calldata cannot be decoded
+        """
+        data = from_hex(calldata) if isinstance(calldata, str) else calldata
+        address = to.lower()
+        if (plan := self.plan(chain_id, address, "0x" + data[:4].hex())) is None:
+            return None
+
+        evaluator = CalldataEvaluator(data, sender=sender, to=address, value=value)
+        context = RenderContext(
+            chain_id=chain_id,
+            to=address,
+            own_token=plan.own_token,
+            native_currency=self._native_currencies.get(chain_id, ETHER),
+            tokens=self._tokens,
+            names=self._names,
+        )
+
+        fields: list[RenderedField] = []
+        try:
+            for field in plan.fields:
+                field_value = evaluator.evaluate(field.value)
+                param = None if field.param is None else evaluator.evaluate(field.param)
+                for item, item_param in _expand(field_value, param):
+                    fields.append(
+                        RenderedField(
+                            label=field.label, value=field.render(context, item, item_param), format=field.format
+                        )
+                    )
+        except (IndexError, UnicodeDecodeError, OverflowError) as e:
+            raise ValueError(f"Failed decoding calldata: {e}") from e
+
+        return RenderedTransaction(intent=plan.intent, fields=fields)
+
+    def plan(self, chain_id: int, address: Address, selector: Selector) -> RenderPlan | None:
+        """
+        Get the compiled render plan for a deployment and selector, compiling it on first use.
+
+        :param chain_id: chain id
+        :param address: contract address
+        :param selector: function selector
+        :return: render plan, or None if no descriptor applies
+        :raises ValueError: if the format is invalid
+        """
+        key = (chain_id, address.lower(), selector.lower())
+        if (plan := self._plans.get(key)) is not None:
+            return plan
+        if (registration := self._registrations.get(key)) is None:
+            return None
+
+        format_hash = _format_hash(registration)
+        if (plan := self._plans_by_hash.get(format_hash)) is None:
+            out = ListOutputAdder()
+            if (
+                plan := compile_render_plan(registration.descriptor, registration.format, registration.abi, out)
+            ) is None:
+                errors = "; ".join(f"{output.title}: {output.message}" for output in out.outputs)
+                raise ValueError(f"Invalid format for selector {registration.selector}: {errors}")
+            self._plans_by_hash[format_hash] = plan
+
+        self._plans[key] = plan
+        return plan
+
+
+def compile_render_plan(
+    descriptor: ResolvedERC7730Descriptor, format: ResolvedFormat, abi: Function, out: OutputAdder
+) -> RenderPlan | None:
+    """
+    Compile a format to a render plan.
+
+    Nested fields are flattened, and array values are displayed as one field per array element.
+
+    :param descriptor: resolved descriptor
+    :param format: resolved format to compile
+    :param abi: ABI of the function
+    :param out: error handler
+    :return: render plan, or None if format is invalid
+    """
+    abi_tree = function_to_abi_tree(abi)
+    enums = descriptor.metadata.enums or {}
+
+    fields: list[FieldPlan] = []
+    for field in _flatten(format.fields):
+        if (field_plan := _compile_field(field, abi_tree, enums, out)) is None:
+            return None
+        fields.append(field_plan)
+
+    intent: str
+    match format.intent:
+        case None:
+            intent = format.id or compute_signature(abi)
+        case str():
+            intent = format.intent
+        case dict():
+            intent = ", ".join(f"{key}: {value}" for key, value in format.intent.items())
+        case _:
+            assert_never(format.intent)
+
+    return RenderPlan(intent=intent, fields=tuple(fields), own_token=descriptor.metadata.token)
+
+
+def _flatten(fields: list[ResolvedField]) -> Iterator[ResolvedFieldDescription]:
+    for field in fields:
+        match field:
+            case ResolvedFieldDescription():
+                yield field
+            case ResolvedNestedFields():
+                yield from _flatten(field.fields)
+            case _:
+                assert_never(field)
+
+
+def _compile_field(
+    field: ResolvedFieldDescription, abi: ABITree, enums: dict[str, dict[str, str]], out: OutputAdder
+) -> FieldPlan | None:
+    def compile(value: ResolvedValue) -> CompiledValue | None:
+        if (converted := convert_value(value=value, abi=abi, out=out)) is None:
+            return None
+        return compile_value(converted)
+
+    if (value := compile(field.value)) is None:
+        return None
+
+    param: CompiledValue | None = None
+    render: FieldRenderer
+    match field.format:
+        case None | FieldFormat.RAW | FieldFormat.CALL_DATA:
+            render = _render_raw
+        case FieldFormat.ADDRESS_NAME:
+            render = _render_address_name
+        case FieldFormat.AMOUNT:
+            render = _render_amount
+        case FieldFormat.TOKEN_AMOUNT:
+            token_params = cast(ResolvedTokenAmountParameters | None, field.params)
+            if token_params is None:
+                render = partial(_render_token_amount, frozenset(), None, None)
+            else:
+                if token_params.token is not None and (param := compile(token_params.token)) is None:
+                    return None
+                render = partial(
+                    _render_token_amount,
+                    frozenset(address.lower() for address in token_params.nativeCurrencyAddress or ()),
+                    None if token_params.threshold is None else int(token_params.threshold, 16),
+                    token_params.message,
+                )
+        case FieldFormat.NFT_NAME:
+            if (param := compile(cast(ResolvedNftNameParameters, field.params).collection)) is None:
+                return None
+            render = _render_nft_name
+        case FieldFormat.DATE:
+            render = partial(_render_date, cast(ResolvedDateParameters, field.params).encoding)
+        case FieldFormat.DURATION:
+            render = _render_duration
+        case FieldFormat.UNIT:
+            unit_params = cast(ResolvedUnitParameters, field.params)
+            render = partial(_render_unit, unit_params.base, unit_params.decimals or 0, bool(unit_params.prefix))
+        case FieldFormat.ENUM:
+            enum_id = cast(ResolvedEnumParameters, field.params).enumId
+            if (enum := enums.get(enum_id)) is None:
+                return out.error(title="Invalid enum id", message=f"""Enum "{enum_id}" is not defined in metadata""")
+            render = partial(_render_enum, enum)
+        case _:
+            assert_never(field.format)
+
+    return FieldPlan(label=field.label, format=field.format, value=value, param=param, render=render)
+
+
+def _format_hash(registration: _Registration) -> str:
+    """Hash of everything a render plan depends on: function, format, enums and token metadata."""
+    metadata = registration.descriptor.metadata
+    hash = hashlib.sha256()
+    hash.update(compute_signature(registration.abi).encode())
+    hash.update(registration.format.model_dump_json().encode())
+    hash.update(json.dumps(metadata.enums, sort_keys=True).encode())
+    hash.update(b"null" if metadata.token is None else metadata.token.model_dump_json().encode())
+    return hash.hexdigest()
+
+
+def _expand(value: Any, param: Any) -> Iterator[tuple[Any, Any]]:
+    """Expand array values (and matching array parameters) to one value per array element."""
+    if not isinstance(value, list):
+        yield value, param
+        return
+    params = param if isinstance(param, list) and len(param) == len(value) else [param] * len(value)
+    for item, item_param in zip(value, params, strict=True):
+        yield from _expand(item, item_param)
+
+
+def _format_decimal(value: int | Decimal, decimals: int = 0) -> str:
+    number = _DECIMAL.scaleb(Decimal(value), -decimals)
+    formatted = f"{number:f}"
+    return formatted.rstrip("0").rstrip(".") if "." in formatted else formatted
+
+
+def _format_address(context: RenderContext, address: Address) -> str:
+    if context.names is not None and (name := context.names(context.chain_id, address)) is not None:
+        return name
+    return to_checksum_address(address)
+
+
+def _render_raw(context: RenderContext, value: Any, param: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _render_address_name(context: RenderContext, value: Any, param: Any) -> str:
+    return _format_address(context, value)
+
+
+def _render_amount(context: RenderContext, value: Any, param: Any) -> str:
+    currency = context.native_currency
+    return f"{_format_decimal(value, currency.decimals)} {currency.ticker}"
+
+
+def _render_token_amount(
+    native_currencies: frozenset[str],
+    threshold: int | None,
+    message: str | None,
+    context: RenderContext,
+    value: Any,
+    token: Any,
+) -> str:
+    address = context.to if token is None else token.lower()
+    info: TokenInfo | None
+    if address in native_currencies:
+        info = context.native_currency
+    elif address == context.to and context.own_token is not None:
+        info = context.own_token
+    else:
+        info = None if context.tokens is None else context.tokens(context.chain_id, address)
+
+    if info is None:
+        return f"{value} (unknown token {to_checksum_address(address)})"
+    if threshold is not None and value >= threshold:
+        return f"{message or 'Unlimited'} {info.ticker}"
+    return f"{_format_decimal(value, info.decimals)} {info.ticker}"
+
+
+def _render_nft_name(context: RenderContext, value: Any, collection: Any) -> str:
+    return f"{_format_address(context, collection)} #{value}"
+
+
+def _render_date(encoding: DateEncoding, context: RenderContext, value: Any, param: Any) -> str:
+    match encoding:
+        case DateEncoding.TIMESTAMP:
+            return datetime.fromtimestamp(value, UTC).strftime("%Y-%m-%d %H:%M:%S UTC")
+        case DateEncoding.BLOCKHEIGHT:
+            return f"block {value}"
+        case _:
+            assert_never(encoding)
+
+
+def _render_duration(context: RenderContext, value: Any, param: Any) -> str:
+    minutes, seconds = divmod(value, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours:02}:{minutes:02}:{seconds:02}"
+
+
+def _render_unit(base: str, decimals: int, prefix: bool, context: RenderContext, value: Any, param: Any) -> str:
+    number = _DECIMAL.scaleb(Decimal(value), -decimals)
+    symbol = ""
+    if prefix and number:
+        exponent = min(max(number.adjusted() // 3 * 3, min(_SI_PREFIXES)), max(_SI_PREFIXES))
+        number, symbol = _DECIMAL.scaleb(number, -exponent), _SI_PREFIXES[exponent]
+    return f"{_format_decimal(number)}{symbol}{base}"
+
+
+def _render_enum(enum: dict[str, str], context: RenderContext, value: Any, param: Any) -> str:
+    return enum.get(str(value), str(value))
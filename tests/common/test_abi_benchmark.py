@@ -0,0 +1,104 @@
+import time
+from collections.abc import Callable
+from typing import Any, cast
+
+import pytest
+from eth_typing import ABIFunction
+from eth_utils.abi import abi_to_signature, function_signature_to_4byte_selector
+from lark import Lark
+
+from erc7730.common.abi import (
+    _SIGNATURE_GRAMMAR,
+    FunctionTransformer,
+    compute_signature,
+    function_to_selector,
+    get_functions,
+    reduce_signature,
+    signature_to_selector,
+)
+from erc7730.model.abi import ABI, Component, Function, InputOutput
+
+FUNCTIONS = [
+    Function(
+        name=f"function{i}",
+        inputs=[
+            InputOutput(name="amount", type="uint256"),
+            InputOutput(name="recipients", type="address[]"),
+            InputOutput(
+                name="orders",
+                type="tuple[]",
+                components=[
+                    Component(name="token", type="address"),
+                    Component(name="path", type="tuple[2]", components=[Component(name="fee", type="uint24")]),
+                ],
+            ),
+        ],
+    )
+    for i in range(2000)
+]
+"""Large ABI, with distinct functions so that uncached throughput is measured."""
+ABIS: list[ABI] = list(FUNCTIONS)
+
+SIGNATURES = [
+    f"function{i}(uint256 amount, address[] recipients, (address token, (uint24 fee, bytes data) path) order)"
+    for i in range(200)
+]
+"""Distinct signatures, fewer than functions as the previous Earley parser takes several milliseconds per signature."""
+
+
+def _duration(run: Callable[[], Any]) -> float:
+    start = time.process_time()
+    run()
+    return max(time.process_time() - start, 1e-9)
+
+
+def _eth_utils_selector(function: Function) -> str:
+    signature = abi_to_signature(cast(ABIFunction, function.model_dump()))
+    return "0x" + function_signature_to_4byte_selector(signature).hex()
+
+
+def test_compute_signature_equals_eth_utils() -> None:
+    for function in FUNCTIONS[:10]:
+        assert compute_signature(function) == abi_to_signature(cast(ABIFunction, function.model_dump()))
+
+
+def test_function_to_selector_equals_eth_utils() -> None:
+    assert [function_to_selector(function) for function in FUNCTIONS[:10]] == [
+        _eth_utils_selector(function) for function in FUNCTIONS[:10]
+    ]
+
+
+def test_reduce_signature_equals_earley() -> None:
+    earley = Lark(grammar=_SIGNATURE_GRAMMAR, start="function")
+    for signature in SIGNATURES[:10]:
+        function = FunctionTransformer().transform(earley.parse(signature))
+        assert reduce_signature(signature) == abi_to_signature(cast(ABIFunction, function.model_dump()))
+
+
+@pytest.mark.benchmark
+def test_get_functions_throughput() -> None:
+    signature_to_selector.cache_clear()
+
+    before = _duration(lambda: {_eth_utils_selector(function): function for function in FUNCTIONS})
+    uncached = _duration(lambda: get_functions(ABIS))
+    cached = _duration(lambda: get_functions(ABIS))
+
+    assert uncached < before
+    assert cached * 2 < before
+
+
+@pytest.mark.benchmark
+def test_reduce_signature_throughput() -> None:
+    earley = Lark(grammar=_SIGNATURE_GRAMMAR, start="function")
+    reduce_signature.cache_clear()
+
+    def reduce_before(signature: str) -> str:
+        function = FunctionTransformer().transform(earley.parse(signature))
+        return abi_to_signature(cast(ABIFunction, function.model_dump()))
+
+    before = _duration(lambda: [reduce_before(signature) for signature in SIGNATURES])
+    uncached = _duration(lambda: [reduce_signature(signature) for signature in SIGNATURES])
+    cached = _duration(lambda: [reduce_signature(signature) for signature in SIGNATURES])
+
+    assert uncached * 3 < before
+    assert cached * 10 < uncached
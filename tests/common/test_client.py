@@ -1,4 +1,14 @@
-from pydantic_string_url import HttpUrl
+import asyncio
+import threading
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+import pytest
+from httpx import MockTransport, Request, Response
+from pydantic_string_url import FileUrl, HttpUrl
 
 from erc7730.common import client
 from erc7730.model.abi import ABI
@@ -68,6 +78,21 @@ def test_get_contract_abis() -> None:
     assert len(result) > 0
 
 
+def test_aget_contract_abis() -> None:
+    async def aget_contract_abis() -> tuple[list[ABI], list[ABI]]:
+        try:
+            return await asyncio.gather(
+                client.aget_contract_abis(chain_id=1, contract_address="0x06012c8cf97bead5deae237070f9587f8e7a266d"),
+                client.aget_contract_abis(chain_id=1, contract_address="0x06012c8cf97bead5deae237070f9587f8e7a266d"),
+            )
+        finally:
+            await client.aclose()
+
+    result1, result2 = asyncio.run(aget_contract_abis())
+    assert len(result1) > 0
+    assert result1 == result2
+
+
 def test_get_from_github() -> None:
     result1 = client.get(
         url=HttpUrl(
@@ -88,3 +113,193 @@ def test_get_from_github() -> None:
     assert len(result1) > 0
     assert len(result2) > 0
     assert result1 == result2
+
+
+@pytest.fixture
+def default_settings() -> Generator[None, None, None]:
+    yield
+    client.configure(client.ClientSettings())
+
+
+def test_shared_client_is_reused(tmp_path: Path) -> None:
+    file = tmp_path / "test.json"
+    file.write_text("[]")
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        instances = set(executor.map(lambda _: id(client._client()), range(16)))
+        assert list(executor.map(lambda _: client.get(list[str], FileUrl(file.as_uri())), range(16))) == [[]] * 16
+    assert instances == {id(client._client())}
+
+
+def test_close_shared_client() -> None:
+    shared_client = client._client()
+    client.close()
+    assert shared_client.is_closed
+    assert client._client() is not shared_client
+    assert not client._client().is_closed
+
+
+def test_configure_shared_client(default_settings: None) -> None:
+    shared_client = client._client()
+    client.configure(client.ClientSettings(max_connections=4, max_keepalive_connections=2, timeout=5.0))
+    assert shared_client.is_closed
+    assert client._client().timeout.read == 5.0
+
+
+@pytest.mark.skipif(find_spec("h2") is not None, reason="h2 package is installed")
+def test_configure_http2_without_h2(default_settings: None) -> None:
+    with pytest.raises(Exception, match="requires the h2 package"):
+        client.configure(client.ClientSettings(http2=True))
+
+
+def test_aget_concurrently(tmp_path: Path) -> None:
+    files = [tmp_path / f"{i}.json" for i in range(8)]
+    for i, file in enumerate(files):
+        file.write_text(f"[{i}]")
+
+    async def aget_all() -> list[list[int]]:
+        try:
+            return await asyncio.gather(*(client.aget(list[int], FileUrl(file.as_uri())) for file in files))
+        finally:
+            await client.aclose()
+
+    with client.record_fetches() as fetches:
+        assert asyncio.run(aget_all()) == [[i] for i in range(8)]
+    assert len(fetches) == 8
+
+
+def _echo_url(request: Request) -> Response:
+    if request.url.host == client.ETHERSCAN:
+        return Response(200, json={"result": str(request.url)})
+    return Response(200, json=[str(request.url)])
+
+
+def test_github_transport() -> None:
+    url = "https://github.com/LedgerHQ/repo/blob/main/abi.json"
+    expected = b'["https://raw.githubusercontent.com/LedgerHQ/repo/main/abi.json"]'
+
+    async def handle_async_request() -> Response:
+        response = await client.AsyncGithubTransport(MockTransport(_echo_url)).handle_async_request(Request("GET", url))
+        await response.aread()
+        return response
+
+    assert client.GithubTransport(MockTransport(_echo_url)).handle_request(Request("GET", url)).read() == expected
+    assert asyncio.run(handle_async_request()).content == expected
+
+
+def test_etherscan_transport(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(client.ETHERSCAN_API_KEY, "KEY")
+    url = f"https://{client.ETHERSCAN}/v2/chainlist"
+    expected = f"{url}?apikey=KEY".encode()
+
+    async def handle_async_request() -> Response:
+        response = await client.AsyncEtherscanTransport(MockTransport(_echo_url)).handle_async_request(
+            Request("GET", url)
+        )
+        await response.aread()
+        return response
+
+    assert client.EtherscanTransport(MockTransport(_echo_url)).handle_request(Request("GET", url)).read() == expected
+    assert asyncio.run(handle_async_request()).content == expected
+
+
+@pytest.fixture
+def memo() -> Generator[None, None, None]:
+    client.clear_memoized()
+    yield
+    client.clear_memoized()
+
+
+def test_get_memoized_single_flight(memo: None, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    file = tmp_path / "test.json"
+    file.write_text("[1, 2]")
+    url = FileUrl(file.as_uri())
+    calls: list[str] = []
+    barrier = threading.Barrier(8, timeout=10)
+    get_bytes = client.get_bytes
+
+    def counting_get_bytes(url: FileUrl, **params: Any) -> bytes:
+        calls.append(str(url))
+        return get_bytes(url, **params)
+
+    def get_memoized(_: int) -> list[int]:
+        barrier.wait()
+        return client.get_memoized(list[int], url)
+
+    monkeypatch.setattr(client, "get_bytes", counting_get_bytes)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(get_memoized, range(8)))
+
+    assert calls == [str(url)]
+    assert results == [[1, 2]] * 8
+    assert all(result is results[0] for result in results)
+    with client.record_fetches() as fetches:
+        client.get_memoized(list[int], url)
+    assert len(fetches) == 1
+    assert client.get_memoized(tuple[int, ...], url) == (1, 2)
+    assert len(calls) == 2
+
+
+def test_get_memoized_failures_not_memoized(memo: None, tmp_path: Path) -> None:
+    file = tmp_path / "test.json"
+    url = FileUrl(file.as_uri())
+    with pytest.raises(Exception, match="404 Not Found"):
+        client.get_memoized(list[int], url)
+    file.write_text("[1]")
+    assert client.get_memoized(list[int], url) == [1]
+
+
+def test_aget_memoized_shared_with_get_memoized(memo: None, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    file = tmp_path / "test.json"
+    file.write_text("[1, 2]")
+    url = FileUrl(file.as_uri())
+    calls: list[str] = []
+    aget_bytes = client.aget_bytes
+
+    async def counting_aget_bytes(url: FileUrl, **params: Any) -> bytes:
+        calls.append(str(url))
+        return await aget_bytes(url, **params)
+
+    async def aget_all() -> list[list[int]]:
+        try:
+            return await asyncio.gather(*(client.aget_memoized(list[int], url) for _ in range(8)))
+        finally:
+            await client.aclose()
+
+    monkeypatch.setattr(client, "aget_bytes", counting_aget_bytes)
+    results = asyncio.run(aget_all())
+
+    assert calls == [str(url)]
+    assert results == [[1, 2]] * 8
+    assert client.get_memoized(list[int], url) is results[0]
+    assert asyncio.run(aget_all())[0] is results[0]
+    assert calls == [str(url)]
+
+
+def test_get_memoized_interrupted(memo: None, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    file = tmp_path / "test.json"
+    file.write_text("[1]")
+    url = FileUrl(file.as_uri())
+    get_bytes = client.get_bytes
+    started, interrupt = threading.Event(), threading.Event()
+
+    def interrupted_get_bytes(url: FileUrl, **params: Any) -> bytes:
+        started.set()
+        interrupt.wait(timeout=10)
+        raise KeyboardInterrupt
+
+    def owner() -> None:
+        with pytest.raises(KeyboardInterrupt):
+            client.get_memoized(list[int], url)
+
+    monkeypatch.setattr(client, "get_bytes", interrupted_get_bytes)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        owner_future = executor.submit(owner)
+        assert started.wait(timeout=10)
+        waiter_future = executor.submit(client.get_memoized, list[int], url)
+        interrupt.set()
+        owner_future.result(timeout=10)
+        with pytest.raises(KeyboardInterrupt):
+            waiter_future.result(timeout=10)
+
+    monkeypatch.setattr(client, "get_bytes", get_bytes)
+    assert client.get_memoized(list[int], url) == [1]
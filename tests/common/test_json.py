@@ -0,0 +1,336 @@
+import gc
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from erc7730.common import json as json_module
+from erc7730.common.json import (
+    CompactJSONEncoder,
+    JSONBackend,
+    dict_to_json_str,
+    get_json_backend,
+    load_json_with_includes,
+    read_json_with_includes,
+    set_json_backend,
+)
+from erc7730.model.input.descriptor import InputERC7730Descriptor
+
+TESTS = Path(__file__).parents[1]
+DESCRIPTOR = TESTS / "convert" / "resolved" / "data" / "minimal_contract_input.json"
+
+
+class LegacyCompactJSONEncoder(json.JSONEncoder):
+    """Previous implementation of CompactJSONEncoder, measuring each container with str() at every nesting level."""
+
+    MAX_WIDTH = 120
+    MAX_ITEMS = 10
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        if kwargs.get("indent") is None:
+            kwargs["indent"] = 2
+        super().__init__(*args, **kwargs)
+        self.indentation_level = 0
+
+    def encode(self, o: Any) -> str:
+        if isinstance(o, list | tuple):
+            return self._encode_list(o)
+        if isinstance(o, dict):
+            return self._encode_object(o)
+        if isinstance(o, float):
+            return format(o, "g")
+        return json.dumps(
+            obj=o,
+            skipkeys=self.skipkeys,
+            ensure_ascii=self.ensure_ascii,
+            check_circular=self.check_circular,
+            allow_nan=self.allow_nan,
+            sort_keys=self.sort_keys,
+            indent=self.indent,
+            separators=(self.item_separator, self.key_separator),
+        )
+
+    def _encode_list(self, o: list[Any] | tuple[Any]) -> str:
+        if self._put_on_single_line(o):
+            return "[" + ", ".join(self.encode(el) for el in o) + "]"
+        self.indentation_level += 1
+        output = [self.indent_str + self.encode(el) for el in o]
+        self.indentation_level -= 1
+        return "[\n" + ",\n".join(output) + "\n" + self.indent_str + "]"
+
+    def _encode_object(self, o: Any) -> str:
+        if not o:
+            return "{}"
+        o = {str(k) if k is not None else "null": v for k, v in o.items()}
+        if self.sort_keys:
+            o = dict(sorted(o.items(), key=lambda x: x[0]))
+        if self._put_on_single_line(o):
+            return "{ " + ", ".join(f"{json.dumps(k)}: {self.encode(el)}" for k, el in o.items()) + " }"
+        self.indentation_level += 1
+        output = [f"{self.indent_str}{json.dumps(k)}: {self.encode(v)}" for k, v in o.items()]
+        self.indentation_level -= 1
+        return "{\n" + ",\n".join(output) + "\n" + self.indent_str + "}"
+
+    def _put_on_single_line(self, o: Any) -> bool:
+        return len(o) <= self.MAX_ITEMS and len(str(o)) - 2 <= self.MAX_WIDTH
+
+    @property
+    def indent_str(self) -> str:
+        return " " * (self.indentation_level * self.indent)  # type: ignore[operator]
+
+
+def _legacy(values: Any, **kwargs: Any) -> str:
+    return json.dumps(values, indent=2, cls=LegacyCompactJSONEncoder, **kwargs)
+
+
+def _compact(values: Any, **kwargs: Any) -> str:
+    return json.dumps(values, indent=2, cls=CompactJSONEncoder, **kwargs)
+
+
+@pytest.mark.parametrize("file", sorted(TESTS.rglob("*.json")), ids=lambda file: str(file.relative_to(TESTS)))
+def test_compatible_with_legacy_encoder(file: Path) -> None:
+    values = json.loads(file.read_bytes())
+    assert dict_to_json_str(values) == _legacy(values)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [],
+        {},
+        (1,),
+        [(), (1,), (1, 2), [None, True, False], {"a": {}}],
+        {1: "a", None: 2, "b": [1.5, 1e-7, 10.0**20, -0.0]},
+        [{1: "x" * 100}, {"1": "x" * 100}, {"k": "x" * 111}, {"k": "x" * 112}],
+        ["é", "it's", 'say "hi"', "\n\t\\", "😀", "x" * 200],
+        [list(range(10)), list(range(11)), {str(i): i for i in range(11)}],
+        [[[[[[[[[[{"deep": [1, 2, {"deeper": ["x" * 30] * 4}]}]]]]]]]]]],
+        OrderedDict(b=OrderedDict(a=1), a=[OrderedDict(c=2)]),
+    ],
+)
+@pytest.mark.parametrize("kwargs", [{}, {"sort_keys": True}, {"ensure_ascii": False}])
+def test_compatible_with_legacy_encoder_edge_cases(values: Any, kwargs: dict[str, Any]) -> None:
+    assert _compact(values, **kwargs) == _legacy(values, **kwargs)
+
+
+def _duration(run: Callable[[], Any], repeat: int = 1) -> float:
+    durations = []
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.process_time()
+            run()
+            durations.append(time.process_time() - start)
+    finally:
+        gc.enable()
+    return max(min(durations), 1e-9)
+
+
+def _nested_descriptor(functions: int) -> dict[str, Any]:
+    def component(depth: int) -> dict[str, Any]:
+        if depth == 0:
+            return {"name": "amount", "type": "uint256", "internalType": "uint256"}
+        return {"name": f"nested{depth}", "type": "tuple[]", "components": [component(depth - 1), component(0)]}
+
+    abi = [
+        {
+            "type": "function",
+            "name": f"function{i}",
+            "inputs": [component(16)],
+            "outputs": [],
+            "stateMutability": "view",
+        }
+        for i in range(functions)
+    ]
+    return {"context": {"contract": {"abi": abi}}}
+
+
+def test_compatible_with_legacy_encoder_deeply_nested() -> None:
+    descriptor = _nested_descriptor(2)
+    assert dict_to_json_str(descriptor) == _legacy(descriptor)
+
+
+@pytest.mark.benchmark
+def test_encode_throughput() -> None:
+    descriptor = _nested_descriptor(100)
+
+    before = _duration(lambda: _legacy(descriptor))
+    after = _duration(lambda: dict_to_json_str(descriptor))
+
+    assert after * 2 < before
+
+
+def _write(path: Path, content: Any, mtime: int = 1_000_000_000) -> Path:
+    path.write_text(json.dumps(content))
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def _count_reads(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    reads: list[Path] = []
+    dict_from_json_file = json_module.dict_from_json_file
+
+    def counting_dict_from_json_file(path: Path) -> Any:
+        reads.append(path)
+        return dict_from_json_file(path)
+
+    monkeypatch.setattr(json_module, "dict_from_json_file", counting_dict_from_json_file)
+    return reads
+
+
+def test_load_json_with_includes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    reads = _count_reads(monkeypatch)
+    common = _write(tmp_path / "common.json", {"a": 1, "nested": {"b": 2, "c": 3}})
+    other = _write(tmp_path / "other.json", {"includes": "common.json", "d": 4})
+    first = _write(tmp_path / "first.json", {"includes": ["other.json", "common.json"], "nested": {"c": 5}})
+    second = _write(tmp_path / "second.json", {"includes": "common.json", "a": 6})
+
+    loaded = load_json_with_includes(first)
+    assert loaded.value == {"a": 1, "d": 4, "nested": {"b": 2, "c": 5}}
+    assert loaded.dependencies == {first, other, common}
+    assert load_json_with_includes(second).value == {"a": 6, "nested": {"b": 2, "c": 3}}
+    assert load_json_with_includes(first) is loaded
+    assert reads == [first, other, common, second]
+
+    _write(common, {"a": 7}, mtime=1_000_000_001)
+    assert read_json_with_includes(second) == {"a": 6}
+    assert reads[4:] == [second, common]
+
+
+def test_load_json_with_includes_does_not_cache_recent_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    reads = _count_reads(monkeypatch)
+    path = tmp_path / "recent.json"
+    path.write_text(json.dumps({"a": 1}))
+    assert read_json_with_includes(path) == {"a": 1}
+    path.write_text(json.dumps({"a": 2}))
+    assert read_json_with_includes(path) == {"a": 2}
+    assert len(reads) == 2
+
+
+def test_read_json_with_includes_returns_copy(tmp_path: Path) -> None:
+    _write(tmp_path / "common.json", {"nested": {"a": [1]}})
+    path = _write(tmp_path / "file.json", {"includes": "common.json"})
+    read_json_with_includes(path)["nested"]["a"].append(2)
+    assert read_json_with_includes(path) == {"nested": {"a": [1]}}
+
+
+def test_load_json_with_includes_circular(tmp_path: Path) -> None:
+    _write(tmp_path / "a.json", {"includes": "b.json"})
+    _write(tmp_path / "b.json", {"includes": ["c.json", "a.json"]})
+    _write(tmp_path / "c.json", {})
+    a, b = tmp_path / "a.json", tmp_path / "b.json"
+    with pytest.raises(ValueError, match=re.escape(f"Circular include: {a} -> {b} -> {a}")):
+        load_json_with_includes(a)
+
+
+@pytest.fixture
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> JSONBackend:
+    backend = JSONBackend(request.param)
+    if find_spec(backend.value) is None:
+        pytest.skip(f"{backend} is not installed")
+    monkeypatch.setattr(json_module, "_backend", None)
+    set_json_backend(backend)
+    return backend
+
+
+BACKENDS = [backend.value for backend in JSONBackend]
+
+
+@pytest.mark.parametrize("backend", BACKENDS, indirect=True)
+@pytest.mark.parametrize(
+    "document",
+    [
+        '{"a": [1, -2, 3.5, true, false, null], "b": {"c": "é😀\\u0000"}}',
+        f'{{"threshold": {2**256 - 1}, "small": -{2**63}, "list": [{10**19}, 1e400]}}',
+        '{"nan": NaN, "inf": -Infinity}',
+        "[]",
+    ],
+)
+def test_json_backend_loads(backend: JSONBackend, document: str) -> None:
+    expected = json.loads(document)
+    assert json_module.json_loads(document) == json_module.json_loads(document.encode()) == expected
+    assert get_json_backend() == backend
+    if "NaN" not in document and "Infinity" not in document and "1e400" not in document:
+        assert json.loads(json_module.json_dumps(expected)) == expected
+
+
+@pytest.mark.parametrize("backend", BACKENDS, indirect=True)
+def test_json_backend_invalid(backend: JSONBackend) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        json_module.json_loads(b'{"a": ')
+
+
+def test_json_backend_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(json_module, "_backend", None)
+    monkeypatch.setenv(json_module.JSON_BACKEND_ENV, "json")
+    assert get_json_backend() == JSONBackend.STDLIB
+    monkeypatch.setattr(json_module, "find_spec", lambda name: None)
+    with pytest.raises(ValueError, match="JSON backend orjson is not installed"):
+        set_json_backend(JSONBackend.ORJSON)
+
+
+def test_model_from_json_file_without_includes(tmp_path: Path) -> None:
+    content = json.loads(DESCRIPTOR.read_text())
+    path = tmp_path / "calldata-test.json"
+    path.write_text(json.dumps(content))
+    expected = InputERC7730Descriptor.model_validate(content, strict=False)
+    assert InputERC7730Descriptor.load(path) == expected
+
+    (tmp_path / "common.json").write_text(json.dumps({"metadata": content.pop("metadata")}))
+    path.write_text(json.dumps({"includes": "common.json", **content}))
+    assert InputERC7730Descriptor.load(path) == expected
+
+
+@pytest.mark.parametrize("backend", list(JSONBackend))
+def test_json_backend_equals_stdlib(backend: JSONBackend) -> None:
+    if find_spec(backend.value) is None:
+        pytest.skip(f"{backend} is not installed")
+    documents = [file.read_bytes() for file in sorted(TESTS.rglob("*.json"))]
+    try:
+        set_json_backend(backend)
+        for document in documents:
+            value = json_module.json_loads(document)
+            assert value == json.loads(document)
+            assert json.loads(json_module.json_dumps(value)) == value
+    finally:
+        set_json_backend()
+
+
+@pytest.mark.benchmark
+def test_json_backends_throughput() -> None:
+    documents = [file.read_bytes() for file in sorted(TESTS.rglob("*.json"))]
+    values = [json.loads(document) for document in documents]
+    durations: dict[JSONBackend, float] = {}
+    try:
+        for backend in JSONBackend:
+            if find_spec(backend.value) is None:
+                continue
+            set_json_backend(backend)
+            durations[backend] = _duration(lambda: [json_module.json_dumps(value) for value in values], repeat=20)
+    finally:
+        set_json_backend()
+
+    for backend in (JSONBackend.MSGSPEC, JSONBackend.ORJSON):
+        if backend in durations:
+            assert durations[backend] * 2 < durations[JSONBackend.STDLIB]
+
+
+@pytest.mark.benchmark
+def test_model_load_throughput(tmp_path: Path) -> None:
+    content = json.loads(DESCRIPTOR.read_text())
+    path = tmp_path / "calldata-test.json"
+    path.write_text(json.dumps(content))
+
+    before = _duration(
+        lambda: [InputERC7730Descriptor.model_validate(read_json_with_includes(path), strict=False) for _ in range(500)]
+    )
+    after = _duration(lambda: [InputERC7730Descriptor.load(path) for _ in range(500)])
+
+    assert after < before
@@ -0,0 +1,26 @@
+from pathlib import Path
+
+from erc7730.common.output import ListOutputAdder, Output
+from erc7730.common.parallel import output_from_compact, output_to_compact
+from erc7730.format.format import format_all
+
+
+def test_compact_output_round_trip() -> None:
+    output = Output(file=None, line=3, title="Some title", message="Some message", level=Output.Level.WARNING)
+    assert output_from_compact(output_to_compact(output)) == output
+
+
+def test_format_all_with_jobs(tmp_path: Path) -> None:
+    valid_files = [tmp_path / f"calldata-{i}.json" for i in range(8)]
+    for file in valid_files:
+        file.write_text('{"context":{"$id":"test"},"metadata":{},"display":{"formats":{}}}')
+    invalid_file = tmp_path / "eip712-invalid.json"
+    invalid_file.write_text("{")
+
+    out = ListOutputAdder()
+    assert format_all([tmp_path], out, jobs=2) == 9
+
+    for file in valid_files:
+        assert file.read_text() == '{ "context": { "$id": "test" }, "metadata": {}, "display": { "formats": {} } }\n'
+    assert out.has_errors
+    assert [output.file for output in out.outputs] == [invalid_file]
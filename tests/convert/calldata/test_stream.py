@@ -0,0 +1,90 @@
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from erc7730.common.output import ListOutputAdder
+from erc7730.convert.calldata.stream import calldata_all
+from erc7730.main import app
+
+DATA = Path(__file__).parents[1] / "resolved" / "data"
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def registry(tmp_path: Path) -> Path:
+    registry = tmp_path / "registry"
+    for name in ("a", "b"):
+        (registry / name).mkdir(parents=True)
+        content = json.loads((DATA / "minimal_contract_input.json").read_text())
+        content["context"]["contract"]["deployments"][0]["chainId"] = 1 if name == "a" else 10
+        (registry / name / f"calldata-{name}.json").write_text(json.dumps(content))
+    (registry / "eip712-c.json").write_text((DATA / "minimal_eip712_input.json").read_text())
+    return registry
+
+
+@pytest.mark.parametrize("jobs", [None, 2])
+def test_calldata_all(registry: Path, jobs: int | None) -> None:
+    lines: list[str] = []
+    out = ListOutputAdder()
+    assert calldata_all([registry], lines.append, out, source="https://example.org/registry/", jobs=jobs) == (3, 2)
+    assert not out.has_errors
+    descriptors = [json.loads(line) for line in lines]
+    assert all(line.endswith("\n") and line.count("\n") == 1 for line in lines)
+    assert [descriptor["chain_id"] for descriptor in descriptors] == [1, 10]
+    assert [descriptor["source"] for descriptor in descriptors] == [
+        "https://example.org/registry/a/calldata-a.json",
+        "https://example.org/registry/b/calldata-b.json",
+    ]
+
+
+def test_calldata_all_reports_invalid_file(registry: Path) -> None:
+    (registry / "a" / "calldata-a.json").write_text("{")
+    lines: list[str] = []
+    out = ListOutputAdder()
+    assert calldata_all([registry], lines.append, out) == (3, 1)
+    assert out.has_errors
+    assert [output.file for output in out.outputs] == [registry / "a" / "calldata-a.json"]
+
+
+def test_calldata_cli(registry: Path, tmp_path: Path) -> None:
+    result = runner.invoke(app, ["calldata", "--chain-id", "10", str(registry)])
+    assert result.exit_code == 0
+    (line,) = result.stdout.splitlines()
+    assert json.loads(line)["chain_id"] == 10
+
+    output = tmp_path / "calldata.ndjson"
+    result = runner.invoke(app, ["calldata", "--output", str(output), str(registry)])
+    assert result.exit_code == 0
+    assert len(output.read_text().splitlines()) == 2
+
+    result = runner.invoke(app, ["calldata", str(registry / "a" / "calldata-a.json")])
+    assert result.exit_code == 0
+    assert result.stdout.startswith("[")
+    assert result.stdout.count('"type": "calldata"') == 1
+
+
+def test_calldata_cli_binary(registry: Path, tmp_path: Path) -> None:
+    result = runner.invoke(app, ["calldata", "--ndjson", str(registry)])
+    assert result.exit_code == 0
+    descriptors = [json.loads(line) for line in result.stdout.splitlines()]
+
+    output = tmp_path / "calldata.bin"
+    result = runner.invoke(app, ["calldata", "--format", "binary", "--output", str(output), str(registry)])
+    assert result.exit_code == 0
+    assert output.read_bytes() == b"".join(
+        bytes([frame_type]) + len(struct := bytes.fromhex(hex_struct)).to_bytes(2) + struct
+        for descriptor in descriptors
+        for frame_type, hex_struct in [
+            (1, descriptor["transaction_info"]["descriptor"]),
+            *((2, enum["descriptor"]) for enum in descriptor["enums"]),
+            *((3, field["descriptor"]) for field in descriptor["fields"]),
+        ]
+    )
+
+    result = runner.invoke(app, ["calldata", "--format", "binary", str(registry / "a" / "calldata-a.json")])
+    assert result.exit_code == 0
+    assert result.stdout_bytes.startswith(b"\x01")
+    assert result.stdout_bytes == output.read_bytes()[: len(result.stdout_bytes)]
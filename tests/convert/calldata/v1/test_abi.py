@@ -0,0 +1,48 @@
+from erc7730.common.output import RaisingOutputAdder
+from erc7730.convert.calldata.v1.abi import ABIDynamicArray, ABIStaticArray, ABIStruct, function_to_abi_tree
+from erc7730.convert.calldata.v1.path import convert_data_path
+from erc7730.model.abi import Component, Function, InputOutput
+from erc7730.model.paths.path_parser import to_path
+
+DEPTH = 200
+
+
+def _nested_function(depth: int, leaf_type: str = "uint256") -> Function:
+    component = Component(name="leaf", type=leaf_type)
+    for _ in range(depth):
+        component = Component(name="inner", type="tuple", components=[Component(name="x", type="uint8"), component])
+    return Function(name="f", inputs=[InputOutput(name="outer", type="tuple", components=[component])])
+
+
+def test_abi_tree_memoized() -> None:
+    tree = function_to_abi_tree(_nested_function(3))
+    assert function_to_abi_tree(_nested_function(3)) is tree
+    assert function_to_abi_tree(_nested_function(3, leaf_type="string")) is not tree
+
+
+def test_abi_tree_sizes_and_offsets() -> None:
+    tree = function_to_abi_tree(
+        Function(
+            name="f",
+            inputs=[
+                InputOutput(name="a", type="uint256[3]"),
+                InputOutput(name="b", type="tuple", components=[Component(name="c", type="bytes32[2]")]),
+                InputOutput(name="d", type="string[]"),
+                InputOutput(name="e", type="address"),
+            ],
+        )
+    )
+    assert isinstance(tree, ABIStruct)
+    assert tree.is_dynamic
+    assert tree.offsets == {"a": 0, "b": 3, "d": 5, "e": 6}
+    assert isinstance(a := tree.components["a"], ABIStaticArray)
+    assert (a.is_dynamic, a.size, a.dimension) == (False, 3, 3)
+    assert isinstance(d := tree.components["d"], ABIDynamicArray)
+    assert (d.is_dynamic, d.size, d.component.is_dynamic) == (True, 1, True)
+
+
+def test_convert_deeply_nested_path() -> None:
+    tree = function_to_abi_tree(_nested_function(DEPTH))
+    path = to_path("#." + ".".join(["outer", *(["inner"] * DEPTH), "leaf"]))
+    result = convert_data_path(path, tree, RaisingOutputAdder())  # type: ignore[arg-type]
+    assert result is not None
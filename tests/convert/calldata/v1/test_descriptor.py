@@ -0,0 +1,54 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from erc7730.common.output import ListOutputAdder
+from erc7730.convert.calldata.v1 import selector as selector_module
+from erc7730.convert.calldata.v1.descriptor import convert_descriptor
+from erc7730.model.input.descriptor import InputERC7730Descriptor
+
+DESCRIPTOR = Path(__file__).parents[2] / "resolved" / "data" / "minimal_contract_input.json"
+CHAIN_IDS = [1, 10, 56, 137, 8453]
+
+
+@pytest.fixture
+def input_descriptor() -> InputERC7730Descriptor:
+    content = json.loads(DESCRIPTOR.read_text())
+    content["context"]["contract"]["deployments"] = [
+        {"chainId": chain_id, "address": f"0x{i + 1:040x}"} for i, chain_id in enumerate(CHAIN_IDS)
+    ]
+    content["metadata"]["enums"] = {"e1": {"1": "one"}}
+    return InputERC7730Descriptor.model_validate(content, strict=False)
+
+
+def test_fields_converted_once_per_selector(
+    input_descriptor: InputERC7730Descriptor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = 0
+    convert_field = selector_module.convert_field
+
+    def counting_convert_field(**kwargs: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        return convert_field(**kwargs)
+
+    monkeypatch.setattr(selector_module, "convert_field", counting_convert_field)
+    out = ListOutputAdder()
+    descriptors = convert_descriptor(input_descriptor, source=None, chain_id=None, out=out)
+
+    assert not out.has_errors
+    assert calls == 1
+    assert [descriptor.chain_id for descriptor in descriptors] == CHAIN_IDS
+    assert len({descriptor.transaction_info.hash for descriptor in descriptors}) == 1
+    for i, descriptor in enumerate(descriptors):
+        (enum,) = descriptor.enums
+        assert (enum.chain_id, enum.address) == (descriptor.chain_id, f"0x{i + 1:040x}")
+
+
+def test_chain_id_filter(input_descriptor: InputERC7730Descriptor) -> None:
+    out = ListOutputAdder()
+    (descriptor,) = convert_descriptor(input_descriptor, source=None, chain_id=137, out=out)
+    assert descriptor.chain_id == 137
+    assert convert_descriptor(input_descriptor, source=None, chain_id=2, out=out) == []
@@ -0,0 +1,264 @@
+import json
+import time
+from glob import glob
+from pathlib import Path
+from typing import Any
+
+import eth_abi
+import pytest
+from eth_utils import function_abi_to_4byte_selector, get_abi_input_types
+
+from erc7730.common.output import ListOutputAdder, RaisingOutputAdder
+from erc7730.convert.calldata.v1.abi import function_to_abi_tree
+from erc7730.convert.calldata.v1.descriptor import convert_descriptor
+from erc7730.convert.calldata.v1.evaluator import CalldataBatchEvaluator, CalldataEvaluator, _decode_column, _decoder
+from erc7730.convert.calldata.v1.path import apply_path, convert_data_path
+from erc7730.model.abi import Component, Function, InputOutput
+from erc7730.model.calldata.descriptor import CalldataDescriptorV1
+from erc7730.model.calldata.v1.value import CalldataDescriptorTypeFamily
+from erc7730.model.input.descriptor import InputERC7730Descriptor
+from erc7730.model.paths.path_parser import to_path
+
+DATA = Path(__file__).resolve().parent / "data"
+DESCRIPTOR = Path(__file__).parents[2] / "resolved" / "data" / "minimal_contract_input.json"
+
+FUNCTION = Function(
+    name="f",
+    inputs=[
+        InputOutput(name="names", type="string[]"),
+        InputOutput(name="amount", type="uint256"),
+        InputOutput(
+            name="transfers",
+            type="tuple[]",
+            components=[Component(name="to", type="address"), Component(name="data", type="bytes")],
+        ),
+        InputOutput(name="matrix", type="uint256[2][][2]"),
+    ],
+)
+ARGS = [
+    ["hello", "world!"],
+    7,
+    [("0x" + "11" * 20, b"\x01\x02\x03"), ("0x" + "22" * 20, b"")],
+    [[[1, 2], [3, 4], [5, 6]], [[7, 8], [9, 10]]],
+]
+
+
+def _calldata(function: Function, args: Any) -> str:
+    abi = function.model_dump(mode="json")
+    return (function_abi_to_4byte_selector(abi) + eth_abi.encode(get_abi_input_types(abi), args)).hex()
+
+
+class CountingCalldataEvaluator(CalldataEvaluator):
+    reads = 0
+
+    def _word(self, offset: int) -> int:
+        self.reads += 1
+        return super()._word(offset)
+
+
+@pytest.fixture
+def evaluator() -> CountingCalldataEvaluator:
+    return CountingCalldataEvaluator(_calldata(FUNCTION, ARGS))
+
+
+@pytest.mark.parametrize(
+    "path,expected",
+    [
+        ("#.names.[0]", "hello"),
+        ("#.names.[-1]", "world!"),
+        ("#.names.[]", ["hello", "world!"]),
+        ("#.amount", 7),
+        ("#.transfers.[].to", ["0x" + "11" * 20, "0x" + "22" * 20]),
+        ("#.transfers.[].data", ["0x010203", "0x"]),
+        ("#.transfers.[0].data.[1:]", "0x0203"),
+        ("#.transfers.[0].data.[:-1]", "0x0102"),
+        ("#.matrix.[0].[].[1]", [2, 4, 6]),
+        ("#.matrix.[-1].[-1].[-1]", 10),
+    ],
+)
+def test_evaluate_path(evaluator: CalldataEvaluator, path: str, expected: Any) -> None:
+    value = convert_data_path(to_path(path), function_to_abi_tree(FUNCTION), RaisingOutputAdder())  # type: ignore[arg-type]
+    assert value is not None
+    assert evaluator.evaluate(value) == expected
+
+
+def test_evaluate_path_out_of_bounds(evaluator: CalldataEvaluator) -> None:
+    value = convert_data_path(to_path("#.names.[2]"), function_to_abi_tree(FUNCTION), RaisingOutputAdder())  # type: ignore[arg-type]
+    assert value is not None
+    with pytest.raises(IndexError, match="out of bounds"):
+        evaluator.evaluate(value)
+
+
+def test_shared_prefixes_resolved_once(evaluator: CountingCalldataEvaluator) -> None:
+    abi_tree = function_to_abi_tree(FUNCTION)
+    to = convert_data_path(to_path("#.transfers.[].to"), abi_tree, RaisingOutputAdder())  # type: ignore[arg-type]
+    data = convert_data_path(to_path("#.transfers.[].data"), abi_tree, RaisingOutputAdder())  # type: ignore[arg-type]
+    assert to is not None and data is not None
+
+    evaluator.evaluate(to)
+    reads = evaluator.reads
+    assert reads == 4  # transfers offset, transfers length, offset of both elements
+    evaluator.evaluate(to)
+    assert evaluator.reads == reads
+    evaluator.evaluate(data)
+    assert evaluator.reads == reads + 4  # offset and length of both data elements
+
+
+@pytest.mark.parametrize("test_file", sorted(glob(str(DATA / "values" / "*.json"))), ids=lambda f: Path(f).stem)
+def test_evaluate_consistent_with_apply_path(test_file: str) -> None:
+    test_case = json.loads(Path(test_file).read_text())
+    if test_case["error"] is not None:
+        pytest.skip("error case")
+    function = Function.model_validate(test_case["abi"], strict=False)
+    calldata = _calldata(function, test_case["args"])
+    value = convert_data_path(to_path(test_case["path"]), function_to_abi_tree(function), RaisingOutputAdder())  # type: ignore[arg-type]
+    assert value is not None
+    assert CalldataEvaluator(calldata).evaluate(value) == apply_path(calldata, value) == test_case["result"]
+
+
+def test_evaluate_descriptor() -> None:
+    input_descriptor = InputERC7730Descriptor.model_validate(json.loads(DESCRIPTOR.read_text()), strict=False)
+    (descriptor,) = convert_descriptor(input_descriptor, source=None, chain_id=None, out=ListOutputAdder())
+    assert isinstance(descriptor, CalldataDescriptorV1)
+    calldata = "0x5ca8f297" + eth_abi.encode(["bytes4"], [b"\xde\xad\xbe\xef"]).hex()
+
+    (evaluated,) = CalldataEvaluator(calldata).evaluate_descriptor(descriptor)
+    assert evaluated.field == descriptor.fields[0]
+    assert evaluated.value == "0xdeadbeef" + "00" * 28
+
+
+@pytest.fixture
+def batch_descriptor() -> CalldataDescriptorV1:
+    function = Function(
+        name="transfer",
+        inputs=[
+            InputOutput(name="to", type="address"),
+            InputOutput(name="amount", type="uint256"),
+            InputOutput(name="memo", type="string"),
+            InputOutput(name="recipients", type="address[]"),
+        ],
+    )
+    content = json.loads(DESCRIPTOR.read_text())
+    content["context"]["contract"]["abi"] = [function.model_dump(mode="json", exclude_none=True)]
+    content["display"]["formats"] = {
+        "transfer(address,uint256,string,address[])": {
+            "fields": [
+                {"path": "to", "label": "To", "format": "raw"},
+                {"path": "amount", "label": "Amount", "format": "tokenAmount", "params": {"tokenPath": "to"}},
+                {"path": "memo", "label": "Memo", "format": "raw"},
+                {"path": "recipients.[]", "label": "Recipients", "format": "raw"},
+                {"path": "@.value", "label": "Value", "format": "amount"},
+            ]
+        }
+    }
+    input_descriptor = InputERC7730Descriptor.model_validate(content, strict=False)
+    out = ListOutputAdder()
+    (descriptor,) = convert_descriptor(input_descriptor, source=None, chain_id=None, out=out)
+    assert not out.has_errors
+    assert isinstance(descriptor, CalldataDescriptorV1)
+    return descriptor
+
+
+def test_batch_evaluate(batch_descriptor: CalldataDescriptorV1) -> None:
+    selector = bytes.fromhex(batch_descriptor.transaction_info.selector.removeprefix("0x"))
+    calldata = [
+        selector
+        + eth_abi.encode(
+            ["address", "uint256", "string", "address[]"],
+            [f"0x{i + 1:040x}", i * 10**18, f"memo {i}", [f"0x{j + 1:040x}" for j in range(i % 3)]],
+        )
+        for i in range(20)
+    ]
+    values = list(range(20))
+
+    columns = CalldataBatchEvaluator(batch_descriptor).evaluate(calldata, values=values)
+
+    assert [column.field for column in columns] == batch_descriptor.fields
+    for i, data in enumerate(calldata):
+        evaluator = CalldataEvaluator(data, value=values[i])
+        for column, evaluated in zip(columns, evaluator.evaluate_descriptor(batch_descriptor), strict=True):
+            assert column.values[i] == evaluated.value
+            assert (column.tokens[i] if column.tokens is not None else None) == evaluated.token
+    assert columns[1].values[3] == 3 * 10**18
+    assert columns[1].tokens is not None and columns[1].tokens[3] == f"0x{4:040x}"
+    assert columns[2].values[3] == "memo 3"
+    assert columns[3].values[5] == [f"0x{1:040x}", f"0x{2:040x}"]
+    assert columns[4].values == values
+
+
+def test_batch_evaluate_errors(batch_descriptor: CalldataDescriptorV1) -> None:
+    evaluator = CalldataBatchEvaluator(batch_descriptor)
+    with pytest.raises(ValueError, match="does not match descriptor selector"):
+        evaluator.evaluate(["0x00000000"])
+    selector = batch_descriptor.transaction_info.selector
+    with pytest.raises(IndexError, match="transaction 1 is too short"):
+        evaluator.evaluate([selector + "00" * 32 * 4, selector], values=[0, 0])
+    with pytest.raises(ValueError, match="VALUE is not available"):
+        evaluator.evaluate([])
+
+
+def _static_calldata(descriptor: CalldataDescriptorV1, count: int) -> list[bytes]:
+    selector = bytes.fromhex(descriptor.transaction_info.selector.removeprefix("0x"))
+    encoded = eth_abi.encode(["address", "uint256", "string", "address[]"], [f"0x{1:040x}", 10**18, "memo", []])
+    return [selector + encoded] * count
+
+
+def test_batch_evaluate_static_equals_apply_path(batch_descriptor: CalldataDescriptorV1) -> None:
+    calldata = _static_calldata(batch_descriptor, 3)
+    static_descriptor = batch_descriptor.model_copy(update={"fields": batch_descriptor.fields[:2]})
+    columns = CalldataBatchEvaluator(static_descriptor).evaluate(calldata)
+    amount = static_descriptor.fields[1].param.value
+    assert columns[1].values == [apply_path(data.hex(), amount) for data in calldata]  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "type_family", [family for family in CalldataDescriptorTypeFamily if "FIXED" not in family.name]
+)
+def test_decode_column_equals_decoder(type_family: CalldataDescriptorTypeFamily) -> None:
+    words = [b"\x00" * 32, b"\xff" * 32, bytes(range(32)), b"\x00" * 31 + b"\x01", b"a" * 32]
+    if type_family == CalldataDescriptorTypeFamily.STRING:
+        words = [word for word in words if word.isascii()]
+    rows = [b"\x00" * 4 + word + b"\x00" * 32 for word in words]
+    decode = _decoder(type_family)
+    assert _decode_column(rows, 4, type_family) == [decode(memoryview(word)) for word in words]
+
+
+@pytest.mark.benchmark
+def test_batch_evaluate_throughput_per_transaction_evaluator(batch_descriptor: CalldataDescriptorV1) -> None:
+    calldata = _static_calldata(batch_descriptor, 20000)
+    static_descriptor = batch_descriptor.model_copy(update={"fields": batch_descriptor.fields[:2]})
+    evaluator = CalldataBatchEvaluator(static_descriptor)
+
+    start = time.process_time()
+    for data in calldata:
+        CalldataEvaluator(data).evaluate_descriptor(static_descriptor)
+    before = time.process_time() - start
+    start = time.process_time()
+    evaluator.evaluate(calldata)
+    after = max(time.process_time() - start, 1e-9)
+
+    assert after * 5 < before
+
+
+@pytest.mark.benchmark
+def test_batch_evaluate_throughput(batch_descriptor: CalldataDescriptorV1) -> None:
+    calldata = _static_calldata(batch_descriptor, 20000)
+    hex_calldata = [data.hex() for data in calldata]
+    static_descriptor = batch_descriptor.model_copy(update={"fields": batch_descriptor.fields[:2]})
+    static = [field.param.value for field in static_descriptor.fields]
+    evaluator = CalldataBatchEvaluator(static_descriptor)
+
+    def per_transaction() -> list[list[Any]]:
+        return [[apply_path(data, value) for data in hex_calldata] for value in static]  # type: ignore[arg-type]
+
+    def batch() -> list[list[Any]]:
+        return [column.values for column in evaluator.evaluate(calldata)]
+
+    start = time.process_time()
+    per_transaction()
+    before = time.process_time() - start
+    start = time.process_time()
+    batch()
+    after = max(time.process_time() - start, 1e-9)
+
+    assert after * 2 < before
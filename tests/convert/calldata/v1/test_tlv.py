@@ -0,0 +1,55 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from erc7730.common.binary import TLVWriter, tlv
+from erc7730.common.output import ListOutputAdder
+from erc7730.convert.calldata.v1.descriptor import convert_descriptor
+from erc7730.convert.calldata.v1.tlv import CalldataDescriptorFrameType, tlv_descriptor
+from erc7730.model.calldata.descriptor import CalldataDescriptorV1
+from erc7730.model.input.descriptor import InputERC7730Descriptor
+
+DESCRIPTOR = Path(__file__).parents[2] / "resolved" / "data" / "minimal_contract_input.json"
+
+
+def test_writer_nested_structs() -> None:
+    writer = TLVWriter()
+    writer.integer(0x01, 1, 1)
+    with writer.struct(0x02):
+        writer.tlv(0x03, "abc")
+        with writer.struct(0x04):
+            writer.integer(0x05, -2, 2, signed=True)
+        writer.hex(0x06, "0xdead")
+    writer.tlv(0x07)
+    expected = tlv(0x01, b"\x01") + tlv(
+        0x02, tlv(0x03, "abc"), tlv(0x04, tlv(0x05, (-2).to_bytes(2, signed=True))), tlv(0x06, b"\xde\xad")
+    )
+    assert writer.getvalue() == expected + tlv(0x07)
+
+
+def test_writer_overflow() -> None:
+    writer = TLVWriter()
+    with pytest.raises(OverflowError, match="too big"), writer.struct(0x01):
+        writer.tlv(0x02, b"\x00" * 254)
+    with pytest.raises(OverflowError):
+        TLVWriter().tlv(0x01, b"\x00" * 256)
+
+
+def test_tlv_descriptor() -> None:
+    content = json.loads(DESCRIPTOR.read_text())
+    input_descriptor = InputERC7730Descriptor.model_validate(content, strict=False)
+    (descriptor,) = convert_descriptor(input_descriptor, source=None, chain_id=None, out=ListOutputAdder())
+    assert isinstance(descriptor, CalldataDescriptorV1)
+
+    frames, encoded = [], tlv_descriptor(descriptor)
+    while encoded:
+        length = int.from_bytes(encoded[1:3])
+        frames.append((encoded[0], encoded[3 : 3 + length].hex()))
+        encoded = encoded[3 + length :]
+
+    assert frames == [
+        (CalldataDescriptorFrameType.TRANSACTION_INFO, descriptor.transaction_info.descriptor),
+        *((CalldataDescriptorFrameType.ENUM_VALUE, enum.descriptor) for enum in descriptor.enums),
+        *((CalldataDescriptorFrameType.FIELD, field.descriptor) for field in descriptor.fields),
+    ]
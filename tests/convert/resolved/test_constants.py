@@ -1,15 +1,21 @@
+import time
+from typing import Any
+
 import pytest
 from pydantic import TypeAdapter
 from pydantic_string_url import HttpUrl
 
 from erc7730.common.output import RaisingOutputAdder
+from erc7730.common.properties import get_property
+from erc7730.convert.resolved import constants as constants_module
 from erc7730.convert.resolved.constants import DefaultConstantProvider
 from erc7730.model.input.context import InputContract, InputContractContext, InputDeployment
 from erc7730.model.input.descriptor import InputERC7730Descriptor
 from erc7730.model.input.display import InputDisplay, InputFieldDescription, InputFormat
 from erc7730.model.input.metadata import InputMetadata
 from erc7730.model.input.path import DescriptorPathStr
-from erc7730.model.paths import DescriptorPath
+from erc7730.model.paths import ROOT_DESCRIPTOR_PATH, DescriptorPath
+from erc7730.model.paths.path_ops import descriptor_path_append
 from erc7730.model.paths.path_parser import to_path
 
 
@@ -163,3 +169,63 @@ def test_resolve_path_or_none_invalid_no_such_constant() -> None:
 @pytest.mark.raises(match='.*\\$.metadata.constants has no "baz" field.')
 def test_resolve_path_or_none_invalid_empty_constants() -> None:
     _provider().resolve_path_or_none(to_path("$.metadata.constants.baz"), RaisingOutputAdder())
+
+
+@pytest.mark.raises(match='.*Path \\$.foo is invalid, \\$. has no "foo" field.')
+def test_get_invalid_root_field() -> None:
+    _provider().get(_descriptor_path("$.foo"), RaisingOutputAdder())
+
+
+@pytest.mark.raises(match=".*Path \\$.context.contract.deployments.\\[2\\] is invalid, index 2 is out of bounds.")
+def test_get_invalid_out_of_bounds() -> None:
+    _provider().get(_descriptor_path("$.context.contract.deployments.[2]"), RaisingOutputAdder())
+
+
+def test_get_from_list_negative_index() -> None:
+    assert _provider().get(_descriptor_path("$.context.contract.deployments.[-1].chainId"), RaisingOutputAdder()) == 42
+
+
+def test_get_metadata_is_indexed(monkeypatch: pytest.MonkeyPatch) -> None:
+    provider = _provider(foo="bar", baz=42)
+    monkeypatch.setattr(constants_module, "get_property", None)
+    assert provider.get(_descriptor_path("$.metadata.constants.foo"), RaisingOutputAdder()) == "bar"
+    assert provider.get(_descriptor_path("$.metadata.constants"), RaisingOutputAdder()) == {"foo": "bar", "baz": 42}
+    assert provider.get(_descriptor_path("$.metadata.owner"), RaisingOutputAdder()) is None
+
+
+def _legacy_get(descriptor: InputERC7730Descriptor, path: DescriptorPath) -> Any:
+    """Walk from the descriptor root, building each intermediate path, as done before values were indexed."""
+    current_target: Any = descriptor
+    current_path = parent_path = ROOT_DESCRIPTOR_PATH
+    for element in path.elements:
+        current_path = descriptor_path_append(current_path, element)
+        current_target = get_property(current_target, element.identifier)
+        parent_path = descriptor_path_append(parent_path, element)
+    return current_target
+
+
+@pytest.mark.parametrize(
+    "path", ["$.metadata.constants.constant7", "$.metadata.constants", "$.context.contract.abi", "$.display"]
+)
+def test_get_equals_walk(path: str) -> None:
+    provider = _provider(**{f"constant{i}": i for i in range(10)})
+    descriptor_path = _descriptor_path(path)
+    assert provider.get(descriptor_path, RaisingOutputAdder()) == _legacy_get(provider.descriptor, descriptor_path)
+
+
+@pytest.mark.benchmark
+def test_get_throughput() -> None:
+    provider = _provider(**{f"constant{i}": i for i in range(100)})
+    paths = [_descriptor_path(f"$.metadata.constants.constant{i}") for i in range(100)] * 100
+    out = RaisingOutputAdder()
+
+    start = time.process_time()
+    for path in paths:
+        _legacy_get(provider.descriptor, path)
+    before = time.process_time() - start
+    start = time.process_time()
+    for path in paths:
+        provider.get(path, out)
+    after = max(time.process_time() - start, 1e-9)
+
+    assert after * 5 < before
@@ -0,0 +1,94 @@
+import json
+import re
+import time
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from erc7730.common.output import ListOutputAdder
+from erc7730.convert.convert import convert_and_raise_errors
+from erc7730.convert.resolved.convert_erc7730_input_to_resolved import ERC7730InputToResolved
+from erc7730.model import base
+from erc7730.model.input.descriptor import InputERC7730Descriptor
+from erc7730.model.paths.path_parser import to_path
+from erc7730.model.resolved.descriptor import ResolvedERC7730Descriptor
+from erc7730.model.resolved.display import ResolvedValuePath
+
+DATA = Path(__file__).resolve().parent / "data"
+
+
+@pytest.fixture(autouse=True)
+def trusted_construction(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(base, "_full_validation", False)
+
+
+def _resolve_all() -> list[ResolvedERC7730Descriptor | None]:
+    results = []
+    for input_descriptor_path in sorted(DATA.glob("*_input.json")):
+        if not input_descriptor_path.with_name(input_descriptor_path.name.replace("_input", "_resolved")).exists():
+            continue
+        input_descriptor = InputERC7730Descriptor.load(input_descriptor_path)
+        results.append(ERC7730InputToResolved().convert(input_descriptor, ListOutputAdder()))
+    return results
+
+
+def test_trusted_construction_equals_full_validation() -> None:
+    trusted = _resolve_all()
+    base.set_full_validation(True)
+    validated = _resolve_all()
+    assert all(descriptor is not None for descriptor in trusted)
+    assert trusted == validated
+    for descriptor in trusted:
+        assert descriptor is not None
+        assert ResolvedERC7730Descriptor.model_validate_json(descriptor.to_json_string()) == descriptor
+
+
+def test_full_validation_reports_invalid_models() -> None:
+    relative_path = to_path("relative")
+    assert ResolvedValuePath.construct_trusted({"path": relative_path}).path == relative_path
+    base.set_full_validation(True)
+    with pytest.raises(ValidationError, match="A resolved data path must be absolute"):
+        ResolvedValuePath.construct_trusted({"path": relative_path})
+
+
+def test_invalid_label_constant() -> None:
+    content = json.loads((DATA / "minimal_contract_input.json").read_text())
+    content["metadata"]["constants"] = {"label": 1}
+    content["display"]["formats"]["function1(bytes4)"]["fields"][0]["label"] = "$.metadata.constants.label"
+    with pytest.raises(
+        Exception, match=re.escape("Label defined at $.metadata.constants.label must be a string, got int")
+    ):
+        convert_and_raise_errors(InputERC7730Descriptor.model_validate(content, strict=False), ERC7730InputToResolved())
+
+
+@pytest.mark.benchmark
+def test_trusted_construction_throughput() -> None:
+    content = json.loads((DATA / "minimal_contract_input.json").read_text())
+    inputs = [{"name": f"param{i}", "type": "uint256"} for i in range(30)]
+    content["context"]["contract"]["abi"] = [
+        {"type": "function", "name": f"function{i}", "inputs": inputs, "outputs": []} for i in range(100)
+    ]
+    content["display"]["formats"] = {
+        f"function{i}({','.join(['uint256'] * 30)})": {
+            "intent": f"Function {i}",
+            "fields": [{"path": f"param{j}", "label": f"Param {j}", "format": "raw"} for j in range(30)],
+            "required": [f"param{j}" for j in range(30)],
+        }
+        for i in range(100)
+    }
+    descriptor = InputERC7730Descriptor.model_validate(content, strict=False)
+
+    def duration() -> float:
+        durations = []
+        for _ in range(5):
+            start = time.process_time()
+            assert ERC7730InputToResolved().convert(descriptor, ListOutputAdder()) is not None
+            durations.append(time.process_time() - start)
+        return min(durations)
+
+    trusted = duration()
+    base.set_full_validation(True)
+    validated = duration()
+
+    assert trusted < validated
@@ -0,0 +1,147 @@
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic import TypeAdapter
+
+from erc7730.common.output import ListOutputAdder
+from erc7730.common.pydantic import model_to_json_str
+from erc7730.convert.resolved import references
+from erc7730.convert.resolved.convert_erc7730_input_to_resolved import ERC7730InputToResolved
+from erc7730.model.input.descriptor import InputERC7730Descriptor
+from erc7730.model.input.display import InputFieldParameters, InputNestedFields, InputReference
+
+DATA = Path(__file__).resolve().parent / "data"
+
+
+def _legacy_merge_parameters(
+    definition_params: InputFieldParameters | None, reference_params: dict[str, Any] | None
+) -> InputFieldParameters | None:
+    params: dict[str, Any] = {}
+    if definition_params is not None:
+        params.update(json.loads(model_to_json_str(definition_params)))
+    if reference_params is not None:
+        params.update(reference_params)
+    if not params:
+        return None
+    return TypeAdapter(InputFieldParameters).validate_json(json.dumps(params))
+
+
+def _references(descriptor: InputERC7730Descriptor) -> list[InputReference]:
+    def walk(fields: list[Any]) -> list[InputReference]:
+        result = []
+        for field in fields:
+            if isinstance(field, InputReference):
+                result.append(field)
+            elif isinstance(field, InputNestedFields):
+                result.extend(walk(field.fields))
+        return result
+
+    return [reference for format in descriptor.display.formats.values() for reference in walk(format.fields)]
+
+
+def _reference_cases() -> list[tuple[InputERC7730Descriptor, InputReference]]:
+    cases: list[tuple[InputERC7730Descriptor, InputReference]] = []
+    for path in sorted(DATA.glob("definition_*_input.json")):
+        if not path.with_name(path.name.replace("_input", "_resolved")).exists():
+            continue
+        descriptor = InputERC7730Descriptor.load(path)
+        cases.extend((descriptor, reference) for reference in _references(descriptor))
+    return cases
+
+
+def _reference_heavy_descriptor(formats: int, fields: int) -> InputERC7730Descriptor:
+    content = json.loads((DATA / "minimal_contract_input.json").read_text())
+    inputs = [{"name": "token", "type": "address"}, *({"name": f"amount{i}", "type": "uint256"} for i in range(fields))]
+    signature = f"({','.join(input['type'] for input in inputs)})"
+    content["context"]["contract"]["abi"] = [
+        {"type": "function", "name": f"function{i}", "inputs": inputs, "outputs": []} for i in range(formats)
+    ]
+    content["display"]["definitions"] = {
+        "amount": {"label": "Amount", "format": "tokenAmount", "params": {"tokenPath": "token", "threshold": "0xff"}}
+    }
+    content["display"]["formats"] = {
+        f"function{i}{signature}": {
+            "fields": [
+                {"path": f"amount{j}", "$ref": "$.display.definitions.amount", "params": {"message": "All"}}
+                for j in range(fields)
+            ]
+        }
+        for i in range(formats)
+    }
+    return InputERC7730Descriptor.model_validate(content, strict=False)
+
+
+def test_merge_parameters_equals_json_round_trip() -> None:
+    cases = _reference_cases()
+    assert cases
+    for descriptor, reference in cases:
+        assert descriptor.display.definitions is not None
+        definition = descriptor.display.definitions[reference.ref.elements[-1].identifier]
+        assert references._merge_parameters(definition.params, reference.params) == _legacy_merge_parameters(
+            definition.params, reference.params
+        )
+
+
+def test_merge_parameters_invalid_override() -> None:
+    descriptor = _reference_heavy_descriptor(formats=1, fields=1)
+    assert descriptor.display.definitions is not None
+    definition = descriptor.display.definitions["amount"]
+    with pytest.raises(ValueError, match="Extra inputs are not permitted"):
+        references._merge_parameters(definition.params, {"base": "h"})
+
+
+def test_freeze() -> None:
+    assert references._freeze({"a": [1, {"b": True}]}) == references._freeze({"a": [1, {"b": True}]})
+    assert references._freeze({"a": True}) != references._freeze({"a": 1})
+    assert references._freeze({"a": [["b", 1]]}) != references._freeze({"a": {"b": 1}})
+    hash(references._freeze({"a": [1, {"b": None}]}))
+
+
+def test_reference_parameters_resolved_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+    resolve_field_parameters = references.resolve_field_parameters
+
+    def counting_resolve_field_parameters(*args: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        return resolve_field_parameters(*args)
+
+    monkeypatch.setattr(references, "resolve_field_parameters", counting_resolve_field_parameters)
+    out = ListOutputAdder()
+    resolved = ERC7730InputToResolved().convert(_reference_heavy_descriptor(formats=10, fields=5), out)
+    assert not out.has_errors
+    assert resolved is not None
+    assert calls == 1
+
+    fields = [field for format in resolved.display.formats.values() for field in format.fields]
+    assert len(fields) == 50
+    assert all(field.params == fields[0].params for field in fields)
+    assert fields[0].params.message == "All"
+
+
+@pytest.mark.benchmark
+def test_reference_resolution_throughput(monkeypatch: pytest.MonkeyPatch) -> None:
+    descriptor = _reference_heavy_descriptor(formats=20, fields=20)
+
+    def duration() -> float:
+        durations = []
+        for _ in range(3):
+            start = time.process_time()
+            assert ERC7730InputToResolved().convert(descriptor, ListOutputAdder()) is not None
+            durations.append(time.process_time() - start)
+        return min(durations)
+
+    after = duration()
+    resolve_reference = references.resolve_reference
+    with monkeypatch.context() as patch:
+        patch.setattr(references, "_merge_parameters", _legacy_merge_parameters)
+        patch.setattr(
+            "erc7730.convert.resolved.convert_erc7730_input_to_resolved.resolve_reference",
+            lambda *args: resolve_reference(*args[:6]),
+        )
+        before = duration()
+
+    assert after * 2 < before
@@ -0,0 +1,43 @@
+import json
+import os
+from pathlib import Path
+
+from erc7730.common.json import dict_to_json_str
+from erc7730.common.output import ListOutputAdder
+from erc7730.format.format import format_all
+
+DESCRIPTOR = Path(__file__).parents[1] / "convert" / "resolved" / "data" / "minimal_contract_input.json"
+
+
+def _registry(tmp_path: Path) -> tuple[Path, Path]:
+    content = json.loads(DESCRIPTOR.read_text())
+    formatted = tmp_path / "calldata-formatted.json"
+    formatted.write_text(dict_to_json_str(content) + "\n")
+    os.utime(formatted, (1_000_000_000, 1_000_000_000))
+    unformatted = tmp_path / "calldata-unformatted.json"
+    unformatted.write_text(json.dumps(content))
+    return formatted, unformatted
+
+
+def test_format_skips_formatted_files(tmp_path: Path) -> None:
+    formatted, unformatted = _registry(tmp_path)
+    out = ListOutputAdder()
+    assert format_all([tmp_path], out) == 2
+    assert not out.has_errors
+    assert formatted.stat().st_mtime == 1_000_000_000
+    assert unformatted.read_text() == formatted.read_text()
+
+
+def test_format_check(tmp_path: Path) -> None:
+    formatted, unformatted = _registry(tmp_path)
+    content = unformatted.read_bytes()
+    out = ListOutputAdder()
+    assert format_all([tmp_path], out, check=True) == 2
+    assert [output.file for output in out.outputs] == [unformatted]
+    assert out.has_errors
+    assert unformatted.read_bytes() == content
+    assert formatted.stat().st_mtime == 1_000_000_000
+
+    out = ListOutputAdder()
+    format_all([formatted], out, check=True)
+    assert not out.outputs
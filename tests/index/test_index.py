@@ -0,0 +1,75 @@
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from erc7730.common.output import ListOutputAdder
+from erc7730.index.index import RegistryIndex, build_index
+from erc7730.main import app
+
+DATA = Path(__file__).parents[1] / "convert" / "resolved" / "data"
+ADDRESS = "0x0000000000000000000000000000000000000aAa"
+SELECTOR = "0x5ca8f297"  # function1(bytes4)
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def registry(tmp_path: Path) -> Path:
+    registry = tmp_path / "registry"
+    (registry / "test").mkdir(parents=True)
+    (registry / "test" / "calldata-test.json").write_text((DATA / "minimal_contract_input.json").read_text())
+    (registry / "test" / "eip712-test.json").write_text((DATA / "minimal_eip712_input.json").read_text())
+    return registry
+
+
+def test_build_index(registry: Path, tmp_path: Path) -> None:
+    out = ListOutputAdder()
+    build_index(registry, out).save(tmp_path / "index.json")
+    assert not out.has_errors
+
+    index = RegistryIndex.load(tmp_path / "index.json")
+    assert len(index.entries) == 1
+    entry = index.lookup(1, ADDRESS, "0x5CA8F297")
+    assert entry is not None
+    assert entry.descriptor == "test/calldata-test.json"
+    assert entry.format_key == "function1(bytes4)"
+    assert index.lookup(1, ADDRESS.lower(), SELECTOR) == entry
+    assert index.lookup(2, ADDRESS, SELECTOR) is None
+    assert index.lookup(1, ADDRESS, "0x00000000") is None
+
+
+def test_build_index_format_hash_changes(registry: Path) -> None:
+    (entry,) = build_index(registry, ListOutputAdder()).entries.values()
+    descriptor = registry / "test" / "calldata-test.json"
+    content = json.loads(descriptor.read_text())
+    content["display"]["formats"]["function1(bytes4)"]["fields"][0]["label"] = "Changed"
+    descriptor.write_text(json.dumps(content))
+    (changed_entry,) = build_index(registry, ListOutputAdder()).entries.values()
+    assert changed_entry.format_hash != entry.format_hash
+
+
+def test_build_index_duplicate(registry: Path) -> None:
+    content = (registry / "test" / "calldata-test.json").read_text()
+    (registry / "test" / "calldata-test-duplicate.json").write_text(content)
+    out = ListOutputAdder()
+    index = build_index(registry, out)
+    assert [output.title for output in out.outputs] == ["Duplicate index entry"]
+    (entry,) = index.entries.values()
+    assert entry.descriptor == "test/calldata-test-duplicate.json"
+
+
+def test_index_cli(registry: Path, tmp_path: Path) -> None:
+    index = tmp_path / "index.json"
+    result = runner.invoke(app, ["index", "build", "--output", str(index), str(registry)])
+    assert result.exit_code == 0, result.stdout
+    assert "no errors occurred ✅" in "".join(result.stdout.splitlines())
+
+    query = ["index", "query", "--index", str(index), "--chain-id", "1", "--address", ADDRESS]
+    result = runner.invoke(app, [*query, "--selector", SELECTOR])
+    assert result.exit_code == 0, result.stdout
+    assert json.loads(result.stdout)["descriptor"] == "test/calldata-test.json"
+
+    result = runner.invoke(app, [*query, "--selector", "0x00000000"])
+    assert result.exit_code == 1
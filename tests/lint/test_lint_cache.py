@@ -0,0 +1,147 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+from pydantic_string_url import FileUrl
+
+from erc7730.common import client
+from erc7730.common.bundle import Bundle
+from erc7730.common.output import ListOutputAdder, OutputAdder
+from erc7730.lint import lint as lint_module
+from erc7730.lint.lint import lint_all
+from erc7730.lint.lint_cache import LintCache, LintCacheEntry
+
+DESCRIPTOR = Path(__file__).parents[1] / "convert" / "resolved" / "data" / "minimal_eip712_input.json"
+
+
+@pytest.fixture
+def descriptor(tmp_path: Path) -> Path:
+    content = json.loads(DESCRIPTOR.read_text())
+    include = tmp_path / "common-test.json"
+    include.write_text(json.dumps({"metadata": content.pop("metadata")}))
+    path = tmp_path / "eip712-test.json"
+    path.write_text(json.dumps({"includes": include.name, **content}))
+    return path
+
+
+def _lint_counting_calls(paths: list[Path], cache: LintCache, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    linted: list[Path] = []
+    lint_descriptor = lint_module._lint_descriptor
+
+    def counting_lint_descriptor(path: Path, out: OutputAdder, linter: Any) -> None:
+        linted.append(path)
+        lint_descriptor(path, out, linter)
+
+    monkeypatch.setattr(lint_module, "_lint_descriptor", counting_lint_descriptor)
+    out = ListOutputAdder()
+    lint_all(paths, out, cache=cache)
+    assert not out.has_errors
+    return linted
+
+
+def test_lint_cache_hit(descriptor: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = LintCache(tmp_path / "cache")
+    assert _lint_counting_calls([descriptor], cache, monkeypatch) == [descriptor]
+    assert _lint_counting_calls([descriptor], LintCache(tmp_path / "cache"), monkeypatch) == []
+
+
+def test_lint_cache_miss_on_include_change(descriptor: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = LintCache(tmp_path / "cache")
+    assert _lint_counting_calls([descriptor], cache, monkeypatch) == [descriptor]
+    (tmp_path / "common-test.json").write_text(json.dumps({"metadata": {"owner": "test"}}))
+    assert _lint_counting_calls([descriptor], LintCache(tmp_path / "cache"), monkeypatch) == [descriptor]
+
+
+@pytest.fixture
+def cached_resource(tmp_path: Path) -> Path:
+    resource = tmp_path / "abi.json"
+    resource.write_text("[]")
+    digest = hashlib.sha256(resource.read_bytes()).hexdigest()
+    LintCache(tmp_path / "cache").put("key", LintCacheEntry(fetches={resource.as_uri(): digest}, outputs=[]))
+    resource.write_text("[{}]")
+    return resource
+
+
+def test_lint_cache_hit_without_fetching(
+    cached_resource: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def failing_get_bytes(*args: Any, **kwargs: Any) -> bytes:
+        raise AssertionError("cache hits must not fetch URLs")
+
+    monkeypatch.setattr(client, "get_bytes", failing_get_bytes)
+    assert LintCache(tmp_path / "cache").get("key") is not None
+
+
+def test_lint_cache_refresh(cached_resource: Path, tmp_path: Path) -> None:
+    assert LintCache(tmp_path / "cache", refresh=True).get("key") is None
+    cached_resource.write_text("[]")
+    assert LintCache(tmp_path / "cache", refresh=True).get("key") is not None
+
+
+def test_lint_cache_offline_bundle(cached_resource: Path, tmp_path: Path) -> None:
+    bundle = Bundle(tmp_path / "bundle")
+    assert LintCache(tmp_path / "cache", bundle=bundle).get("key") is None
+    bundle.add(cached_resource.as_uri(), b"[]")
+    assert LintCache(tmp_path / "cache", bundle=bundle).get("key") is not None
+    bundle.add(cached_resource.as_uri(), cached_resource.read_bytes())
+    assert LintCache(tmp_path / "cache", bundle=bundle).get("key") is None
+
+
+def test_lint_cache_key_unreadable_descriptor(tmp_path: Path) -> None:
+    path = tmp_path / "eip712-test.json"
+    path.write_text("{")
+    assert LintCache(tmp_path / "cache").key(path) is None
+
+
+def test_record_fetches(descriptor: Path) -> None:
+    url = FileUrl(descriptor.as_uri())
+    with client.record_fetches() as fetches:
+        content = client.get_bytes(url)
+    assert content == descriptor.read_bytes()
+    assert len(fetches) == 1
+    for recorded_url, digest in fetches.items():
+        assert digest is not None
+        assert client.get_digest(recorded_url) == digest
+
+
+def test_lint_cache_skips_failed_fetches(descriptor: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    resource = tmp_path / "abi.json"
+    linted: list[Path] = []
+    lint_descriptor = lint_module._lint_descriptor
+
+    def fetching_lint_descriptor(path: Path, out: OutputAdder, linter: Any) -> None:
+        linted.append(path)
+        try:
+            client.get_bytes(FileUrl(resource.as_uri()))
+        except Exception as e:
+            out.warning(title="Could not fetch ABI", message=str(e))
+        lint_descriptor(path, out, linter)
+
+    monkeypatch.setattr(lint_module, "_lint_descriptor", fetching_lint_descriptor)
+
+    out = ListOutputAdder()
+    lint_all([descriptor], out, cache=LintCache(tmp_path / "cache"))
+    assert linted == [descriptor]
+    assert out.has_warnings
+
+    resource.write_text("[]")
+    out = ListOutputAdder()
+    lint_all([descriptor], out, cache=LintCache(tmp_path / "cache"))
+    assert linted == [descriptor, descriptor]
+    assert not out.has_warnings
+
+    lint_all([descriptor], ListOutputAdder(), cache=LintCache(tmp_path / "cache"))
+    assert linted == [descriptor, descriptor]
+
+
+def test_lint_cache_skips_exceptions(descriptor: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    def failing_lint_descriptor(path: Path, out: OutputAdder, linter: Any) -> None:
+        raise Exception("unexpected failure")
+
+    monkeypatch.setattr(lint_module, "_lint_descriptor", failing_lint_descriptor)
+    out = ListOutputAdder()
+    lint_all([descriptor], out, cache=LintCache(tmp_path / "cache"))
+    assert out.has_errors
+    assert not list((tmp_path / "cache").glob("*.json"))
@@ -0,0 +1,94 @@
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from weakref import WeakValueDictionary
+
+import pytest
+
+from erc7730.common import client
+from erc7730.lint import reference_abis as reference_abis_module
+from erc7730.lint.lint_validate_abi import ValidateABILinter
+from erc7730.lint.reference_abis import ReferenceABIs
+from erc7730.model.abi import ABI, Function, InputOutput
+from erc7730.model.types import Address
+
+ADDRESS_1: Address = "0x0000000000000000000000000000000000000001"
+ADDRESS_2: Address = "0x0000000000000000000000000000000000000002"
+ABIS: list[ABI] = [Function(name="transfer", inputs=[InputOutput(name="to", type="address")])]
+
+
+@pytest.fixture
+def fetched(monkeypatch: pytest.MonkeyPatch) -> list[tuple[int, Address]]:
+    fetched: list[tuple[int, Address]] = []
+    lock = threading.Lock()
+
+    def get_contract_abis(chain_id: int, contract_address: Address) -> list[ABI]:
+        with lock:
+            fetched.append((chain_id, contract_address))
+        time.sleep(0.05)
+        client.replay_fetches({f"https://example.org/{chain_id}/{contract_address}": "digest"})
+        if contract_address == ADDRESS_2:
+            raise Exception("contract not found")
+        return ABIS
+
+    monkeypatch.setattr(client, "get_contract_abis", get_contract_abis)
+    return fetched
+
+
+def test_fetched_once(fetched: list[tuple[int, Address]]) -> None:
+    reference_abis = ReferenceABIs(max_concurrency=2)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: reference_abis.get(1, ADDRESS_1), range(16)))
+    assert fetched == [(1, ADDRESS_1)]
+    assert all(result is results[0] for result in results)
+    assert results[0] is not None
+    assert list(results[0].functions) == ["0x1a695230"]
+
+
+def test_prefetch_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    # all fetches must be in flight at the same time for the barrier to be passed
+    barrier = threading.Barrier(4, timeout=10)
+
+    def get_contract_abis(chain_id: int, contract_address: Address) -> list[ABI]:
+        barrier.wait()
+        return ABIS
+
+    monkeypatch.setattr(client, "get_contract_abis", get_contract_abis)
+    reference_abis = ReferenceABIs(max_concurrency=4)
+    deployments = [(chain_id, ADDRESS_1) for chain_id in range(1, 5)]
+    reference_abis.prefetch(deployments)
+    for chain_id, address in deployments:
+        assert reference_abis.get(chain_id, address) is not None
+
+
+def test_error_and_fetches_replayed(fetched: list[tuple[int, Address]]) -> None:
+    reference_abis = ReferenceABIs()
+    for _ in range(2):
+        with client.record_fetches() as fetches, pytest.raises(Exception, match="contract not found"):
+            reference_abis.get(1, ADDRESS_2)
+        assert fetches == {f"https://example.org/1/{ADDRESS_2}": "digest"}
+    assert fetched == [(1, ADDRESS_2)]
+
+
+def test_pickle(fetched: list[tuple[int, Address]]) -> None:
+    reference_abis = ReferenceABIs(max_concurrency=3)
+    reference_abis.get(1, ADDRESS_1)
+    assert pickle.loads(pickle.dumps(reference_abis)) is reference_abis
+
+
+def test_pickle_shared_across_chunks(fetched: list[tuple[int, Address]], monkeypatch: pytest.MonkeyPatch) -> None:
+    reference_abis = ReferenceABIs(max_concurrency=3)
+    # linter is pickled again with each chunk of files sent to worker processes
+    chunks = [pickle.dumps(ValidateABILinter(reference_abis)) for _ in range(3)]
+
+    # unpickle chunks as in a worker process, where the original instance does not exist
+    monkeypatch.setattr(reference_abis_module, "_INSTANCES", WeakValueDictionary())
+    monkeypatch.setattr(reference_abis_module, "_UNPICKLED_INSTANCES", {})
+    unpickled = [pickle.loads(chunk).reference_abis for chunk in chunks]
+    for worker_reference_abis in unpickled:
+        assert worker_reference_abis is not reference_abis
+        assert worker_reference_abis is unpickled[0]
+        assert worker_reference_abis.max_concurrency == 3
+        assert worker_reference_abis.get(1, ADDRESS_1) is not None
+    assert fetched == [(1, ADDRESS_1)]
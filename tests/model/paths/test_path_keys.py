@@ -0,0 +1,97 @@
+import time
+
+import pytest
+
+from erc7730.model.abi import Component, Function, InputOutput
+from erc7730.model.paths import DataPath, DescriptorPath
+from erc7730.model.paths.path_keys import ARRAY, ROOT_DATA_PATH_KEY, DataPathKey, DescriptorPathKey
+from erc7730.model.paths.path_ops import data_path_starts_with
+from erc7730.model.paths.path_parser import to_path
+from erc7730.model.paths.path_schemas import (
+    compute_abi_schema_path_keys,
+    compute_abi_schema_paths,
+    data_path_to_schema_path,
+)
+
+
+def _data_path(path: str) -> DataPath:
+    result = to_path(path)
+    assert isinstance(result, DataPath)
+    return result
+
+
+@pytest.mark.parametrize("path", ["#.a.[].[-1].[1:].[:-2].[:]", "a.b.[3]", "#.amount", "[]"])
+def test_data_path_key_round_trip(path: str) -> None:
+    model = _data_path(path)
+    key = DataPathKey.of(model)
+    assert str(key) == str(model) == path
+    assert key.to_model() == model
+    assert key.to_model().model_dump() == model.model_dump()
+    assert key.to_model() is key.to_model()
+    assert key == DataPathKey.of(_data_path(path))
+    assert hash(key) == hash(DataPathKey.of(_data_path(path)))
+
+
+@pytest.mark.parametrize("path", ["$.metadata.constants.foo", "$.display.formats.[2].fields.[-1]"])
+def test_descriptor_path_key_round_trip(path: str) -> None:
+    model = to_path(path)
+    assert isinstance(model, DescriptorPath)
+    key = DescriptorPathKey.of(model)
+    assert str(key) == str(model) == path
+    assert key.to_model() == model
+    assert key == DescriptorPathKey.of(model) and hash(key) == hash(DescriptorPathKey.of(model))
+
+
+def test_data_path_key_operations() -> None:
+    key = DataPathKey.of(_data_path("a.[0]"))
+    assert not key.absolute
+    assert key.to_absolute() == DataPathKey.of(_data_path("#.a.[0]"))
+    assert ROOT_DATA_PATH_KEY.concat(key) == key.to_absolute()
+    assert key.concat(DataPathKey.of(_data_path("b"))) == DataPathKey.of(_data_path("a.[0].b"))
+    assert key.concat(DataPathKey.of(_data_path("#.b"))) == DataPathKey.of(_data_path("#.b"))
+    assert key.append(ARRAY) == DataPathKey.of(_data_path("a.[0].[]"))
+    assert key.append("b").ends_with("b")
+    assert not ROOT_DATA_PATH_KEY.ends_with("b")
+
+
+@pytest.mark.parametrize(
+    "path,prefix",
+    [("#.a.b", "#.a"), ("#.a.b", "#.a.b"), ("#.a.b", "#.b"), ("#.a", "#.a.b"), ("#.a.b", "a"), ("a.[0]", "a.[]")],
+)
+def test_data_path_key_starts_with(path: str, prefix: str) -> None:
+    expected = data_path_starts_with(_data_path(path), _data_path(prefix))
+    assert DataPathKey.of(_data_path(path)).starts_with(DataPathKey.of(_data_path(prefix))) == expected
+
+
+@pytest.mark.parametrize("path", ["#.foo.[].[-2].bar.[1:5]", "foo.[0].[:3]", "#.foo"])
+def test_data_path_key_to_schema(path: str) -> None:
+    key = DataPathKey.of(_data_path(path)).to_schema()
+    assert key.to_model() == data_path_to_schema_path(_data_path(path))
+    assert ARRAY in key.elements or "[" not in path
+
+
+def _abi(parameters: int) -> Function:
+    components = [Component(name=f"field{j}", type="bytes") for j in range(parameters)]
+    return Function(
+        name="f",
+        inputs=[InputOutput(name=f"p{i}", type="tuple[]", components=components) for i in range(parameters)],
+    )
+
+
+def test_schema_path_keys_equal_schema_paths() -> None:
+    abi = _abi(3)
+    assert {key.to_model() for key in compute_abi_schema_path_keys(abi)} == compute_abi_schema_paths(abi)
+
+
+@pytest.mark.benchmark
+def test_schema_path_keys_throughput() -> None:
+    abi = _abi(20)
+
+    start = time.process_time()
+    assert not compute_abi_schema_paths(abi) - compute_abi_schema_paths(abi)
+    before = time.process_time() - start
+    start = time.process_time()
+    assert not compute_abi_schema_path_keys(abi) - compute_abi_schema_path_keys(abi)
+    after = max(time.process_time() - start, 1e-9)
+
+    assert after * 5 < before
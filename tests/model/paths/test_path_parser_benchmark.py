@@ -0,0 +1,41 @@
+import time
+from collections.abc import Callable
+
+import pytest
+from lark import Lark
+
+from erc7730.model.paths.path_parser import PATH_GRAMMAR, PATH_TRANSFORMER, to_path
+
+PATHS = [f"#.params.[].[-2].[1:5].[:5].amountIn{i}" for i in range(500)]
+"""Distinct paths, so that uncached throughput is measured."""
+
+
+def _throughput(parse: Callable[[str], object]) -> float:
+    start = time.process_time()
+    for path in PATHS:
+        parse(path)
+    return len(PATHS) / max(time.process_time() - start, 1e-9)
+
+
+@pytest.mark.benchmark
+def test_path_parser_throughput() -> None:
+    earley = Lark(grammar=PATH_GRAMMAR, start="path")
+    to_path.cache_clear()
+
+    before = _throughput(lambda path: PATH_TRANSFORMER.transform(earley.parse(path)))
+    uncached = _throughput(to_path)
+    cached = _throughput(to_path)
+
+    # measured ~15x (uncached) and ~1000x (cached)
+    assert uncached > 3 * before
+    assert cached > 10 * uncached
+
+
+def test_path_parser_results_equal_earley() -> None:
+    earley = Lark(grammar=PATH_GRAMMAR, start="path")
+    for path in ["@.to", "$.display.formats.[0]", "#.a.[].[-1].[1:].[:-2].[:]", "from", "[]"]:
+        assert to_path.__wrapped__(path) == PATH_TRANSFORMER.transform(earley.parse(path))
+
+
+def test_path_parser_cached() -> None:
+    assert to_path("#.a.[0]") is to_path("#.a.[0]")
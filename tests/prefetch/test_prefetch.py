@@ -0,0 +1,112 @@
+import json
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from httpx import URL
+
+from erc7730.common import client
+from erc7730.common.bundle import Bundle
+from erc7730.common.output import ListOutputAdder
+from erc7730.lint.lint import lint_all
+from erc7730.prefetch.prefetch import prefetch_all
+
+DESCRIPTOR = Path(__file__).parents[1] / "convert" / "resolved" / "data" / "minimal_contract_input.json"
+ADDRESS = "0x0000000000000000000000000000000000000aaa"
+ABI_URL = "https://example.org/abi.json"
+CHAINLIST_URL = f"https://{client.ETHERSCAN}/v2/chainlist"
+SOURCIFY_URL = str(
+    URL(f"https://{client.SOURCIFY}/server/v2/contract/1/{ADDRESS}", params={"fields": client.SOURCIFY_PROXY_FIELDS})
+)
+
+
+@pytest.fixture
+def descriptor(tmp_path: Path) -> Path:
+    content = json.loads(DESCRIPTOR.read_text())
+    content["context"]["contract"]["abi"] = ABI_URL
+    path = tmp_path / "calldata-test.json"
+    path.write_text(json.dumps(content))
+    return path
+
+
+@pytest.fixture
+def remote(tmp_path: Path) -> Generator[Bundle, None, None]:
+    """Simulated remote resources, served as an offline bundle."""
+    abi = json.loads(DESCRIPTOR.read_text())["context"]["contract"]["abi"]
+    bundle = Bundle(tmp_path / "remote")
+    bundle.add(ABI_URL, json.dumps(abi).encode())
+    bundle.add(SOURCIFY_URL, json.dumps({"abi": abi}).encode())
+    bundle.add(CHAINLIST_URL, b'[{"chainname": "Ethereum", "chainid": 1, "blockexplorer": "https://etherscan.io"}]')
+    bundle.save()
+    _configure(bundle.path)
+    yield bundle
+    _configure(None)
+
+
+def _configure(offline_bundle: Path | None) -> None:
+    client.configure(client.ClientSettings(offline_bundle=offline_bundle))
+    client.clear_memoized()
+
+
+def test_prefetch_then_lint_offline(descriptor: Path, remote: Bundle, tmp_path: Path) -> None:
+    bundle = Bundle(tmp_path / "bundle")
+    out = ListOutputAdder()
+    assert prefetch_all([descriptor], bundle, out) == 3
+    assert not out.outputs
+    assert Bundle(bundle.path).urls == remote.urls
+
+    _configure(bundle.path)
+    out = ListOutputAdder()
+    lint_all([descriptor], out)
+    assert not out.outputs
+
+
+def test_prefetch_fetches_urls_once(
+    descriptor: Path, remote: Bundle, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls: list[str] = []
+    get_bytes = client.get_bytes
+
+    def counting_get_bytes(url: Any, **params: Any) -> bytes:
+        calls.append(str(URL(str(url), params=params)))
+        return get_bytes(url, **params)
+
+    monkeypatch.setattr(client, "get_bytes", counting_get_bytes)
+    bundle = Bundle(tmp_path / "bundle")
+    out = ListOutputAdder()
+    assert prefetch_all([descriptor], bundle, out) == 3
+    assert not out.outputs
+    assert sorted(calls) == sorted(remote.urls)
+    assert Bundle(bundle.path).urls == remote.urls
+
+
+def test_prefetch_records_failures(descriptor: Path, remote: Bundle, tmp_path: Path) -> None:
+    content = json.loads(descriptor.read_text())
+    content["context"]["contract"]["deployments"][0]["chainId"] = 10
+    descriptor.write_text(json.dumps(content))
+    remote.add(str(URL(SOURCIFY_URL.replace("/1/", "/10/"))), None)
+    remote.save()
+    _configure(remote.path)
+
+    bundle = Bundle(tmp_path / "bundle")
+    out = ListOutputAdder()
+    prefetch_all([descriptor], bundle, out)
+    assert [output.title for output in out.outputs] == ["Failed to prefetch URL"]
+
+    _configure(bundle.path)
+    out = ListOutputAdder()
+    lint_all([descriptor], out)
+    assert [output.title for output in out.outputs] == ["Could not fetch ABI"]
+    assert "contract not found on Sourcify for chain 10" in out.outputs[0].message
+
+
+def test_offline_missing_url(descriptor: Path, tmp_path: Path) -> None:
+    _configure(tmp_path / "empty")
+    try:
+        out = ListOutputAdder()
+        lint_all([descriptor], out)
+        assert out.has_errors
+        assert "is not available in offline bundle" in out.outputs[0].message
+    finally:
+        _configure(None)
@@ -0,0 +1,151 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import eth_abi
+import pytest
+from eth_utils import function_signature_to_4byte_selector
+
+from erc7730.common.output import ListOutputAdder
+from erc7730.convert.resolved.convert_erc7730_input_to_resolved import ERC7730InputToResolved
+from erc7730.model.input.descriptor import InputERC7730Descriptor
+from erc7730.model.metadata import TokenInfo
+from erc7730.model.resolved.descriptor import ResolvedERC7730Descriptor
+from erc7730.render import render as render_module
+from erc7730.render.render import Renderer
+
+DESCRIPTOR = Path(__file__).parents[1] / "convert" / "resolved" / "data" / "minimal_contract_input.json"
+SIGNATURE = "swap(address,uint256,uint256,uint256,uint8,uint256,address,uint256[])"
+TYPES = ["address", "uint256", "uint256", "uint256", "uint8", "uint256", "address", "uint256[]"]
+CONTRACT = "0x0000000000000000000000000000000000000aAa"
+USDC = "0x" + "cc" * 20
+RECIPIENT = "0x" + "ab" * 20
+
+
+@pytest.fixture
+def descriptor() -> ResolvedERC7730Descriptor:
+    content = json.loads(DESCRIPTOR.read_text())
+    content["context"]["contract"]["deployments"].append({"chainId": 10, "address": CONTRACT})
+    content["context"]["contract"]["abi"] = [
+        {
+            "type": "function",
+            "name": "swap",
+            "inputs": [
+                {"name": name, "type": type}
+                for name, type in zip(
+                    ["token", "amount", "deadline", "duration", "mode", "fee", "recipient", "amounts"],
+                    TYPES,
+                    strict=True,
+                )
+            ],
+            "outputs": [],
+        }
+    ]
+    content["metadata"] = {
+        "owner": "Test",
+        "token": {"name": "Test Token", "ticker": "TST", "decimals": 6},
+        "enums": {"mode": {"0": "exact in", "1": "exact out"}},
+    }
+    content["display"]["formats"] = {
+        SIGNATURE: {
+            "intent": "Swap",
+            "fields": [
+                {
+                    "path": "amount",
+                    "label": "Amount",
+                    "format": "tokenAmount",
+                    "params": {"tokenPath": "token", "threshold": "0x" + "ff" * 32, "message": "All"},
+                },
+                {"path": "deadline", "label": "Deadline", "format": "date", "params": {"encoding": "timestamp"}},
+                {"path": "duration", "label": "Duration", "format": "duration"},
+                {"path": "mode", "label": "Mode", "format": "enum", "params": {"$ref": "$.metadata.enums.mode"}},
+                {"path": "fee", "label": "Fee", "format": "unit", "params": {"base": "%", "decimals": 2}},
+                {"path": "recipient", "label": "Recipient", "format": "addressName", "params": {"types": ["eoa"]}},
+                {"path": "amounts.[]", "label": "Amounts", "format": "tokenAmount"},
+                {"path": "@.value", "label": "Value", "format": "amount"},
+            ],
+        }
+    }
+    out = ListOutputAdder()
+    resolved = ERC7730InputToResolved().convert(InputERC7730Descriptor.model_validate(content, strict=False), out)
+    assert not out.has_errors
+    assert resolved is not None
+    return resolved
+
+
+def _tokens(chain_id: int, address: str) -> TokenInfo | None:
+    return TokenInfo(name="USD Coin", ticker="USDC", decimals=6) if address == USDC else None
+
+
+def _calldata(token: str = USDC, amount: int = 1234567) -> bytes:
+    args = [token, amount, 1700000000, 3725, 1, 150, RECIPIENT, [1000000, 2500000]]
+    return function_signature_to_4byte_selector(SIGNATURE) + eth_abi.encode(TYPES, args)
+
+
+def _rendered(renderer: Renderer, calldata: bytes | str, chain_id: int = 1) -> list[tuple[str, str]]:
+    rendered = renderer.render(chain_id, CONTRACT, calldata, value=10**17)
+    assert rendered is not None
+    assert rendered.intent == "Swap"
+    return [(field.label, field.value) for field in rendered.fields]
+
+
+def test_render(descriptor: ResolvedERC7730Descriptor) -> None:
+    renderer = Renderer([descriptor], tokens=_tokens)
+    assert _rendered(renderer, _calldata()) == [
+        ("Amount", "1.234567 USDC"),
+        ("Deadline", "2023-11-14 22:13:20 UTC"),
+        ("Duration", "01:02:05"),
+        ("Mode", "exact out"),
+        ("Fee", "1.5%"),
+        ("Recipient", "0xABaBaBaBABabABabAbAbABAbABabababaBaBABaB"),
+        ("Amounts", "1 TST"),
+        ("Amounts", "2.5 TST"),
+        ("Value", "0.1 ETH"),
+    ]
+    assert _rendered(renderer, "0x" + _calldata().hex()) == _rendered(renderer, _calldata())
+
+
+def test_render_lookups(descriptor: ResolvedERC7730Descriptor) -> None:
+    renderer = Renderer(
+        [descriptor],
+        names=lambda chain_id, address: "alice.eth" if address == RECIPIENT else None,
+        native_currencies={10: TokenInfo(name="Optimism Ether", ticker="OETH", decimals=18)},
+    )
+    rendered = dict(_rendered(renderer, _calldata(amount=2**256 - 1), chain_id=10))
+    assert rendered["Amount"] == f"{2**256 - 1} (unknown token 0xCcCCccccCCCCcCCCCCCcCcCccCcCCCcCcccccccC)"
+    assert rendered["Recipient"] == "alice.eth"
+    assert rendered["Value"] == "0.1 OETH"
+
+    renderer = Renderer([descriptor], tokens=_tokens)
+    assert dict(_rendered(renderer, _calldata(amount=2**256 - 1)))["Amount"] == "All USDC"
+
+
+def test_render_unknown_transaction(descriptor: ResolvedERC7730Descriptor) -> None:
+    renderer = Renderer([descriptor])
+    assert renderer.render(1, "0x" + "00" * 20, _calldata()) is None
+    assert renderer.render(2, CONTRACT, _calldata()) is None
+    assert renderer.render(1, CONTRACT, "0x12345678") is None
+
+
+def test_render_invalid_calldata(descriptor: ResolvedERC7730Descriptor) -> None:
+    with pytest.raises(ValueError, match="Failed decoding calldata"):
+        Renderer([descriptor]).render(1, CONTRACT, _calldata()[:100])
+
+
+def test_render_plan_compiled_once(descriptor: ResolvedERC7730Descriptor, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = 0
+    compile_render_plan = render_module.compile_render_plan
+
+    def counting_compile_render_plan(*args: Any) -> Any:
+        nonlocal calls
+        calls += 1
+        return compile_render_plan(*args)
+
+    monkeypatch.setattr(render_module, "compile_render_plan", counting_compile_render_plan)
+    renderer = Renderer([descriptor, descriptor.model_copy()], tokens=_tokens)
+    for chain_id in (1, 10, 1, 10):
+        _rendered(renderer, _calldata(), chain_id=chain_id)
+    assert calls == 1
+    assert renderer.plan(1, CONTRACT, "0x" + _calldata()[:4].hex()) is renderer.plan(
+        10, CONTRACT.lower(), "0x" + _calldata()[:4].hex()
+    )
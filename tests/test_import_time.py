@@ -0,0 +1,53 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_TIME_BUDGET_SECONDS = 0.5
+"""Maximum CPU time to import the CLI entrypoint (measured ~0.1s, ~0.7s when all subcommands are imported eagerly)."""
+
+IMPORT_TIME_BENCHMARK_SECONDS = 0.15
+"""Maximum CPU time to import the CLI entrypoint, on a quiet machine."""
+
+HEAVY_MODULES = [
+    "eip712",
+    "erc7730.convert",
+    "erc7730.generate",
+    "erc7730.index",
+    "erc7730.lint",
+    "erc7730.render",
+    "httpx",
+    "lark",
+    "openai",
+]
+"""Modules that must only be imported by the subcommands that use them."""
+
+
+def _import_main() -> tuple[float, list[str]]:
+    script = (
+        "import json, sys, time\n"
+        "start = time.process_time()\n"
+        "import erc7730.main\n"
+        "print(json.dumps([time.process_time() - start, sorted(sys.modules)]))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, check=True, text=True)
+    duration, modules = json.loads(result.stdout)
+    return duration, modules
+
+
+def test_import_main_does_not_load_subcommands() -> None:
+    _, modules = _import_main()
+    for heavy_module in HEAVY_MODULES:
+        assert not [module for module in modules if module == heavy_module or module.startswith(f"{heavy_module}.")]
+
+
+def test_import_main_time_budget() -> None:
+    duration = min(_import_main()[0] for _ in range(3))
+    assert duration < IMPORT_TIME_BUDGET_SECONDS, f"importing erc7730.main took {duration:.3f}s"
+
+
+@pytest.mark.benchmark
+def test_import_main_time() -> None:
+    duration = min(_import_main()[0] for _ in range(10))
+    assert duration < IMPORT_TIME_BENCHMARK_SECONDS, f"importing erc7730.main took {duration:.3f}s"
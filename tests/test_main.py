@@ -1,6 +1,6 @@
 import json
 from pathlib import Path
-from shutil import copytree
+from shutil import copyfile, copytree
 
 import pytest
 from typer.testing import CliRunner
@@ -52,6 +52,15 @@ def test_format(tmp_path: Path) -> None:
     assert "no errors occurred ✅" in out
 
 
+def test_format_jobs(tmp_path: Path) -> None:
+    copytree(ERC7730_REGISTRY_ROOT, tmp_path / "registry")
+    result = runner.invoke(app, ["format", "--jobs=2", str(tmp_path)])
+    out = "".join(result.stdout.splitlines())
+    assert "calldata-" in out
+    assert "eip712-" in out
+    assert "no errors occurred ✅" in out
+
+
 @pytest.mark.parametrize("input_file", ERC7730_DESCRIPTORS, ids=path_id)
 def test_lint_registry_files(input_file: Path) -> None:
     result = runner.invoke(app, ["lint", str(input_file)])
@@ -66,6 +75,33 @@ def test_lint_registry_files(input_file: Path) -> None:
     )
 
 
+def _lint_blocks(output: str) -> list[str]:
+    return [f"➡️ checking{block}" for block in output.split("➡️ checking")[1:]]
+
+
+def test_lint_jobs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    data = Path(__file__).parent / "convert" / "resolved" / "data"
+    for name in ["definition_format_amount", "definition_invalid_data_path", "definition_format_unit"]:
+        copyfile(data / f"{name}_input.json", tmp_path / f"calldata-{name}.json")
+    for name in ["minimal_eip712", "definition_format_enum"]:
+        copyfile(data / f"{name}_input.json", tmp_path / f"eip712-{name}.json")
+    (tmp_path / "eip712-invalid.json").write_text("{")
+
+    serial = runner.invoke(app, ["lint", str(tmp_path)])
+    parallel = [runner.invoke(app, ["lint", "--cache", "--jobs=2", str(tmp_path)]) for _ in range(2)]
+
+    # serial linting prints files in completion order, parallel linting in files order
+    blocks = _lint_blocks(parallel[0].stdout)
+    assert len(blocks) == 6
+    assert blocks == sorted(_lint_blocks(serial.stdout))
+    assert "some errors found ❌" in parallel[0].stdout
+    for result in parallel:
+        assert result.exit_code == serial.exit_code == 1
+        assert result.stdout == parallel[0].stdout
+    assert (tmp_path / "cache" / "erc7730" / "lint").is_dir()
+
+
 @pytest.mark.parametrize("input_file", ERC7730_DESCRIPTORS, ids=path_id)
 def test_resolve_registry_files(input_file: Path) -> None:
     result = runner.invoke(app, ["resolve", str(input_file)])